@@ -8,10 +8,10 @@ Test endpoints for extraction, enrichment, formatting, and Gmail monitoring
 from fastapi import APIRouter, HTTPException, UploadFile, File, Query
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
-import os
-import tempfile
 import logging
 
+from core.concurrency import OverloadedError, ingestion_executor
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -31,6 +31,31 @@ class CandidateJSON(BaseModel):
     metadata: Dict[str, Any]
 
 
+def _overloaded(e: OverloadedError) -> HTTPException:
+    """429 response telling the client to back off and retry"""
+    return HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """
+    Read an upload into memory, refusing to hold more than MAX_RESUME_MB
+    
+    This bounds the bytes this handler keeps and hands to extraction, not
+    the request itself: Starlette has already received the whole body
+    (spooled to a temp file above 1 MB) before the handler runs.
+    
+    Raises:
+        HTTPException: 413 if the upload is over the limit
+    """
+    from modules.resume.extractor import max_resume_bytes
+    
+    limit = max_resume_bytes()
+    content = await file.read(limit + 1 if limit else -1)
+    if limit and len(content) > limit:
+        raise HTTPException(status_code=413, detail=f"Resume larger than {limit} bytes")
+    return content
+
+
 class ProcessResumeResponse(BaseModel):
     """Response from processing a resume"""
     success: bool
@@ -53,21 +78,16 @@ async def extract_resume(file: UploadFile = File(...)):
     Returns:
         Extracted candidate JSON
     """
-    from modules.resume.extractor import ResumeExtractor
+    from modules.resume.extractor import ResumeTooLargeError, extract_resume_bytes
     
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        content = await _read_upload(file)
         
-        # Extract
-        extractor = ResumeExtractor()
-        candidate_json = extractor.extract_from_file(tmp_path)
-        
-        # Cleanup
-        os.unlink(tmp_path)
+        # Extract in the process pool (PDF parsing is CPU-bound)
+        async with ingestion_executor.slot():
+            candidate_json = await ingestion_executor.run_in_process(
+                extract_resume_bytes, content, file.filename
+            )
         
         return {
             "success": True,
@@ -75,6 +95,12 @@ async def extract_resume(file: UploadFile = File(...)):
             "message": f"Extracted data from {file.filename}"
         }
         
+    except HTTPException:
+        raise
+    except OverloadedError as e:
+        raise _overloaded(e)
+    except ResumeTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Extraction error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -96,8 +122,10 @@ async def enrich_candidate(candidate_json: Dict[str, Any]):
     from modules.resume.enricher import ResumeEnricher
     
     try:
-        enricher = ResumeEnricher()
-        enriched = enricher.enrich_candidate(candidate_json)
+        # Gemini call blocks; run it in the thread pool
+        async with ingestion_executor.slot():
+            enricher = ResumeEnricher()
+            enriched = await ingestion_executor.run_in_thread(enricher.enrich_candidate, candidate_json)
         
         return {
             "success": True,
@@ -106,6 +134,8 @@ async def enrich_candidate(candidate_json: Dict[str, Any]):
             "message": "Enrichment complete"
         }
         
+    except OverloadedError as e:
+        raise _overloaded(e)
     except Exception as e:
         logger.error(f"Enrichment error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -155,21 +185,21 @@ async def process_complete_pipeline(file: UploadFile = File(...)):
     Returns:
         Finalized candidate JSON
     """
+    from modules.resume.extractor import ResumeTooLargeError, extract_resume_bytes
     from modules.resume.gmail_monitor import GmailMonitor
     
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-        
-        # Run complete pipeline
-        monitor = GmailMonitor()
-        candidate_json = monitor.process_resume_file(tmp_path)
+        content = await _read_upload(file)
         
-        # Cleanup
-        os.unlink(tmp_path)
+        async with ingestion_executor.slot():
+            # Extract in the process pool, then enrich and format in a thread
+            extracted = await ingestion_executor.run_in_process(
+                extract_resume_bytes, content, file.filename
+            )
+            monitor = await ingestion_executor.run_in_thread(GmailMonitor)
+            candidate_json = await ingestion_executor.run_in_thread(
+                monitor.process_resume_file, file.filename, extracted
+            )
         
         return ProcessResumeResponse(
             success=True,
@@ -177,6 +207,12 @@ async def process_complete_pipeline(file: UploadFile = File(...)):
             message=f"Complete pipeline executed for {file.filename}"
         )
         
+    except HTTPException:
+        raise
+    except OverloadedError as e:
+        raise _overloaded(e)
+    except ResumeTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Pipeline error: {e}")
         return ProcessResumeResponse(
@@ -202,11 +238,18 @@ async def check_gmail_for_resumes(
     Returns:
         List of processed candidates
     """
-    from modules.resume.gmail_monitor import GmailMonitor
+    from functools import partial
+    from modules.resume.gmail_push import gmail_sync_dispatcher, sync_user_mailbox
     
     try:
-        monitor = GmailMonitor()
-        candidates = monitor.process_new_emails(user_id, use_mock=use_mock)
+        # Through the sync dispatcher, like polling and push: off the event
+        # loop and never overlapping another sync of this mailbox
+        results = await gmail_sync_dispatcher.sync_users(
+            [user_id], sync=partial(sync_user_mailbox, use_mock=use_mock)
+        )
+        candidates = results[user_id]
+        if isinstance(candidates, BaseException):
+            raise candidates
         
         return {
             "success": True,
@@ -221,25 +264,45 @@ async def check_gmail_for_resumes(
 
 
 @router.get("/candidates")
-async def get_processed_candidates():
+async def get_processed_candidates(
+    user_id: Optional[str] = Query(None, description="Only this user's candidates (default: all users)"),
+    status: Optional[str] = Query(None, description="Only candidates with this status"),
+    email: Optional[str] = Query(None, description="Only candidates with this email"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. name,email,skills")
+):
     """
-    Get all candidates processed by Person 2's pipeline
+    Get candidates processed by Person 2's pipeline, newest first
+    
+    Pages are read from the candidate repository with keyset pagination:
+    pass the returned next_cursor to get the following page.
     
     Returns:
-        List of candidate JSONs from storage
+        One page of candidate JSONs, the total matching and next_cursor
+        (null on the last page)
     """
-    from modules.resume.gmail_monitor import GmailMonitor
+    from modules.resume.candidate_store import get_candidate_repository
     
     try:
-        monitor = GmailMonitor()
-        candidates = monitor.get_processed_candidates()
+        field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        
+        def read_page():
+            repository = get_candidate_repository()
+            page = repository.list(user_id, status, email, limit, cursor, field_list)
+            return page, repository.count(user_id, status, email)
+        
+        (candidates, next_cursor), total = await ingestion_executor.run_in_thread(read_page)
         
         return {
             "success": True,
-            "total": len(candidates),
-            "candidates": candidates
+            "total": total,
+            "candidates": candidates,
+            "next_cursor": next_cursor
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching candidates: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -7,6 +7,7 @@ Health check and system status endpoints
 from fastapi import APIRouter
 from datetime import datetime
 from core.config import settings
+from modules.integrations.composio_client import composio_registry
 
 router = APIRouter()
 
@@ -43,7 +44,7 @@ async def readiness_check():
     checks = {
         "database": "not_checked",
         "openai_api": "not_checked",
-        "composio_api": "not_checked"
+        "composio_api": composio_registry.health()['status']
     }
     
     return {
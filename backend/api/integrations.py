@@ -8,9 +8,13 @@ Contributors: Person 4 (Gmail Integration)
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
-from composio import Composio
+from modules.integrations.composio_client import composio_registry
+from modules.integrations.connection_status import connection_status_cache
 from core.config import settings
-from modules.resume.gmail_monitor import GmailMonitor
+from modules.resume.gmail_push import decode_push_notification, gmail_sync_dispatcher, sync_user_mailbox
+from functools import partial
+import asyncio
+import hmac
 import logging
 
 logger = logging.getLogger(__name__)
@@ -64,11 +68,52 @@ class ProcessResumesResponse(BaseModel):
 # Gmail Integration Endpoints
 # ============================================================================
 
+def _probe_gmail(user_id: str) -> Dict[str, Any]:
+    """Ask Composio whether Gmail works for a user (blocking, uncached)"""
+    try:
+        composio = composio_registry.get()
+        
+        # Try to fetch emails - if this works, Gmail is connected
+        result = composio.tools.execute(
+            slug="GMAIL_FETCH_EMAILS",
+            arguments={"max_results": 1},
+            user_id=user_id,
+            dangerously_skip_version_check=True
+        )
+        
+        if result.get('successful'):
+            return {
+                'connected': True,
+                'service': 'gmail',
+                'entity_id': user_id,
+                'message': "Gmail is connected and working"
+            }
+        return {
+            'connected': False,
+            'service': 'gmail',
+            'entity_id': user_id,
+            'message': "Gmail connection failed"
+        }
+        
+    except Exception as e:
+        logger.error(f"Error checking Gmail status for {user_id}: {e}")
+        return {
+            'connected': False,
+            'service': 'gmail',
+            'entity_id': user_id,
+            'message': f"Not connected: {str(e)}",
+            'error': str(e)
+        }
+
+
 @router.get("/gmail/status/{user_id}")
 async def check_gmail_status(user_id: str) -> GmailConnectionStatus:
     """
     Check if Gmail is connected for a user
     
+    Served from the connection status cache while fresh; otherwise Gmail
+    is probed off the event loop and the result cached.
+    
     Args:
         user_id: Composio entity_id for the user
         
@@ -78,38 +123,68 @@ async def check_gmail_status(user_id: str) -> GmailConnectionStatus:
     Frontend Usage:
         GET /api/v1/integrations/gmail/status/user_123
     """
-    try:
-        composio = Composio(api_key=settings.COMPOSIO_API_KEY)
-        
-        # Try to fetch emails - if this works, Gmail is connected
-        result = composio.tools.execute(
-            slug="GMAIL_FETCH_EMAILS",
-            arguments={"max_results": 1},
-            user_id=user_id,
-            dangerously_skip_version_check=True
-        )
+    # Kept apart from OAuthManager's account lookups, which have another shape
+    status = connection_status_cache.get(user_id, 'gmail', kind='probe')
+    if status is None:
+        status = await asyncio.to_thread(_probe_gmail, user_id)
+        connection_status_cache.set(user_id, 'gmail', status, kind='probe')
+    
+    connected = bool(status.get('connected'))
+    return GmailConnectionStatus(
+        user_id=user_id,
+        connected=connected,
+        message=status.get('message') or (
+            "Gmail is connected and working" if connected else "Gmail connection failed"
+        ),
+        connection_id=status.get('connection_id')
+    )
+
+
+@router.post("/gmail/push/{user_id}")
+async def gmail_push_notification(
+    user_id: str,
+    envelope: Dict[str, Any],
+    token: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Receive a Gmail push notification and enqueue that user's delta sync
+    
+    Point the Pub/Sub push subscription (or Composio Gmail trigger) for a
+    user at this URL, with ?token=GMAIL_PUSH_TOKEN. Answers immediately;
+    the sync runs in the background and repeated notifications for a user
+    whose sync is running are coalesced. Refused unless GMAIL_PUSH_ENABLED
+    is on and GMAIL_PUSH_TOKEN is set, so nobody can trigger syncs
+    without the secret.
+    
+    Args:
+        user_id: Composio entity_id whose mailbox changed
+        envelope: Pub/Sub push body
+        token: Shared secret from the subscription URL
         
-        if result.get('successful'):
-            return GmailConnectionStatus(
-                user_id=user_id,
-                connected=True,
-                message="Gmail is connected and working",
-                connection_id=None  # Could fetch from Composio if needed
-            )
-        else:
-            return GmailConnectionStatus(
-                user_id=user_id,
-                connected=False,
-                message="Gmail connection failed"
-            )
-            
-    except Exception as e:
-        logger.error(f"Error checking Gmail status for {user_id}: {e}")
-        return GmailConnectionStatus(
-            user_id=user_id,
-            connected=False,
-            message=f"Not connected: {str(e)}"
-        )
+    Returns:
+        Whether a sync was queued
+    """
+    if not settings.GMAIL_PUSH_ENABLED:
+        raise HTTPException(status_code=404, detail="Gmail push is disabled")
+    
+    expected = settings.GMAIL_PUSH_TOKEN
+    if not expected:
+        logger.error("Refusing Gmail push: GMAIL_PUSH_ENABLED is on but GMAIL_PUSH_TOKEN is not set")
+        raise HTTPException(status_code=503, detail="Gmail push is not configured")
+    if not hmac.compare_digest(token or "", expected):
+        raise HTTPException(status_code=403, detail="Invalid push token")
+    
+    try:
+        notification = decode_push_notification(envelope)
+    except ValueError as e:
+        # Acknowledge anyway: Pub/Sub would redeliver a malformed message forever
+        logger.warning(f"Ignoring malformed Gmail push for {user_id}: {e}")
+        return {"status": "ignored", "user_id": user_id}
+    
+    queued = gmail_sync_dispatcher.enqueue(user_id)
+    logger.info(f"Gmail push for {user_id} (history {notification['history_id']}): "
+                f"{'sync queued' if queued else 'coalesced'}")
+    return {"status": "queued" if queued else "coalesced", "user_id": user_id}
 
 
 @router.get("/gmail/connect-url")
@@ -176,14 +251,14 @@ async def process_gmail_resumes(request: ProcessResumesRequest) -> ProcessResume
                 }
             )
         
-        # Initialize Gmail monitor
-        monitor = GmailMonitor(data_dir=f"./data/users/{request.user_id}")
-        
-        # Process emails
-        candidates = monitor.process_new_emails(
-            user_id=request.user_id,
-            use_mock=request.use_mock
+        # Same path as polling and push (mock runs included): off the event
+        # loop, never overlapping another sync of this mailbox
+        results = await gmail_sync_dispatcher.sync_users(
+            [request.user_id], sync=partial(sync_user_mailbox, use_mock=request.use_mock)
         )
+        candidates = results[request.user_id]
+        if isinstance(candidates, BaseException):
+            raise candidates
         
         return ProcessResumesResponse(
             status="success",
@@ -0,0 +1,225 @@
+"""
+Concurrency Utilities
+Run blocking work from async endpoints without stalling the event loop
+
+CPU-bound work (PDF parsing) goes to a process pool, blocking I/O (LLM
+calls, Composio) goes to a thread pool. Admission is bounded: once
+max_concurrency jobs are running and max_queue are waiting, new work is
+rejected immediately so callers can answer 429 instead of piling up
+
+Calls to rate-limited APIs (Composio) go through a TokenBucket and
+retry_with_backoff, so parallel workers neither burst past the quota nor
+retry in lockstep
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Callable, Optional, Tuple, Type
+
+from core.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+class OverloadedError(RuntimeError):
+    """Raised when a BoundedExecutor has no free slot or queue space"""
+
+
+class BoundedExecutor:
+    """
+    Bounded executor for async endpoints
+
+    Usage:
+        async with executor.slot():
+            data = await executor.run_in_process(cpu_bound_fn, arg)
+            result = await executor.run_in_thread(blocking_io_fn, data)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        max_queue: int = 16,
+        process_workers: Optional[int] = None,
+        thread_workers: int = 8
+    ):
+        """
+        Initialize executor (pools are created on first use)
+
+        Args:
+            max_concurrency: Jobs allowed to run at the same time
+            max_queue: Jobs allowed to wait for a running slot
+            process_workers: Process pool size (default: CPU count)
+            thread_workers: Thread pool size
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self.thread_workers = thread_workers
+
+        self._pending = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+
+    @property
+    def pending(self) -> int:
+        """Jobs currently running or waiting"""
+        return self._pending
+
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Reserve a running slot, waiting in the bounded queue if needed
+
+        Raises:
+            OverloadedError: If running and queued jobs are at capacity
+        """
+        if self._pending >= self.max_concurrency + self.max_queue:
+            raise OverloadedError(
+                f"Too many jobs in progress ({self._pending}), try again later"
+            )
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        self._pending += 1
+        try:
+            async with self._semaphore:
+                yield
+        finally:
+            self._pending -= 1
+
+
+    async def run_in_process(self, fn: Callable, *args: Any) -> Any:
+        """Run a picklable CPU-bound function in the process pool"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._process_pool, partial(fn, *args))
+
+
+    async def run_in_thread(self, fn: Callable, *args: Any) -> Any:
+        """Run a blocking I/O function in the thread pool"""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix="ingestion"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._thread_pool, partial(fn, *args))
+
+
+    def shutdown(self):
+        """Shut down both pools (call on app shutdown)"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        logger.info("Ingestion executor shut down")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Usage:
+        bucket = TokenBucket(rate=5, burst=10)
+        bucket.acquire()  # Blocks until a token is free
+        call_api()
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize bucket (starts full)
+
+        Args:
+            rate: Tokens added per second (0 = unlimited)
+            burst: Bucket capacity (calls allowed back to back)
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def retry_with_backoff(
+    fn: Callable[[], Any],
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    should_retry: Optional[Callable[[Any], bool]] = None
+) -> Any:
+    """
+    Call fn, retrying failures with exponential backoff and full jitter
+
+    Args:
+        fn: Zero-argument callable
+        attempts: Total calls, including the first
+        base_delay: Upper bound of the first sleep (seconds); doubles per retry
+        max_delay: Cap on the sleep bound
+        retry_on: Exception types worth retrying
+        should_retry: result -> True if a returned result is a transient
+            failure (the last such result is returned, not raised)
+
+    Returns:
+        fn's result
+
+    Raises:
+        The last exception when every attempt raised
+    """
+    for attempt in range(attempts):
+        try:
+            result = fn()
+        except retry_on as e:
+            if attempt == attempts - 1:
+                raise
+            logger.warning(f"Attempt {attempt + 1}/{attempts} failed: {e}")
+        else:
+            if should_retry is None or attempt == attempts - 1 or not should_retry(result):
+                return result
+            logger.warning(f"Attempt {attempt + 1}/{attempts} returned a transient failure")
+
+        # Full jitter keeps parallel workers from retrying in lockstep
+        time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
+
+
+# Global executor for resume ingestion endpoints
+ingestion_executor = BoundedExecutor(
+    max_concurrency=get_setting("INGESTION_MAX_CONCURRENCY", 4),
+    max_queue=get_setting("INGESTION_MAX_QUEUE", 16),
+    process_workers=get_setting("EXTRACTION_WORKERS", 0),
+    thread_workers=get_setting("INGESTION_THREAD_WORKERS", 8)
+)
@@ -33,7 +33,7 @@ class Settings(BaseSettings):
         "http://localhost:8000"
     ]
     
-    # Database (TODO: Configure your database)
+    # Database (candidate repository; SQLite only)
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./recruitment.db")
     
     # API Keys (TODO: Add your API keys to .env)
@@ -55,6 +55,62 @@ class Settings(BaseSettings):
     PROCESSED_DIR: str = "data/processed"
     LOG_DIR: str = "data/logs"
     
+    # Resume Extraction
+    SKILL_TAXONOMY_PATH: str = os.getenv("SKILL_TAXONOMY_PATH", "")  # Empty: bundled taxonomy
+    EXTRACTION_WORKERS: int = int(os.getenv("EXTRACTION_WORKERS", "0"))  # 0: one per CPU
+    PDF_MAX_PAGES: int = int(os.getenv("PDF_MAX_PAGES", "20"))  # 0: no page limit
+    EXTRACTION_MAX_CHARS: int = int(os.getenv("EXTRACTION_MAX_CHARS", "100000"))  # 0: no limit
+    EXTRACTION_TIME_BUDGET_SECONDS: float = float(os.getenv("EXTRACTION_TIME_BUDGET_SECONDS", "30"))
+    MAX_RESUME_MB: float = float(os.getenv("MAX_RESUME_MB", "10"))  # Larger files are rejected; 0: no limit
+    
+    # Extraction Cache
+    EXTRACTION_CACHE_ENABLED: bool = os.getenv("EXTRACTION_CACHE_ENABLED", "True") == "True"
+    EXTRACTION_CACHE_PATH: str = os.getenv("EXTRACTION_CACHE_PATH", "data/cache/extraction_cache.db")
+    EXTRACTION_CACHE_MAX_MB: int = int(os.getenv("EXTRACTION_CACHE_MAX_MB", "256"))
+    
+    # Upload Ingestion
+    INGESTION_MAX_CONCURRENCY: int = int(os.getenv("INGESTION_MAX_CONCURRENCY", "4"))
+    INGESTION_MAX_QUEUE: int = int(os.getenv("INGESTION_MAX_QUEUE", "16"))  # Beyond this: 429
+    INGESTION_THREAD_WORKERS: int = int(os.getenv("INGESTION_THREAD_WORKERS", "8"))
+    
+    # Gmail Ingestion Pipeline
+    INGESTION_MAX_IN_FLIGHT: int = int(os.getenv("INGESTION_MAX_IN_FLIGHT", "16"))  # Gmail attachments between stages
+    GMAIL_DOWNLOAD_WORKERS: int = int(os.getenv("GMAIL_DOWNLOAD_WORKERS", "4"))
+    ENRICHMENT_WORKERS: int = int(os.getenv("ENRICHMENT_WORKERS", "4"))
+    
+    # Ingestion Job Queue
+    INGESTION_QUEUE_DB_PATH: str = os.getenv("INGESTION_QUEUE_DB_PATH", "data/cache/ingestion_queue.db")
+    INGESTION_MAX_ATTEMPTS: int = int(os.getenv("INGESTION_MAX_ATTEMPTS", "3"))  # Per stage, then dead-lettered
+    INGESTION_RETRY_BASE_DELAY: float = float(os.getenv("INGESTION_RETRY_BASE_DELAY", "30"))  # Seconds, doubled per attempt
+    INGESTION_LEASE_SECONDS: float = float(os.getenv("INGESTION_LEASE_SECONDS", "300"))  # Claimed job reclaimable after
+    INGESTION_COMPLETED_RETENTION_DAYS: float = float(os.getenv("INGESTION_COMPLETED_RETENTION_DAYS", "7"))  # Then pruned
+    
+    # Gmail API Limits
+    GMAIL_RATE_LIMIT_PER_SECOND: float = float(os.getenv("GMAIL_RATE_LIMIT_PER_SECOND", "5"))  # Per user; 0: no limit
+    GMAIL_RATE_LIMIT_BURST: int = int(os.getenv("GMAIL_RATE_LIMIT_BURST", "10"))
+    GMAIL_RETRY_ATTEMPTS: int = int(os.getenv("GMAIL_RETRY_ATTEMPTS", "3"))
+    GMAIL_RETRY_BASE_DELAY: float = float(os.getenv("GMAIL_RETRY_BASE_DELAY", "0.5"))  # Seconds, doubled per retry
+    
+    # Gmail Sync
+    GMAIL_SYNC_DB_PATH: str = os.getenv("GMAIL_SYNC_DB_PATH", "data/cache/gmail_sync.db")
+    GMAIL_SYNC_PAGE_SIZE: int = int(os.getenv("GMAIL_SYNC_PAGE_SIZE", "50"))
+    GMAIL_SYNC_MAX_PAGES: int = int(os.getenv("GMAIL_SYNC_MAX_PAGES", "20"))  # Per poll
+    GMAIL_SYNC_MAX_CONCURRENCY: int = int(os.getenv("GMAIL_SYNC_MAX_CONCURRENCY", "16"))  # Mailboxes synced at once
+    ATTACHMENT_STORE_DIR: str = os.getenv("ATTACHMENT_STORE_DIR", "data/resumes")  # Content-addressed blobs + index
+    
+    # Gmail Push
+    GMAIL_PUSH_ENABLED: bool = os.getenv("GMAIL_PUSH_ENABLED", "False") == "True"
+    GMAIL_PUSH_TOKEN: str = os.getenv("GMAIL_PUSH_TOKEN", "")  # ?token= on the push subscription URL
+    GMAIL_POLL_INTERVAL_MINUTES: int = int(os.getenv("GMAIL_POLL_INTERVAL_MINUTES", "15"))
+    GMAIL_PUSH_FALLBACK_POLL_MINUTES: int = int(os.getenv("GMAIL_PUSH_FALLBACK_POLL_MINUTES", "60"))  # Safety-net poll with push on
+    
+    # Connection Status Cache
+    CONNECTION_STATUS_TTL_SECONDS: float = float(os.getenv("CONNECTION_STATUS_TTL_SECONDS", "300"))
+    CONNECTION_STATUS_NEGATIVE_TTL_SECONDS: float = float(os.getenv("CONNECTION_STATUS_NEGATIVE_TTL_SECONDS", "30"))
+    
+    # Parser Warm-up (import parser libraries at startup; default: on unless DEBUG, so dev reloads stay fast)
+    PARSER_WARMUP: bool = os.getenv("PARSER_WARMUP", "False" if DEBUG else "True") == "True"
+    
     # Vector Database (TODO: Configure vector store)
     VECTOR_STORE_TYPE: str = os.getenv("VECTOR_STORE_TYPE", "chroma")
     VECTOR_STORE_PATH: str = os.getenv("VECTOR_STORE_PATH", "./data/vectorstore")
@@ -64,6 +120,12 @@ class Settings(BaseSettings):
     LLM_WEIGHT: float = 0.6
     KEYWORD_WEIGHT: float = 0.4
     
+    # Scoring Hand-off
+    SCORING_SERVICE_URL: str = os.getenv("SCORING_SERVICE_URL", "")  # e.g. http://localhost:8001/score; empty: log only
+    SCORING_JOB_DESCRIPTION: str = os.getenv("SCORING_JOB_DESCRIPTION", "")  # Sent with every batch
+    SCORING_BATCH_SIZE: int = int(os.getenv("SCORING_BATCH_SIZE", "32"))  # Candidates per scoring call
+    SCORING_BATCH_WINDOW_SECONDS: float = float(os.getenv("SCORING_BATCH_WINDOW_SECONDS", "2"))  # Max wait to fill a batch
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
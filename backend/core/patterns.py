@@ -0,0 +1,49 @@
+"""
+Shared Text Patterns
+Precompiled regular expressions for contact-field extraction
+
+Used by core.utils and the resume extractor so every caller shares the
+same compiled patterns
+"""
+
+import re
+from typing import Optional
+
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Phone formats in order of precedence: the first format found anywhere in
+# the text wins, even if another format appears earlier (so a bare
+# 10-digit number beats an earlier "123-456-7890")
+PHONE_PATTERNS = (
+    re.compile(r'\b\d{10}\b'),                          # 1234567890
+    re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),   # 123-456-7890
+    re.compile(r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}'),       # (123) 456-7890
+    re.compile(r'\+\d{1,3}\s*\d{10}'),                  # +1 1234567890
+)
+
+YEAR_PATTERN = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Everything except digits and '+' (for normalizing phone numbers)
+PHONE_FORMATTING = re.compile(r'[^\d+]')
+
+
+def find_email(text: str) -> Optional[str]:
+    """Return the first email address in text, or None"""
+    match = EMAIL_PATTERN.search(text)
+    return match.group(0) if match else None
+
+
+def find_phone(text: str) -> Optional[str]:
+    """Return the first phone number of the highest-precedence format in text, or None"""
+    for pattern in PHONE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+
+def find_year(text: str) -> Optional[str]:
+    """Return the first four-digit year (19xx/20xx) in text, or None"""
+    match = YEAR_PATTERN.search(text)
+    return match.group(0) if match else None
@@ -7,10 +7,46 @@ TODO: Contributors add utility functions as needed
 
 import hashlib
 import json
+import os
 from datetime import datetime
 from typing import Any, Dict, List
 import re
 
+from core.patterns import find_email, find_phone
+
+
+def get_setting(name: str, default: Any = None) -> Any:
+    """
+    Read an application setting, falling back to the environment
+    
+    Modules that also run outside the FastAPI app (scripts, tests, worker
+    processes) use this instead of importing core.config directly.
+    
+    Args:
+        name: Setting name (as declared on core.config.Settings)
+        default: Value used when the setting is not available
+        
+    Returns:
+        Setting value, coerced to the type of default when read from env
+    """
+    try:
+        from core.config import settings
+        return getattr(settings, name, default)
+    except Exception:
+        value = os.getenv(name)
+        if value is None:
+            return default
+        try:
+            if isinstance(default, bool):
+                return value == "True"
+            if isinstance(default, int):
+                return int(value)
+            if isinstance(default, float):
+                return float(value)
+        except ValueError:
+            return default
+        return value
+
 
 def generate_id(prefix: str = "rec") -> str:
     """
@@ -53,35 +89,26 @@ def extract_email(text: str) -> str | None:
     """
     Extract email from text
     
-    TODO: Implement robust email extraction
-    
     Args:
         text: Text containing email
         
     Returns:
         Email address or None
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
-    return match.group(0) if match else None
+    return find_email(text)
 
 
 def extract_phone(text: str) -> str | None:
     """
     Extract phone number from text
     
-    TODO: Implement phone extraction with multiple formats
-    
     Args:
         text: Text containing phone
         
     Returns:
         Phone number or None
     """
-    # Basic pattern - enhance as needed
-    phone_pattern = r'\b\d{10}\b|\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-    match = re.search(phone_pattern, text)
-    return match.group(0) if match else None
+    return find_phone(text)
 
 
 def parse_date(date_str: str) -> datetime | None:
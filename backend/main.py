@@ -8,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from core.logger import setup_logging
 from core.config import settings
 from contextlib import asynccontextmanager
+from pathlib import Path
+import asyncio
 
 # Import API routers
 from api import (
@@ -24,6 +26,12 @@ from api import (
 
 # Import task scheduler
 from tasks.scheduler import scheduler
+from core.concurrency import ingestion_executor
+from modules.resume.gmail_push import gmail_sync_dispatcher
+from modules.resume.ingest import shutdown_extraction_pool
+from modules.resume.scoring_channel import get_scoring_channel
+from modules.resume.backends import warm_up as warm_up_parsers
+from modules.resume.candidate_store import get_candidate_repository
 
 
 @asynccontextmanager
@@ -33,9 +41,19 @@ async def lifespan(app: FastAPI):
     """
     # Startup: Start the task scheduler
     scheduler.start()
+    # Warm parser imports in prod; dev stays lazy for fast reloads
+    if settings.PARSER_WARMUP:
+        warm_up_parsers()
+    # Import candidates saved as JSON files before the repository existed,
+    # for every user (once; later startups skip imported directories)
+    await asyncio.to_thread(get_candidate_repository().backfill_data_dir, Path("./data"))
     yield
-    # Shutdown: Stop the task scheduler
+    # Shutdown: Stop the task scheduler and ingestion pools
     scheduler.shutdown()
+    ingestion_executor.shutdown()
+    gmail_sync_dispatcher.shutdown()
+    shutdown_extraction_pool()
+    get_scoring_channel().close()
 
 
 # Initialize FastAPI app
@@ -0,0 +1,201 @@
+"""
+Attachment Store Module
+
+Person 4: Content-addressed storage for downloaded attachments
+Files are stored once per content hash under sha256-sharded directories:
+
+    data/resumes/blobs/3f/a9/3fa9...e1.pdf
+
+and an index maps each Gmail (user, message, attachment) to its hash, so a
+download is skipped only when that exact attachment's bytes are already
+stored. Two candidates sending "Resume.pdf" never collide, and the same
+file sent twice is kept once
+
+The file extension is part of the blob name because the extractor picks
+its parser from it
+"""
+
+from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import logging
+
+from core.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AttachmentStore:
+    """
+    Content-addressed blob store with a Gmail attachment index
+
+    Safe to share between threads; reopens its index connection in forked
+    worker processes.
+    """
+
+    def __init__(self, root: str):
+        """
+        Open (or create) the store
+
+        Args:
+            root: Store directory (blobs/ and index.db live under it)
+        """
+        self.root = Path(root)
+        self.blobs_dir = self.root / "blobs"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root / "index.db"
+
+        self._lock = threading.Lock()
+        self._open()
+
+        logger.info(f"AttachmentStore opened at {self.root}")
+
+
+    def _open(self):
+        """Open the SQLite index connection for the current process"""
+        self._pid = os.getpid()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS attachments (
+                user_id TEXT NOT NULL,
+                message_id TEXT NOT NULL,
+                attachment_id TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                extension TEXT NOT NULL,
+                filename TEXT,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                PRIMARY KEY (user_id, message_id, attachment_id)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_attachments_sha256 ON attachments (sha256)")
+
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection for this process (SQLite handles must not cross a fork)"""
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._open()
+        return self._conn
+
+
+    def blob_path(self, sha256: str, extension: str) -> Path:
+        """
+        Location of a blob
+
+        Args:
+            sha256: Hex content hash
+            extension: File extension including the dot (e.g. ".pdf")
+
+        Returns:
+            Path under blobs/<2 hex>/<2 hex>/
+        """
+        return self.blobs_dir / sha256[:2] / sha256[2:4] / f"{sha256}{extension.lower()}"
+
+
+    def lookup(self, user_id: str, message_id: str, attachment_id: str) -> Optional[str]:
+        """
+        Stored file of a Gmail attachment
+
+        Args:
+            user_id: Composio user ID
+            message_id: Gmail message ID
+            attachment_id: Gmail attachment ID
+
+        Returns:
+            Blob path, or None if the attachment was never stored (or its
+            blob has since been deleted)
+        """
+        conn = self._connection()
+        with self._lock:
+            row = conn.execute(
+                "SELECT sha256, extension FROM attachments "
+                "WHERE user_id = ? AND message_id = ? AND attachment_id = ?",
+                (user_id, message_id, attachment_id)
+            ).fetchone()
+        if not row:
+            return None
+
+        path = self.blob_path(*row)
+        return str(path) if path.exists() else None
+
+
+    def put_file(
+        self,
+        user_id: str,
+        message_id: str,
+        attachment_id: str,
+        src_path: str,
+        filename: str
+    ) -> str:
+        """
+        Move a downloaded file into the store and index it
+
+        If a blob with the same bytes already exists, the download is
+        discarded and the existing blob is reused.
+
+        Args:
+            user_id: Composio user ID
+            message_id: Gmail message ID
+            attachment_id: Gmail attachment ID
+            src_path: Downloaded file (moved or deleted by this call)
+            filename: Original attachment filename
+
+        Returns:
+            Blob path
+        """
+        sha256 = file_sha256(src_path)
+        extension = Path(filename).suffix.lower()
+        size = os.path.getsize(src_path)
+        path = self.blob_path(sha256, extension)
+
+        if path.exists():
+            os.remove(src_path)
+            logger.info(f"Attachment {filename} already stored as {path.name}")
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Copy next to the blob first, then rename, so readers never see
+            # a partial file (the source may be on another filesystem)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.part')
+            os.close(fd)
+            try:
+                shutil.move(src_path, tmp_path)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            logger.info(f"Stored attachment {filename} as {path.name}")
+
+        conn = self._connection()
+        with self._lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO attachments VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (user_id, message_id, attachment_id, sha256, extension, filename, size, time.time())
+            )
+        return str(path)
+
+
+@lru_cache(maxsize=None)
+def get_attachment_store() -> AttachmentStore:
+    """Return the process-wide attachment store (ATTACHMENT_STORE_DIR)"""
+    return AttachmentStore(get_setting("ATTACHMENT_STORE_DIR", "data/resumes"))
@@ -4,14 +4,13 @@ Google Calendar Integration - Person 4
 from typing import List, Dict, Any
 import logging
 from datetime import datetime, timedelta
-from composio import Composio
-from core.config import settings
+from .composio_client import get_composio_client
 
 logger = logging.getLogger(__name__)
 
 class CalendarIntegration:
     def __init__(self, composio_client=None):
-        self.composio = composio_client or Composio(api_key=settings.COMPOSIO_API_KEY)
+        self.composio = composio_client or get_composio_client()
     
     def create_event(self, entity_id: str, summary: str, start_time: str, end_time: str,
                     attendees: List[str], description: str = "", calendar_id: str = "primary"):
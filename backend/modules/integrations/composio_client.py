@@ -0,0 +1,188 @@
+"""
+Composio Client Registry Module
+
+Person 4: Shared Composio client
+Gmail, Sheets, Calendar, OAuth and the integrations API all reuse one
+lazily created Composio client per API key, so request paths no longer
+pay for client setup and fresh TLS handshakes
+
+The registry also tracks client health: consecutive failures, the last
+error, and a cool-down after a failed initialization so a missing key or
+package is not retried on every request
+"""
+
+from typing import Any, Callable, Dict, Optional
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ComposioUnavailableError(RuntimeError):
+    """Raised when no Composio client can be provided"""
+
+
+def _create_client(api_key: str):
+    """Build a real Composio client"""
+    from composio import Composio
+    return Composio(api_key=api_key)
+
+
+class ComposioRegistry:
+    """
+    Process-wide, lazily initialized Composio clients with health tracking
+
+    Usage:
+        client = composio_registry.get()
+        result = client.tools.execute(...)
+        composio_registry.record_success()  # or record_failure(error)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], Any] = _create_client,
+        retry_after: float = 30.0,
+        unhealthy_after: int = 3
+    ):
+        """
+        Initialize registry (no client is created until first use)
+
+        Args:
+            factory: api_key -> client
+            retry_after: Seconds before retrying a failed initialization
+            unhealthy_after: Consecutive call failures before reporting unhealthy
+        """
+        self.factory = factory
+        self.retry_after = retry_after
+        self.unhealthy_after = unhealthy_after
+
+        self._lock = threading.Lock()
+        self._clients: Dict[str, Any] = {}
+        self._state: Dict[str, Dict[str, Any]] = {}
+
+
+    def _entry(self, api_key: str) -> Dict[str, Any]:
+        """Health record for one API key (caller holds the lock)"""
+        return self._state.setdefault(api_key, {
+            'initialized': False,
+            'consecutive_failures': 0,
+            'last_error': None,
+            'last_success_at': None,
+            'last_failure_at': None,
+            'init_failed_at': None
+        })
+
+
+    def get(self, api_key: Optional[str] = None):
+        """
+        Shared client for an API key, created on first use
+
+        Args:
+            api_key: Composio API key (default: settings.COMPOSIO_API_KEY)
+
+        Returns:
+            Composio client
+
+        Raises:
+            ComposioUnavailableError: If the client cannot be created (or a
+                recent attempt failed and the cool-down has not passed)
+        """
+        if api_key is None:
+            api_key = self._default_key()
+
+        client = self._clients.get(api_key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(api_key)
+            if client is not None:
+                return client
+
+            entry = self._entry(api_key)
+            failed_at = entry['init_failed_at']
+            if failed_at and time.monotonic() - failed_at < self.retry_after:
+                raise ComposioUnavailableError(f"Composio client unavailable: {entry['last_error']}")
+
+            try:
+                client = self.factory(api_key)
+            except Exception as e:
+                entry['init_failed_at'] = time.monotonic()
+                entry['last_error'] = str(e)
+                entry['last_failure_at'] = time.time()
+                logger.error(f"Failed to initialize Composio client: {e}")
+                raise ComposioUnavailableError(f"Composio client unavailable: {e}") from e
+
+            self._clients[api_key] = client
+            entry['initialized'] = True
+            entry['init_failed_at'] = None
+            logger.info("Composio client initialized")
+            return client
+
+
+    def record_success(self, api_key: Optional[str] = None):
+        """Record a successful Composio call"""
+        with self._lock:
+            entry = self._entry(api_key or self._default_key())
+            entry['consecutive_failures'] = 0
+            entry['last_success_at'] = time.time()
+
+
+    def record_failure(self, error: Any, api_key: Optional[str] = None):
+        """Record a failed Composio call (network error, 5xx, ...)"""
+        with self._lock:
+            entry = self._entry(api_key or self._default_key())
+            entry['consecutive_failures'] += 1
+            entry['last_error'] = str(error)
+            entry['last_failure_at'] = time.time()
+
+
+    def health(self, api_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Health summary of a client
+
+        Returns:
+            Dict with status ("healthy", "degraded", "unavailable" or
+            "not_initialized") and the failure counters
+        """
+        with self._lock:
+            entry = dict(self._entry(api_key or self._default_key()))
+
+        if entry['init_failed_at'] is not None:
+            status = 'unavailable'
+        elif not entry['initialized']:
+            status = 'not_initialized'
+        elif entry['consecutive_failures'] >= self.unhealthy_after:
+            status = 'degraded'
+        else:
+            status = 'healthy'
+
+        entry.pop('init_failed_at')
+        return {'status': status, **entry}
+
+
+    def reset(self):
+        """Drop every client and health record (next get() reconnects)"""
+        with self._lock:
+            self._clients.clear()
+            self._state.clear()
+
+
+    @staticmethod
+    def _default_key() -> str:
+        """Configured API key (empty if settings are unavailable)"""
+        try:
+            from core.config import settings
+            return settings.COMPOSIO_API_KEY or ''
+        except Exception:
+            return ''
+
+
+# Global registry shared by every integration
+composio_registry = ComposioRegistry()
+
+
+def get_composio_client(api_key: Optional[str] = None):
+    """Shared Composio client (see ComposioRegistry.get)"""
+    return composio_registry.get(api_key)
@@ -0,0 +1,127 @@
+"""
+Connection Status Cache Module
+
+Person 4: Cached integration status
+Remembers, per entity and service, whether a Google service is connected,
+so status endpoints and pre-processing checks answer from memory instead
+of calling Composio every time
+
+Connected results live for CONNECTION_STATUS_TTL_SECONDS. "Not connected"
+results expire sooner (CONNECTION_STATUS_NEGATIVE_TTL_SECONDS) because
+users often connect through the Composio dashboard, which this app never
+hears about. Connect calls invalidate the entry explicitly. Errors are
+never cached
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import copy
+import threading
+import time
+import logging
+
+from core.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionStatusCache:
+    """
+    Thread-safe TTL cache of connection status dicts
+
+    Entries are keyed by entity, service and kind, so results of
+    different checks of one service (an account lookup, a live Gmail
+    probe) never stand in for each other.
+
+    Usage:
+        status = cache.get(entity_id, 'gmail')
+        if status is None:
+            status = check_with_composio()
+            cache.set(entity_id, 'gmail', status)
+    """
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 30.0):
+        """
+        Initialize cache
+
+        Args:
+            ttl: Seconds a connected status is served
+            negative_ttl: Seconds a not-connected status is served
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+
+
+    def get(self, entity_id: str, service: str, kind: str = 'connection') -> Optional[Dict[str, Any]]:
+        """
+        Cached status, if still fresh
+
+        Args:
+            entity_id: Composio entity/user ID
+            service: Service name ('gmail', 'calendar', 'sheets')
+            kind: Which check produced the status ('connection', 'probe')
+
+        Returns:
+            Copy of the status dict, or None on a miss
+        """
+        key = (entity_id, service.lower(), kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, status = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+        return copy.deepcopy(status)
+
+
+    def set(self, entity_id: str, service: str, status: Dict[str, Any], kind: str = 'connection'):
+        """
+        Cache a status dict (results carrying an "error" are skipped)
+
+        Args:
+            entity_id: Composio entity/user ID
+            service: Service name ('gmail', 'calendar', 'sheets')
+            status: Status dict with a "connected" flag
+            kind: Which check produced the status ('connection', 'probe')
+        """
+        if status.get('error'):
+            return
+
+        ttl = self.ttl if status.get('connected') else self.negative_ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[(entity_id, service.lower(), kind)] = (time.monotonic() + ttl, copy.deepcopy(status))
+
+
+    def invalidate(self, entity_id: str, service: Optional[str] = None):
+        """
+        Forget cached status (of every kind)
+
+        Args:
+            entity_id: Composio entity/user ID
+            service: Only this service (default: every service of the entity)
+        """
+        with self._lock:
+            for key in [k for k in self._entries
+                        if k[0] == entity_id and (not service or k[1] == service.lower())]:
+                del self._entries[key]
+        logger.info(f"Invalidated connection status for {entity_id} ({service or 'all services'})")
+
+
+    def clear(self):
+        """Forget every cached status"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global cache shared by OAuthManager and the integrations API
+connection_status_cache = ConnectionStatusCache(
+    ttl=get_setting("CONNECTION_STATUS_TTL_SECONDS", 300.0),
+    negative_ttl=get_setting("CONNECTION_STATUS_NEGATIVE_TTL_SECONDS", 30.0)
+)
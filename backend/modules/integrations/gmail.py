@@ -6,15 +6,78 @@ Provides Gmail operations for the recruitment platform
 """
 
 from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
-import shutil
+import re
 import tempfile
-from pathlib import Path
+import threading
 from datetime import datetime
 
+from core.concurrency import TokenBucket, retry_with_backoff
+from core.utils import get_setting
+from .composio_client import composio_registry
+
 logger = logging.getLogger(__name__)
 
+# Attachment types treated as resumes
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+# HTTP statuses of Composio results worth retrying (rate limits, upstream hiccups)
+_TRANSIENT_STATUSES = {408, 429, 500, 502, 503, 504}
+
+# Same, found in error text: a status only next to "status"/"HTTP"/"code" or
+# leading the message, so ids and byte counts containing "500" never match
+_TRANSIENT_ERROR_PATTERN = re.compile(
+    r'(?:^\s*|\b(?:status|http|code)\b[^0-9a-z]{0,12}(?:code\b[^0-9a-z]{0,3})?)(?:408|429|50[0234])\b'
+    r'|\b(?:rate.?limit|quota|timeout|timed out|temporar|unavailable|too many requests'
+    r'|connection (?:error|reset|refused|aborted|closed))',
+    re.IGNORECASE
+)
+
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _user_rate_limiter(user_id: str) -> TokenBucket:
+    """Token bucket shared by every Gmail call made for one user"""
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(user_id)
+        if bucket is None:
+            bucket = _rate_limiters[user_id] = TokenBucket(
+                rate=get_setting("GMAIL_RATE_LIMIT_PER_SECOND", 5.0),
+                burst=get_setting("GMAIL_RATE_LIMIT_BURST", 10)
+            )
+        return bucket
+
+
+def _is_transient(result: Optional[Dict[str, Any]]) -> bool:
+    """Whether a failed Composio result is worth retrying"""
+    if not result:
+        return True
+    if result.get('successful'):
+        return False
+    data = result.get('data') if isinstance(result.get('data'), dict) else {}
+    for status in (result.get('status_code'), data.get('status_code'), data.get('status')):
+        if isinstance(status, int) or (isinstance(status, str) and status.isdigit()):
+            return int(status) in _TRANSIENT_STATUSES
+    return bool(_TRANSIENT_ERROR_PATTERN.search(str(result.get('error') or '')))
+
+
+def _message_time(message: Dict[str, Any]) -> Optional[int]:
+    """Receive time of a fetched message as Unix seconds (None if unknown)"""
+    internal_date = message.get('internalDate')
+    if internal_date:
+        return int(internal_date) // 1000
+    
+    timestamp = message.get('messageTimestamp')
+    if timestamp:
+        try:
+            return int(datetime.fromisoformat(str(timestamp).replace('Z', '+00:00')).timestamp())
+        except ValueError:
+            return None
+    return None
+
 
 class GmailIntegration:
     """
@@ -26,29 +89,63 @@ class GmailIntegration:
     - Sending emails (interview invites, etc.)
     """
     
-    def __init__(self, composio_client=None):
+    def __init__(
+        self,
+        composio_client=None,
+        store=None,
+        max_pages: Optional[int] = None,
+        retry_attempts: Optional[int] = None,
+        retry_base_delay: Optional[float] = None,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[int] = None
+    ):
         """
         Initialize Gmail Integration
         
         Args:
             composio_client: Composio client instance (optional)
+            store: AttachmentStore for downloads (default: ATTACHMENT_STORE_DIR)
+            max_pages: Result pages read per listing (default: GMAIL_SYNC_MAX_PAGES)
+            retry_attempts: Calls per Composio tool run (default: GMAIL_RETRY_ATTEMPTS)
+            retry_base_delay: First retry's backoff bound in seconds (default: GMAIL_RETRY_BASE_DELAY)
+            rate_limit: Calls per second per user, 0 = unlimited; when given
+                with or without rate_burst, this instance gets its own buckets
+                instead of the process-wide ones (default: GMAIL_RATE_LIMIT_PER_SECOND)
+            rate_burst: Calls allowed back to back (default: GMAIL_RATE_LIMIT_BURST)
         """
         if composio_client:
             self.composio = composio_client
         else:
-            # Get Composio client from OAuth module
+            # Reuse the process-wide Composio client
             try:
-                from core.config import settings
-                from composio import Composio
-                self.composio = Composio(api_key=settings.COMPOSIO_API_KEY)
+                self.composio = composio_registry.get()
                 logger.info("GmailIntegration initialized with Composio")
             except Exception as e:
                 logger.warning(f"Failed to initialize Composio client: {e}")
                 self.composio = None
         
-        # Setup download folder
-        self.download_folder = Path("./data/resumes")
-        self.download_folder.mkdir(parents=True, exist_ok=True)
+        self.max_pages = max_pages or get_setting("GMAIL_SYNC_MAX_PAGES", 20)
+        self.retry_attempts = retry_attempts or get_setting("GMAIL_RETRY_ATTEMPTS", 3)
+        self.retry_base_delay = (get_setting("GMAIL_RETRY_BASE_DELAY", 0.5)
+                                 if retry_base_delay is None else retry_base_delay)
+        
+        # Per-user rate limits are shared process-wide unless overridden here
+        self._rate_limiters: Optional[Dict[str, TokenBucket]] = None
+        if rate_limit is not None or rate_burst is not None:
+            self._rate_limiters = {}
+            self.rate_limit = get_setting("GMAIL_RATE_LIMIT_PER_SECOND", 5.0) if rate_limit is None else rate_limit
+            self.rate_burst = rate_burst or get_setting("GMAIL_RATE_LIMIT_BURST", 10)
+        
+        # Whether the last message listing read every result page, and if
+        # not, where the next listing should continue ({"query", "page_token"})
+        self.last_fetch_complete = False
+        self.last_next_page: Optional[Dict[str, str]] = None
+        
+        # Downloaded attachments are stored by content hash
+        if store is None:
+            from .attachment_store import get_attachment_store
+            store = get_attachment_store()
+        self.store = store
     
     
     def check_for_new_resumes(
@@ -66,96 +163,303 @@ class GmailIntegration:
             use_mock: Use mock data for testing (default: False)
             
         Returns:
-            List of emails with resume attachments
+            List of emails (one per message) with every resume attachment downloaded
         """
         if use_mock:
             logger.info("Using mock resume emails for testing")
             return self._get_mock_resume_emails()
         
-        logger.info(f"Checking Gmail for new resume emails (user: {user_id})")
+        resume_emails = self.list_resume_messages(user_id)
+        if resume_emails is None:
+            logger.info("Falling back to mock data")
+            return self._get_mock_resume_emails()
         
-        try:
-            if not self.composio:
-                logger.warning("Composio client not initialized - using mock data")
-                return self._get_mock_resume_emails()
+        self.download_attachments(user_id, resume_emails)
+        for email in resume_emails:
+            email['attachments'] = [a for a in email['attachments'] if a['file_path']]
+        
+        return [email for email in resume_emails if email['attachments']]
+    
+    
+    def list_resume_messages(
+        self,
+        user_id: str,
+        since: Optional[int] = None,
+        resume: Optional[Dict[str, str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        List messages with resume attachments, without downloading them
+        
+        Follows result pages up to max_pages. When more remain,
+        last_next_page says where to continue, and passing it back as
+        resume on the next call reads the following pages instead of the
+        newest ones again.
+        
+        Args:
+            user_id: Composio user ID
+            since: Only messages received after this Unix time (seconds);
+                None = the last 7 days
+            resume: last_next_page of an earlier, unfinished listing
             
-            # Fetch emails with PDF/DOCX attachments directly
-            logger.info("Fetching emails with attachments from Gmail...")
+        Returns:
+            One email per message with all its PDF/DOCX/TXT attachments
+            ({"attachment_id", "filename", "mime_type", "size"}) and its
+            receive time ("timestamp", Unix seconds), or None if Gmail could
+            not be queried
+        """
+        logger.info(f"Checking Gmail for new resume emails (user: {user_id}, since: {since})")
+        
+        if not self.composio:
+            logger.warning("Composio client not initialized")
+            return None
+        
+        # Gmail's after: takes seconds; a small overlap catches messages that
+        # share the cursor's second (the ledger drops the repeats)
+        if since:
+            query = f"has:attachment after:{max(since - 60, 0)}"
+        else:
+            query = "has:attachment newer_than:7d"  # Get all attachments from last 7 days
+        
+        messages = None
+        if resume:
+            messages = self._fetch_all_messages(user_id, resume['query'], resume['page_token'])
+            if messages is None:
+                # Page tokens expire; start the listing over
+                logger.warning("Could not continue the previous listing, starting over")
+        if messages is None:
+            messages = self._fetch_all_messages(user_id, query)
+        if messages is None:
+            return None
+        logger.info(f"Found {len(messages)} messages with attachments")
+        
+        max_bytes = get_setting("MAX_RESUME_MB", 10.0) * 1024 * 1024
+        resume_emails = []
+        
+        for message in messages:
+            try:
+                attachments = []
+                
+                for attachment in message.get('attachmentList', []):
+                    filename = attachment.get('filename', '')
+                    attachment_id = attachment.get('attachmentId')
+                    
+                    # Only process resume files (PDF, DOCX, TXT)
+                    if not filename or not attachment_id or not filename.lower().endswith(RESUME_EXTENSIONS):
+                        continue
+                    
+                    # Skip oversized attachments before downloading them
+                    size = attachment.get('size') or 0
+                    if max_bytes and size > max_bytes:
+                        logger.warning(f"Skipping oversized attachment {filename}: {size} bytes")
+                        continue
+                    
+                    attachments.append({
+                        'attachment_id': attachment_id,
+                        'filename': filename,
+                        'mime_type': attachment.get('mimeType', 'application/octet-stream'),
+                        'size': size
+                    })
+                
+                if attachments:
+                    message_id = message.get('messageId')
+                    resume_emails.append({
+                        'id': message_id,
+                        'message_id': message_id,
+                        'subject': message.get('subject', 'No Subject'),
+                        'from': message.get('sender', 'Unknown'),
+                        'date': message.get('messageTimestamp'),
+                        'timestamp': _message_time(message),
+                        'attachments': attachments
+                    })
             
-            result = self.composio.tools.execute(
-                slug="GMAIL_FETCH_EMAILS",
-                arguments={
-                    "max_results": 20,
-                    "label_ids": ["INBOX"],
-                    "query": "has:attachment newer_than:7d"  # Get all attachments from last 7 days
-                },
-                user_id=user_id,
-                dangerously_skip_version_check=True
-            )
+            except Exception as e:
+                logger.error(f"Error processing message: {e}")
+                continue
+        
+        logger.info(f"Found {sum(len(e['attachments']) for e in resume_emails)} resume attachments "
+                    f"in {len(resume_emails)} messages")
+        return resume_emails
+    
+    
+    def _fetch_all_messages(
+        self,
+        user_id: str,
+        query: str,
+        page_token: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run a Gmail search and follow nextPageToken for up to max_pages pages
+        
+        Args:
+            user_id: Composio user ID
+            query: Gmail search query
+            page_token: Page to start from (default: the first)
+            
+        Returns:
+            Matching messages, or None if the first page failed
+            (last_fetch_complete tells whether every page was read, and
+            last_next_page where to continue if not)
+        """
+        self.last_fetch_complete = False
+        self.last_next_page = None
+        page_size = get_setting("GMAIL_SYNC_PAGE_SIZE", 50)
+        messages: List[Dict[str, Any]] = []
+        
+        for page in range(self.max_pages):
+            arguments = {
+                "max_results": page_size,
+                "label_ids": ["INBOX"],
+                "query": query
+            }
+            if page_token:
+                arguments["page_token"] = page_token
+            
+            try:
+                logger.info(f"Fetching emails with attachments from Gmail (page {page + 1})...")
+                result = self._execute(user_id, "GMAIL_FETCH_EMAILS", arguments)
+            except Exception as e:
+                logger.error(f"Error checking Gmail: {e}")
+                result = None
             
             if not result or not result.get('successful'):
                 logger.warning(f"Gmail fetch failed: {result.get('error') if result else 'No response'}")
-                logger.info("Falling back to mock data")
-                return self._get_mock_resume_emails()
+                if not page:
+                    return None
+                # Later pages failing still leaves the earlier ones usable
+                self.last_next_page = {'query': query, 'page_token': page_token}
+                return messages
             
-            messages = result.get('data', {}).get('messages', [])
-            logger.info(f"Found {len(messages)} messages with attachments")
+            data = result.get('data', {})
+            messages.extend(data.get('messages', []))
+            page_token = data.get('nextPageToken')
+            if not page_token:
+                self.last_fetch_complete = True
+                break
+        else:
+            self.last_next_page = {'query': query, 'page_token': page_token}
+            logger.warning(f"Stopped after {self.max_pages} pages; the rest is picked up next poll")
+        
+        return messages
+    
+    
+    def _execute(self, user_id: str, slug: str, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run a Composio Gmail tool under the user's rate limit
+        
+        Raised errors and transient failures (rate limits, timeouts, 5xx)
+        are retried with jittered exponential backoff; every attempt takes
+        a token from the user's bucket. Outcomes feed the client registry's
+        health tracking.
+        
+        Args:
+            user_id: Composio user ID
+            slug: Composio tool slug
+            arguments: Tool arguments
             
-            # Process each message and download PDF/DOCX resumes
-            resume_emails = []
+        Returns:
+            Composio result dict (possibly unsuccessful)
             
-            for message in messages:
-                try:
-                    message_id = message.get('messageId')
-                    sender = message.get('sender', 'Unknown')
-                    subject = message.get('subject', 'No Subject')
-                    
-                    # Check for PDF/DOCX attachments
-                    attachment_list = message.get('attachmentList', [])
-                    
-                    for attachment in attachment_list:
-                        filename = attachment.get('filename', '')
-                        
-                        # Only process resume files (PDF, DOCX, TXT)
-                        if filename and (filename.endswith('.pdf') or 
-                                       filename.endswith('.docx') or 
-                                       filename.endswith('.txt')):
-                            
-                            attachment_id = attachment.get('attachmentId')
-                            
-                            if attachment_id:
-                                # Download the attachment
-                                file_path = self._download_attachment(
-                                    message_id=message_id,
-                                    attachment_id=attachment_id,
-                                    filename=filename,
-                                    user_id=user_id
-                                )
-                                
-                                if file_path:
-                                    resume_emails.append({
-                                        'subject': subject,
-                                        'from': sender,
-                                        'message_id': message_id,
-                                        'attachments': [{
-                                            'file_path': file_path,
-                                            'filename': filename,
-                                            'mime_type': attachment.get('mimeType', 'application/octet-stream')
-                                        }]
-                                    })
-                                    logger.info(f"✅ Downloaded resume: {filename} from {sender}")
-                
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
-                    continue
+        Raises:
+            Exception: The last error if every attempt raised
+        """
+        bucket = self._rate_limiter(user_id)
+        
+        def call():
+            bucket.acquire()
+            try:
+                result = self.composio.tools.execute(
+                    slug=slug,
+                    arguments=arguments,
+                    user_id=user_id,
+                    dangerously_skip_version_check=True
+                )
+            except Exception as e:
+                composio_registry.record_failure(e)
+                raise
             
-            logger.info(f"Successfully downloaded {len(resume_emails)} resume files")
-            return resume_emails
+            if _is_transient(result):
+                composio_registry.record_failure(result.get('error') if result else 'No response')
+            else:
+                composio_registry.record_success()
+            return result
+        
+        return retry_with_backoff(
+            call,
+            attempts=self.retry_attempts,
+            base_delay=self.retry_base_delay,
+            should_retry=_is_transient
+        )
+    
+    
+    def _rate_limiter(self, user_id: str) -> TokenBucket:
+        """The user's token bucket (this instance's own if limits were given)"""
+        if self._rate_limiters is None:
+            return _user_rate_limiter(user_id)
+        with _rate_limiters_lock:
+            bucket = self._rate_limiters.get(user_id)
+            if bucket is None:
+                bucket = self._rate_limiters[user_id] = TokenBucket(rate=self.rate_limit, burst=self.rate_burst)
+            return bucket
+    
+    
+    def download_attachments(self, user_id: str, emails: List[Dict[str, Any]]) -> int:
+        """
+        Download every listed attachment concurrently
+        
+        Up to GMAIL_DOWNLOAD_WORKERS downloads run at once (all sharing the
+        user's rate limit), so a poll takes about as long as its slowest
+        download rather than the sum of them.
+        
+        Args:
+            user_id: Composio user ID
+            emails: Emails from list_resume_messages(); each attachment
+                gets a file_path (None if its download failed)
             
-        except Exception as e:
-            logger.error(f"Error checking Gmail: {e}")
-            logger.info("Falling back to mock data")
-            return self._get_mock_resume_emails()
+        Returns:
+            Number of attachments downloaded
+        """
+        jobs = [(email, attachment) for email in emails for attachment in email['attachments']]
+        if not jobs:
+            return 0
+        
+        def fetch(job):
+            email, attachment = job
+            attachment['file_path'] = self.download_attachment(user_id, email['message_id'], attachment)
+            if attachment['file_path']:
+                logger.info(f"✅ Downloaded resume: {attachment['filename']} from {email['from']}")
+            return attachment['file_path']
+        
+        workers = min(get_setting("GMAIL_DOWNLOAD_WORKERS", 4), len(jobs))
+        with ThreadPoolExecutor(workers, thread_name_prefix="gmail-download") as pool:
+            downloaded = sum(1 for path in pool.map(fetch, jobs) if path)
+        
+        logger.info(f"Successfully downloaded {downloaded}/{len(jobs)} resume files")
+        return downloaded
+    
+    
+    def download_attachment(
+        self,
+        user_id: str,
+        message_id: str,
+        attachment: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Download one attachment listed by list_resume_messages()
+        
+        Args:
+            user_id: Composio user ID
+            message_id: Gmail message ID
+            attachment: Attachment entry ({"attachment_id", "filename", ...})
+            
+        Returns:
+            Path to downloaded file, or None on error
+        """
+        return self._download_attachment(
+            message_id=message_id,
+            attachment_id=attachment['attachment_id'],
+            filename=attachment['filename'],
+            user_id=user_id
+        )
     
     
     def _download_attachment(
@@ -175,27 +479,22 @@ class GmailIntegration:
             user_id: Composio user ID
             
         Returns:
-            Path to downloaded file in data/resumes/, or None on error
+            Path to the stored file (see AttachmentStore), or None on error
         """
         try:
-            # Check if file already exists in our download folder
-            final_path = self.download_folder / filename
-            if final_path.exists():
-                logger.info(f"File already exists, using cached: {filename}")
-                return str(final_path)
+            # Skip the download only if this exact attachment is already stored
+            stored_path = self.store.lookup(user_id, message_id, attachment_id)
+            if stored_path:
+                logger.info(f"Attachment already stored, skipping download: {filename}")
+                return stored_path
             
             logger.info(f"Downloading attachment: {filename}")
             
-            result = self.composio.tools.execute(
-                slug="GMAIL_GET_ATTACHMENT",
-                arguments={
-                    "message_id": message_id,
-                    "attachment_id": attachment_id,
-                    "file_name": filename
-                },
-                user_id=user_id,
-                dangerously_skip_version_check=True
-            )
+            result = self._execute(user_id, "GMAIL_GET_ATTACHMENT", {
+                "message_id": message_id,
+                "attachment_id": attachment_id,
+                "file_name": filename
+            })
             
             if not result or not result.get('successful'):
                 logger.error(f"Download failed: {result.get('error') if result else 'No response'}")
@@ -207,10 +506,10 @@ class GmailIntegration:
             composio_file_path = attachment_data.get('file')
             
             if composio_file_path and os.path.exists(composio_file_path):
-                # Move the file from Composio's temp location to our data/resumes folder
-                shutil.move(composio_file_path, final_path)
-                logger.info(f"Saved to: {final_path}")
-                return str(final_path)
+                # Move the file from Composio's temp location into the store
+                return self.store.put_file(
+                    user_id, message_id, attachment_id, composio_file_path, filename
+                )
             
             logger.error(f"No file found in Composio response for {filename}")
             return None
@@ -0,0 +1,224 @@
+"""
+Gmail Sync Ledger Module
+
+Person 4: Gmail incremental sync state
+Persists, per user, how far the inbox has been synced (newest processed
+message time) and which message IDs were already processed, so each poll
+only asks Gmail for the delta and never feeds a message to the pipeline
+twice. When a poll stops at GMAIL_SYNC_MAX_PAGES, the page it stopped at
+is kept too, and the next poll continues from there
+
+Stored in SQLite next to the other local caches
+"""
+
+from typing import Dict, Iterable, Optional, Set
+from functools import lru_cache
+from pathlib import Path
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+from core.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+class GmailSyncLedger:
+    """
+    Per-user Gmail sync cursors and processed-message ledger
+
+    Safe to share between threads; reopens its connection in forked
+    worker processes.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the ledger database
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._open()
+
+        logger.info(f"GmailSyncLedger opened at {self.db_path}")
+
+
+    def _open(self):
+        """Open the SQLite connection for the current process"""
+        self._pid = os.getpid()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS gmail_sync_cursors (
+                user_id TEXT PRIMARY KEY,
+                last_message_time INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS gmail_processed_messages (
+                user_id TEXT NOT NULL,
+                message_id TEXT NOT NULL,
+                processed_at REAL NOT NULL,
+                PRIMARY KEY (user_id, message_id)
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS gmail_sync_next_pages (
+                user_id TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                page_token TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection for this process (SQLite handles must not cross a fork)"""
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._open()
+        return self._conn
+
+
+    def get_cursor(self, user_id: str) -> Optional[int]:
+        """
+        Newest fully processed message time for a user
+
+        Args:
+            user_id: Composio user ID
+
+        Returns:
+            Unix timestamp (seconds), or None before the first sync
+        """
+        conn = self._connection()
+        with self._lock:
+            row = conn.execute(
+                "SELECT last_message_time FROM gmail_sync_cursors WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+
+    def advance_cursor(self, user_id: str, message_time: int):
+        """
+        Move a user's cursor forward (never backwards)
+
+        Args:
+            user_id: Composio user ID
+            message_time: Unix timestamp (seconds) of the newest processed message
+        """
+        conn = self._connection()
+        with self._lock:
+            conn.execute(
+                """
+                INSERT INTO gmail_sync_cursors VALUES (?, ?, ?)
+                ON CONFLICT (user_id) DO UPDATE SET
+                    last_message_time = MAX(last_message_time, excluded.last_message_time),
+                    updated_at = excluded.updated_at
+                """,
+                (user_id, message_time, time.time())
+            )
+
+
+    def processed_ids(self, user_id: str, message_ids: Iterable[str]) -> Set[str]:
+        """
+        Which of the given messages were already processed
+
+        Args:
+            user_id: Composio user ID
+            message_ids: Candidate message IDs
+
+        Returns:
+            Subset of message_ids found in the ledger
+        """
+        message_ids = list(message_ids)
+        found: Set[str] = set()
+        conn = self._connection()
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(message_ids), 500):
+                chunk = message_ids[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT message_id FROM gmail_processed_messages "
+                    f"WHERE user_id = ? AND message_id IN ({','.join('?' * len(chunk))})",
+                    (user_id, *chunk)
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        return found
+
+
+    def mark_processed(self, user_id: str, message_ids: Iterable[str]):
+        """
+        Record messages as processed
+
+        Args:
+            user_id: Composio user ID
+            message_ids: Processed message IDs
+        """
+        now = time.time()
+        conn = self._connection()
+        with self._lock:
+            conn.executemany(
+                "INSERT OR IGNORE INTO gmail_processed_messages VALUES (?, ?, ?)",
+                [(user_id, message_id, now) for message_id in message_ids]
+            )
+
+
+    def get_next_page(self, user_id: str) -> Optional[Dict[str, str]]:
+        """
+        Where an unfinished listing should continue
+
+        Args:
+            user_id: Composio user ID
+
+        Returns:
+            {"query", "page_token"}, or None when the last poll read every page
+        """
+        conn = self._connection()
+        with self._lock:
+            row = conn.execute(
+                "SELECT query, page_token FROM gmail_sync_next_pages WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return {'query': row[0], 'page_token': row[1]} if row else None
+
+
+    def set_next_page(self, user_id: str, next_page: Optional[Dict[str, str]]):
+        """
+        Remember (or, with None, forget) where the next poll should continue
+
+        Args:
+            user_id: Composio user ID
+            next_page: GmailIntegration.last_next_page
+        """
+        conn = self._connection()
+        with self._lock:
+            if next_page and next_page.get('page_token'):
+                conn.execute(
+                    "INSERT OR REPLACE INTO gmail_sync_next_pages VALUES (?, ?, ?, ?)",
+                    (user_id, next_page['query'], next_page['page_token'], time.time())
+                )
+            else:
+                conn.execute("DELETE FROM gmail_sync_next_pages WHERE user_id = ?", (user_id,))
+
+
+    def reset(self, user_id: str):
+        """Forget a user's cursor and ledger (next poll does a full sync)"""
+        conn = self._connection()
+        with self._lock:
+            conn.execute("DELETE FROM gmail_sync_cursors WHERE user_id = ?", (user_id,))
+            conn.execute("DELETE FROM gmail_processed_messages WHERE user_id = ?", (user_id,))
+            conn.execute("DELETE FROM gmail_sync_next_pages WHERE user_id = ?", (user_id,))
+
+
+@lru_cache(maxsize=None)
+def get_gmail_sync_ledger() -> GmailSyncLedger:
+    """Return the process-wide sync ledger (GMAIL_SYNC_DB_PATH)"""
+    return GmailSyncLedger(get_setting("GMAIL_SYNC_DB_PATH", "data/cache/gmail_sync.db"))
@@ -7,10 +7,12 @@ Based on: https://docs.composio.dev/docs/custom-auth-configs
 """
 
 from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
 import os
 import logging
-from composio import Composio
 from core.config import settings
+from .composio_client import get_composio_client
+from .connection_status import connection_status_cache
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +26,15 @@ class OAuthManager:
     https://docs.composio.dev/docs/custom-auth-configs
     """
     
-    def __init__(self):
-        """Initialize OAuth Manager with Composio"""
+    def __init__(self, composio_client=None, status_cache=None):
+        """
+        Initialize OAuth Manager with Composio
+        
+        Args:
+            composio_client: Composio client (default: the shared client)
+            status_cache: ConnectionStatusCache (default: the shared cache)
+        """
+        self.status_cache = status_cache or connection_status_cache
         self.composio_api_key = settings.COMPOSIO_API_KEY
         self.composio = None
         
@@ -37,7 +46,7 @@ class OAuthManager:
         }
         
         try:
-            self.composio = Composio(api_key=self.composio_api_key)
+            self.composio = composio_client or get_composio_client(self.composio_api_key)
             logger.info("OAuthManager initialized with Composio")
         except Exception as e:
             logger.error(f"Failed to initialize Composio: {e}")
@@ -75,6 +84,9 @@ class OAuthManager:
             
             logger.info(f"Initiating connection for {service} (user: {user_id})")
             
+            # The status is about to change; stop serving the cached one
+            self.status_cache.invalidate(user_id, service)
+            
             # Official Composio method from documentation
             connection_request = self.composio.connected_accounts.initiate(
                 user_id=user_id,
@@ -160,18 +172,34 @@ class OAuthManager:
     def check_connection(
         self,
         service: str,
-        entity_id: str
+        entity_id: str,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Check if service is connected for user
         
+        Answered from the connection status cache while fresh.
+        
         Args:
             service: Service name ('gmail', 'calendar', 'sheets')
             entity_id: User's entity ID
+            use_cache: Serve a cached status if available
             
         Returns:
             Connection status and details
         """
+        if use_cache:
+            cached = self.status_cache.get(entity_id, service)
+            if cached is not None:
+                return cached
+        
+        status = self._query_connection(service, entity_id)
+        self.status_cache.set(entity_id, service, status)
+        return status
+    
+    
+    def _query_connection(self, service: str, entity_id: str) -> Dict[str, Any]:
+        """Ask Composio whether a service is connected (uncached)"""
         if not self.composio:
             return {'connected': False, 'error': 'Composio not initialized'}
         
@@ -238,12 +266,18 @@ class OAuthManager:
     
     
     def get_all_connections(self, entity_id: str) -> Dict[str, Any]:
-        """Get all service connections for a user"""
+        """Get all service connections for a user (checked concurrently)"""
         services = ['gmail', 'calendar', 'sheets']
-        connections = {}
+        connections = {service: self.status_cache.get(entity_id, service) for service in services}
         
-        for service in services:
-            connections[service] = self.check_connection(service, entity_id)
+        # Only cache misses reach Composio, in parallel
+        missing = [service for service, status in connections.items() if status is None]
+        if missing:
+            with ThreadPoolExecutor(len(missing), thread_name_prefix="oauth-status") as pool:
+                results = pool.map(
+                    lambda service: self.check_connection(service, entity_id, use_cache=False), missing
+                )
+                connections.update(zip(missing, results))
         
         return {
             'entity_id': entity_id,
@@ -3,14 +3,13 @@ Google Sheets Integration - Person 4
 """
 from typing import List, Dict, Any
 import logging
-from composio import Composio
-from core.config import settings
+from .composio_client import get_composio_client
 
 logger = logging.getLogger(__name__)
 
 class SheetsIntegration:
     def __init__(self, composio_client=None):
-        self.composio = composio_client or Composio(api_key=settings.COMPOSIO_API_KEY)
+        self.composio = composio_client or get_composio_client()
     
     def push_candidate_to_sheet(self, entity_id: str, spreadsheet_id: str,
                                candidate_data: Dict[str, Any], sheet_name: str = "Candidates"):
@@ -0,0 +1,90 @@
+"""
+Parser Backend Registry
+
+Person 2: Resume Extraction - parser backends
+Resolves the optional parser libraries (pdfplumber, PyPDF2, python-docx)
+once per process and caches the result, so extraction never re-attempts a
+failed import and the first request does not pay the import cost when
+warm_up() runs at startup
+"""
+
+from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from types import ModuleType
+import importlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# Backend name -> importable module
+BACKEND_MODULES = {
+    'pdfplumber': 'pdfplumber',
+    'pypdf2': 'PyPDF2',
+    'docx': 'docx',
+}
+
+# Preference order per file type
+PDF_BACKENDS = ('pdfplumber', 'pypdf2')
+# Adaptive PDF extraction: cheapest first, layout-aware last
+PDF_FAST_FIRST = ('pypdf2', 'pdfplumber')
+DOCX_BACKENDS = ('docx',)
+
+
+@lru_cache(maxsize=None)
+def load_backend(name: str) -> Optional[ModuleType]:
+    """
+    Import a parser backend once
+
+    Args:
+        name: Key of BACKEND_MODULES
+
+    Returns:
+        The imported module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module(BACKEND_MODULES[name])
+    except ImportError:
+        logger.warning(f"Parser backend not installed: {BACKEND_MODULES[name]}")
+        return None
+
+
+def resolve_backend(preference: Tuple[str, ...]) -> Optional[Tuple[str, ModuleType]]:
+    """
+    Pick the first installed backend from a preference list
+
+    Args:
+        preference: Backend names, best first (e.g. PDF_BACKENDS)
+
+    Returns:
+        (name, module) or None if none is installed
+    """
+    for name in preference:
+        module = load_backend(name)
+        if module is not None:
+            return name, module
+    return None
+
+
+def warm_up() -> Dict[str, bool]:
+    """
+    Import every parser backend and compile the skill matcher
+
+    Call from the app startup hook so the first extraction is not slowed
+    down by imports and regex compilation.
+
+    Returns:
+        Backend name -> installed
+    """
+    from .taxonomy import get_taxonomy
+
+    started = time.monotonic()
+    available = {name: load_backend(name) is not None for name in BACKEND_MODULES}
+    get_taxonomy().matcher
+
+    logger.info(
+        f"Parser backends warmed up in {time.monotonic() - started:.2f}s: "
+        f"{', '.join(name for name, ok in available.items() if ok) or 'none'}"
+    )
+    return available
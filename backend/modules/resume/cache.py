@@ -0,0 +1,208 @@
+"""
+Extraction Cache Module
+
+Person 2: Resume Extraction - content-hash cache
+Persistent cache of extracted candidate JSON keyed by the SHA-256 of the
+resume bytes plus the extractor and skill taxonomy versions, so a resume
+that arrives again (reapplication, forward, re-fetched Gmail message) is
+never re-parsed, while a parser or taxonomy change rebuilds it
+
+Stored in SQLite with size-bounded LRU eviction
+"""
+
+from typing import Dict, Any, Optional
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+from core.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest of resume bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Content-addressed extraction cache
+
+    Entries are evicted least-recently-used first once the stored payloads
+    exceed max_bytes. Safe to share between threads, and reopens its
+    connection in forked pool workers instead of reusing the parent's.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Open (or create) the cache database
+
+        Args:
+            db_path: SQLite database file
+            max_bytes: Upper bound on total cached payload size
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._open()
+
+        logger.info(f"ExtractionCache opened at {self.db_path}")
+
+
+    def _open(self):
+        """Open the SQLite connection for the current process"""
+        self._pid = os.getpid()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                content_hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_accessed REAL NOT NULL,
+                PRIMARY KEY (content_hash, version)
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extraction_cache_lru ON extraction_cache (last_accessed)"
+        )
+        # Running payload total, so a put does not have to sum the table
+        self._total = self._stored_bytes()
+
+
+    def _stored_bytes(self) -> int:
+        """Exact total payload size currently stored"""
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM extraction_cache").fetchone()[0]
+
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection for this process (SQLite handles must not cross a fork)"""
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._open()
+        return self._conn
+
+
+    def get(self, digest: str, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached candidate JSON
+
+        Args:
+            digest: content_hash() of the resume bytes
+            version: Extractor version the entry was built with
+
+        Returns:
+            Candidate JSON, or None on a miss
+        """
+        conn = self._connection()
+        with self._lock:
+            row = conn.execute(
+                "SELECT payload FROM extraction_cache WHERE content_hash = ? AND version = ?",
+                (digest, version)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE extraction_cache SET last_accessed = ? WHERE content_hash = ? AND version = ?",
+                (time.time(), digest, version)
+            )
+
+        logger.info(f"Extraction cache hit: {digest[:12]}")
+        return json.loads(row[0])
+
+
+    def put(self, digest: str, version: str, candidate_json: Dict[str, Any]):
+        """
+        Store a candidate JSON and evict old entries if over budget
+
+        Args:
+            digest: content_hash() of the resume bytes
+            version: Extractor version that built candidate_json
+            candidate_json: Extraction result
+        """
+        payload = json.dumps(candidate_json)
+        size = len(payload.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        conn = self._connection()
+        with self._lock:
+            row = conn.execute(
+                "SELECT size FROM extraction_cache WHERE content_hash = ? AND version = ?",
+                (digest, version)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO extraction_cache VALUES (?, ?, ?, ?, ?)",
+                (digest, version, payload, size, time.time())
+            )
+            self._total += size - (row[0] if row else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+
+
+    def _evict(self, batch: int = 64):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        # Other processes write to the same file; only trust the exact sum here
+        self._total = self._stored_bytes()
+
+        evicted = 0
+        while self._total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT content_hash, version, size FROM extraction_cache ORDER BY last_accessed LIMIT ?",
+                (batch,)
+            ).fetchall()
+            if not rows:
+                break
+            for digest, version, size in rows:
+                if self._total <= self.max_bytes:
+                    break
+                self._conn.execute(
+                    "DELETE FROM extraction_cache WHERE content_hash = ? AND version = ?",
+                    (digest, version)
+                )
+                self._total -= size
+                evicted += 1
+
+        if evicted:
+            logger.info(f"Extraction cache evicted {evicted} entries")
+
+
+    def clear(self):
+        """Remove every cached entry"""
+        conn = self._connection()
+        with self._lock:
+            conn.execute("DELETE FROM extraction_cache")
+            self._total = 0
+
+
+@lru_cache(maxsize=None)
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """
+    Return the process-wide extraction cache, or None when disabled
+
+    Configured with EXTRACTION_CACHE_ENABLED, EXTRACTION_CACHE_PATH and
+    EXTRACTION_CACHE_MAX_MB.
+    """
+    if not get_setting("EXTRACTION_CACHE_ENABLED", True):
+        return None
+
+    try:
+        return ExtractionCache(
+            db_path=get_setting("EXTRACTION_CACHE_PATH", "data/cache/extraction_cache.db"),
+            max_bytes=get_setting("EXTRACTION_CACHE_MAX_MB", 256) * 1024 * 1024
+        )
+    except Exception as e:
+        logger.warning(f"Extraction cache unavailable: {e}")
+        return None
@@ -0,0 +1,417 @@
+"""
+Candidate Repository Module
+
+Person 2: Candidate storage
+Finalized candidates are stored in an embedded SQLite database
+(DATABASE_URL) instead of being read back by globbing and parsing every
+JSON file in the candidates directory. Each row keeps the full candidate
+as a JSON column next to indexed columns (user, email, status, created
+time), so listing, filtering and counting never parse unrelated
+candidates
+
+Lists use keyset pagination: a page ends with an opaque cursor encoding
+the (created_at, id) of its last row, and the next page seeks past it
+through the index, so page 1000 costs the same as page 1. Field
+projection (fields=["name", "email"]) is done by SQLite's JSON functions,
+so only the requested fields leave the database
+
+Candidate JSON files written before this module existed are imported
+once per directory (backfill), for every user at startup (backfill_data_dir)
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+import base64
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import logging
+
+from core.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_STATUS = 'new'
+
+_FIELD = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def sqlite_path(database_url: str) -> str:
+    """
+    SQLite file path of a DATABASE_URL
+
+    Args:
+        database_url: e.g. sqlite:///./recruitment.db
+
+    Raises:
+        ValueError: If the URL is not a SQLite URL
+    """
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix):
+        raise ValueError(f"Candidate repository needs a sqlite:/// DATABASE_URL, got {database_url!r}")
+    return database_url[len(prefix):]
+
+
+def encode_cursor(created_at: float, row_id: int) -> str:
+    """Opaque page cursor for the row a page ended on"""
+    return base64.urlsafe_b64encode(json.dumps([created_at, row_id]).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Inverse of encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return float(created_at), int(row_id)
+    except (ValueError, TypeError, UnicodeEncodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+class CandidateRepository:
+    """
+    SQLite-backed candidate store
+
+    Safe to share between threads; reopens its connection in forked
+    worker processes.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the candidate database
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._open()
+
+        logger.info(f"CandidateRepository opened at {self.db_path}")
+
+
+    def _open(self):
+        """Open the SQLite connection for the current process"""
+        self._pid = os.getpid()
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS candidates (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                candidate_id TEXT NOT NULL,
+                email TEXT,
+                name TEXT,
+                status TEXT NOT NULL,
+                data TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                UNIQUE (user_id, candidate_id)
+            )
+        """)
+        for name, columns in (
+            ("email", "email"),
+            ("created", "created_at, id"),
+            ("user_created", "user_id, created_at, id"),
+            ("status_created", "status, created_at, id"),
+        ):
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_candidates_{name} ON candidates ({columns})")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS candidate_backfills (
+                user_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                imported INTEGER NOT NULL,
+                finished_at REAL NOT NULL,
+                PRIMARY KEY (user_id, source)
+            )
+        """)
+
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection for this process (SQLite handles must not cross a fork)"""
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._open()
+        return self._conn
+
+
+    @staticmethod
+    def _row_values(candidate: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], str]:
+        """Indexed column values (email, name, data) of a candidate"""
+        email = candidate.get('email') or None
+        return (email.lower() if email else None), candidate.get('name'), json.dumps(candidate)
+
+
+    def upsert(self, user_id: str, candidate_id: str, candidate: Dict[str, Any]):
+        """
+        Store a candidate, replacing an earlier version with the same ID
+
+        The created time and status of an existing candidate are kept
+        unless the candidate carries its own "status".
+
+        Args:
+            user_id: Owner of the candidate
+            candidate_id: Candidate ID (see GmailMonitor.save_candidate)
+            candidate: Finalized candidate JSON
+        """
+        now = time.time()
+        email, name, data = self._row_values(candidate)
+        status = candidate.get('status')
+
+        conn = self._connection()
+        with self._lock:
+            conn.execute(
+                """
+                INSERT INTO candidates
+                    (user_id, candidate_id, email, name, status, data, created_at, updated_at)
+                VALUES (?, ?, ?, ?, COALESCE(?, ?), ?, ?, ?)
+                ON CONFLICT (user_id, candidate_id) DO UPDATE SET
+                    email = excluded.email, name = excluded.name, data = excluded.data,
+                    status = COALESCE(?, candidates.status), updated_at = excluded.updated_at
+                """,
+                (user_id, candidate_id, email, name, status, DEFAULT_STATUS, data, now, now, status)
+            )
+
+
+    def get(self, user_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
+        """
+        One candidate
+
+        Returns:
+            Candidate JSON with its "id" and "status", or None
+        """
+        conn = self._connection()
+        with self._lock:
+            row = conn.execute(
+                "SELECT candidate_id, status, data FROM candidates WHERE user_id = ? AND candidate_id = ?",
+                (user_id, candidate_id)
+            ).fetchone()
+        return self._candidate(row) if row else None
+
+
+    def set_status(self, user_id: str, candidate_id: str, status: str) -> bool:
+        """
+        Move a candidate to a new status (e.g. 'scored', 'shortlisted')
+
+        Returns:
+            True if the candidate exists
+        """
+        conn = self._connection()
+        with self._lock:
+            cursor = conn.execute(
+                "UPDATE candidates SET status = ?, updated_at = ? WHERE user_id = ? AND candidate_id = ?",
+                (status, time.time(), user_id, candidate_id)
+            )
+        return cursor.rowcount > 0
+
+
+    @staticmethod
+    def _filters(user_id: Optional[str], status: Optional[str], email: Optional[str]) -> Tuple[List[str], List[Any]]:
+        """WHERE clauses and parameters of the list filters"""
+        clauses, params = [], []
+        for column, value in (("user_id", user_id), ("status", status), ("email", email and email.lower())):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return clauses, params
+
+
+    @staticmethod
+    def _candidate(row: sqlite3.Row) -> Dict[str, Any]:
+        """Row -> candidate JSON with its "id" and "status" """
+        candidate = json.loads(row['data'])
+        candidate['id'] = row['candidate_id']
+        candidate['status'] = row['status']
+        return candidate
+
+
+    def list(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        email: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One page of candidates, newest first
+
+        Args:
+            user_id: Only this user's candidates (None = all users)
+            status: Only candidates with this status
+            email: Only candidates with this email (case-insensitive)
+            limit: Page size
+            cursor: next_cursor of the previous page (None = first page)
+            fields: Top-level candidate fields to return (None = all);
+                "id" is always included
+
+        Returns:
+            (candidates, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor or a field name is invalid
+        """
+        clauses, params = self._filters(user_id, status, email)
+        if cursor is not None:
+            clauses.append("(created_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+
+        if fields is None:
+            projection = "data"
+        else:
+            fields = [field for field in dict.fromkeys(fields) if field != 'id']
+            invalid = [field for field in fields if not _FIELD.match(field)]
+            if invalid:
+                raise ValueError(f"Invalid field names: {invalid}")
+            if fields:
+                projection = "json_object(" + ", ".join(
+                    f"'{field}', json_extract(data, '$.{field}')" for field in fields
+                ) + ") AS data"
+            else:
+                projection = "'{}' AS data"
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self._connection()
+        with self._lock:
+            rows = conn.execute(
+                f"SELECT id, candidate_id, status, created_at, {projection} FROM candidates {where} "
+                "ORDER BY created_at DESC, id DESC LIMIT ?",
+                params + [limit + 1]
+            ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]['created_at'], rows[-1]['id'])
+
+        if fields is None:
+            return [self._candidate(row) for row in rows], next_cursor
+
+        candidates = []
+        for row in rows:
+            candidate = {'id': row['candidate_id']}
+            candidate.update(json.loads(row['data']))
+            if 'status' in fields:
+                candidate['status'] = row['status']
+            candidates.append(candidate)
+        return candidates, next_cursor
+
+
+    def count(self, user_id: Optional[str] = None, status: Optional[str] = None,
+              email: Optional[str] = None) -> int:
+        """Number of candidates matching the list filters"""
+        clauses, params = self._filters(user_id, status, email)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self._connection()
+        with self._lock:
+            return conn.execute(f"SELECT COUNT(*) FROM candidates {where}", params).fetchone()[0]
+
+
+    def backfill(self, candidates_dir: Path, user_id: str, force: bool = False) -> int:
+        """
+        Import candidate JSON files written before the repository existed
+
+        Runs once per (user, directory); later calls return immediately.
+        Candidates already in the repository are left alone, and a file's
+        modification time becomes its created time.
+
+        Args:
+            candidates_dir: Directory of <candidate_id>.json files
+            user_id: Owner of the candidates
+            force: Scan the directory again even if it was imported before
+
+        Returns:
+            Number of candidates imported
+        """
+        source = str(Path(candidates_dir).resolve())
+        conn = self._connection()
+        if not force:
+            with self._lock:
+                done = conn.execute(
+                    "SELECT 1 FROM candidate_backfills WHERE user_id = ? AND source = ?", (user_id, source)
+                ).fetchone()
+            if done:
+                return 0
+
+        rows = []
+        for file_path in Path(candidates_dir).glob("*.json"):
+            try:
+                with open(file_path, 'r') as f:
+                    candidate = json.load(f)
+                created_at = file_path.stat().st_mtime
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable candidate file {file_path}: {e}")
+                continue
+            if not isinstance(candidate, dict):
+                continue
+            candidate.pop('id', None)
+            email, name, data = self._row_values(candidate)
+            rows.append((user_id, file_path.stem, email, name, candidate.get('status') or DEFAULT_STATUS,
+                         data, created_at, created_at))
+
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = conn.total_changes
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO candidates
+                        (user_id, candidate_id, email, name, status, data, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows
+                )
+                imported = conn.total_changes - before
+                conn.execute(
+                    "INSERT OR REPLACE INTO candidate_backfills VALUES (?, ?, ?, ?)",
+                    (user_id, source, imported, time.time())
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        if imported:
+            logger.info(f"Imported {imported} candidate file(s) from {candidates_dir} for {user_id}")
+        return imported
+
+
+    def backfill_data_dir(self, data_dir: Path) -> int:
+        """
+        Import every legacy candidate directory under a data directory
+
+        <data_dir>/candidates belongs to the "default" user and
+        <data_dir>/users/<user_id>/candidates to that user. Directories
+        imported before are skipped (see backfill).
+
+        Args:
+            data_dir: Root data directory (./data)
+
+        Returns:
+            Number of candidates imported
+        """
+        data_dir = Path(data_dir)
+        sources = [(data_dir / "candidates", "default")]
+        sources += [(path, path.parent.name) for path in sorted(data_dir.glob("users/*/candidates"))]
+        return sum(self.backfill(path, user_id) for path, user_id in sources if path.is_dir())
+
+
+@lru_cache(maxsize=None)
+def get_candidate_repository() -> CandidateRepository:
+    """Return the process-wide candidate repository (DATABASE_URL)"""
+    return CandidateRepository(sqlite_path(get_setting("DATABASE_URL", "sqlite:///./recruitment.db")))
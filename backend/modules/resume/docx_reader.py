@@ -0,0 +1,151 @@
+"""
+Streaming DOCX Reader Module
+
+Person 2: Resume Extraction - DOCX text
+Reads DOCX text straight from the zip parts with an incremental XML parser,
+in document order and including tables, headers and footers, without
+building the python-docx object model. Elements are cleared as soon as
+their text is taken, so memory stays flat on large documents
+"""
+
+from typing import BinaryIO, Iterator, List, Optional, Union
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_PARAGRAPH = _W + 'p'
+_TEXT = _W + 't'
+_TAB = _W + 'tab'
+_BREAK = _W + 'br'
+_CELL = _W + 'tc'
+_ROW = _W + 'tr'
+_TABLE = _W + 'tbl'
+
+BODY_PART = 'word/document.xml'
+_HEADER_PART = re.compile(r'^word/header\d*\.xml$')
+_FOOTER_PART = re.compile(r'^word/footer\d*\.xml$')
+
+# Separator between the cells of one table row
+CELL_SEPARATOR = ' | '
+
+
+def iter_part_lines(part: BinaryIO) -> Iterator[str]:
+    """
+    Yield the text lines of one WordprocessingML part in document order
+
+    Every paragraph outside a table is one line; a paragraph in a text box
+    is its own line, before the paragraph holding the box. A table row
+    becomes one line with its cells joined by CELL_SEPARATOR, so
+    "Skills | Python, SQL" stays together.
+
+    Args:
+        part: Open XML part (e.g. from ZipFile.open)
+
+    Yields:
+        Text lines (empty paragraphs yield empty strings)
+    """
+    # One run buffer per open paragraph: a text box inside a paragraph
+    # holds paragraphs of its own
+    runs: List[List[str]] = []
+    # One entry per open table: the cells of its current row, and the
+    # paragraphs of the current cell
+    rows: List[List[str]] = []
+    cells: List[List[str]] = []
+
+    for event, elem in ET.iterparse(part, events=('start', 'end')):
+        tag = elem.tag
+
+        if event == 'start':
+            if tag == _TABLE:
+                rows.append([])
+                cells.append([])
+            elif tag == _PARAGRAPH:
+                runs.append([])
+            continue
+
+        if tag == _TEXT and runs:
+            runs[-1].append(elem.text or '')
+        elif tag == _TAB and runs:
+            runs[-1].append('\t')
+        elif tag == _BREAK and runs:
+            runs[-1].append('\n')
+        elif tag == _PARAGRAPH and runs:
+            text = ''.join(runs.pop())
+            if cells:
+                cells[-1].append(text)
+            else:
+                yield text
+            elem.clear()
+        elif tag == _CELL and cells:
+            rows[-1].append(' '.join(p for p in cells[-1] if p))
+            cells[-1] = []
+            elem.clear()
+        elif tag == _ROW and rows:
+            line = CELL_SEPARATOR.join(cell for cell in rows[-1] if cell)
+            rows[-1] = []
+            if len(rows) > 1:
+                # Nested table: the row belongs to the enclosing cell
+                cells[-2].append(line)
+            elif line:
+                yield line
+            elem.clear()
+        elif tag == _TABLE and rows:
+            rows.pop()
+            cells.pop()
+            elem.clear()
+
+
+def read_docx_text(source: Union[str, BinaryIO], max_chars: Optional[int] = None) -> str:
+    """
+    Extract DOCX text in a single streaming pass
+
+    Order: headers, body (paragraphs and tables), footers. Header and
+    footer lines repeated across sections are kept once.
+
+    Args:
+        source: Path or binary stream of a DOCX file
+        max_chars: Stop once this much text is gathered (None = no limit)
+
+    Returns:
+        Extracted text
+
+    Raises:
+        KeyError: If the archive has no word/document.xml
+        zipfile.BadZipFile, ET.ParseError: If the file is not a valid DOCX
+    """
+    lines: List[str] = []
+    total_chars = 0
+
+    with zipfile.ZipFile(source) as archive:
+        names = archive.namelist()
+        if BODY_PART not in names:
+            raise KeyError(f"{BODY_PART} not found in archive")
+
+        parts = (
+            sorted(name for name in names if _HEADER_PART.match(name)) +
+            [BODY_PART] +
+            sorted(name for name in names if _FOOTER_PART.match(name))
+        )
+        seen_margin_lines = set()
+
+        for name in parts:
+            is_margin = name != BODY_PART
+            with archive.open(name) as part:
+                for line in iter_part_lines(part):
+                    if is_margin:
+                        if not line.strip() or line in seen_margin_lines:
+                            continue
+                        seen_margin_lines.add(line)
+
+                    lines.append(line)
+                    total_chars += len(line) + 1
+                    if max_chars and total_chars >= max_chars:
+                        logger.info(f"Character budget reached in {name}")
+                        return '\n'.join(lines)[:max_chars]
+
+    return '\n'.join(lines)
@@ -11,6 +11,8 @@ import os
 import logging
 from datetime import datetime
 
+from .taxonomy import get_taxonomy
+
 logger = logging.getLogger(__name__)
 
 
@@ -117,10 +119,13 @@ class ResumeEnricher:
         mock_enriched_skills = []
         
         # Simulate finding additional skills from LinkedIn
-        if 'python' in [s.lower() for s in candidate_json.get('skills', [])]:
+        taxonomy = get_taxonomy()
+        skill_ids = {taxonomy.canonical_id(s) for s in candidate_json.get('skills', [])}
+        
+        if 'python' in skill_ids:
             mock_enriched_skills.extend(['FastAPI', 'SQLAlchemy', 'Pytest'])
         
-        if 'javascript' in [s.lower() for s in candidate_json.get('skills', [])]:
+        if 'javascript' in skill_ids:
             mock_enriched_skills.extend(['TypeScript', 'React Hooks', 'Next.js'])
         
         return {
@@ -195,9 +200,10 @@ Focus on related technologies, frameworks, and professional competencies."""
             # Call Gemini
             response = model.generate_content(prompt)
             
-            # Parse response
+            # Parse response (canonical names so "Aws" and "AWS" dedupe)
             enriched_skills = [s.strip() for s in response.text.split(',')]
-            enriched_skills = [s for s in enriched_skills if s and len(s) < 50][:10]
+            enriched_skills = [s for s in enriched_skills if s and len(s) < 50]
+            enriched_skills = get_taxonomy().normalize_skills(enriched_skills)[:10]
             
             logger.info(f"Gemini enrichment added {len(enriched_skills)} skills")
             
@@ -226,27 +232,13 @@ Focus on related technologies, frameworks, and professional competencies."""
         """
         logger.info("Performing LLM-based skill inference...")
         
+        taxonomy = get_taxonomy()
         enriched_skills = []
-        existing_skills = [s.lower() for s in candidate_json.get('skills', [])]
-        
-        # Skill inference rules (in production, use LLM)
-        skill_relationships = {
-            'python': ['Django', 'FastAPI', 'Pandas', 'NumPy', 'Pytest'],
-            'javascript': ['TypeScript', 'React', 'Node.js', 'npm', 'Webpack'],
-            'react': ['Redux', 'React Router', 'JSX', 'Hooks'],
-            'django': ['Django REST Framework', 'Celery', 'PostgreSQL'],
-            'fastapi': ['Pydantic', 'SQLAlchemy', 'Alembic', 'Uvicorn'],
-            'aws': ['EC2', 'S3', 'Lambda', 'RDS', 'CloudFormation'],
-            'docker': ['Docker Compose', 'Kubernetes', 'Container Orchestration'],
-            'sql': ['Database Design', 'Query Optimization', 'Indexing'],
-            'machine learning': ['Scikit-learn', 'Feature Engineering', 'Model Evaluation'],
-        }
+        existing_skills = candidate_json.get('skills', [])
         
-        # Infer related skills
+        # Infer related skills from the shared taxonomy
         for skill in existing_skills:
-            if skill in skill_relationships:
-                related = skill_relationships[skill]
-                enriched_skills.extend(related)
+            enriched_skills.extend(taxonomy.related(skill))
         
         # Infer soft skills from job titles
         experience = candidate_json.get('experience', [])
@@ -263,8 +255,11 @@ Focus on related technologies, frameworks, and professional competencies."""
                 enriched_skills.extend(['System Design', 'Architecture Patterns', 'Technical Documentation'])
         
         # Deduplicate and filter out already existing skills
-        enriched_skills = list(set(enriched_skills))
-        enriched_skills = [s for s in enriched_skills if s.lower() not in existing_skills]
+        existing_keys = {taxonomy.canonical_id(s) or s.lower() for s in existing_skills}
+        enriched_skills = [
+            s for s in taxonomy.normalize_skills(enriched_skills)
+            if (taxonomy.canonical_id(s) or s.lower()) not in existing_keys
+        ]
         
         logger.info(f"LLM inference added {len(enriched_skills)} new skills")
         
@@ -300,8 +295,8 @@ Focus on related technologies, frameworks, and professional competencies."""
         existing_enriched = merged.get('enriched_skills', [])
         new_enriched = enriched_data.get('enriched_skills', [])
         
-        # Deduplicate
-        all_enriched = list(set(existing_enriched + new_enriched))
+        # Deduplicate on canonical skill names
+        all_enriched = get_taxonomy().normalize_skills(existing_enriched + new_enriched)
         merged['enriched_skills'] = all_enriched
         
         # Add any other enrichment data to metadata
@@ -6,128 +6,385 @@ Extract structured data from resume files (PDF, DOCX, TXT)
 Returns standardized candidate JSON for Person 3 (Scoring Engine)
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple, Union, BinaryIO
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+import codecs
+import hashlib
+import io
 import os
 import re
+import signal
+import threading
+import time
+import zipfile
 import logging
 from datetime import datetime
 
+from core.patterns import PHONE_FORMATTING, find_email, find_phone, find_year
+from core.utils import get_setting
+from .backends import DOCX_BACKENDS, PDF_BACKENDS, PDF_FAST_FIRST, load_backend, resolve_backend
+from .cache import ExtractionCache, content_hash, get_extraction_cache
+from .docx_reader import read_docx_text
+from .sections import ResumeSections, segment_resume
+from .taxonomy import SkillTaxonomy, get_taxonomy
+
 logger = logging.getLogger(__name__)
 
+# A resume to parse: a path on disk, raw bytes, or a binary file-like object
+ResumeSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+
+class ResumeTooLargeError(ValueError):
+    """Resume exceeds a size limit (file size or decompressed DOCX size)"""
+
+
+class UnsupportedFormatError(ValueError):
+    """Resume file type has no parser"""
+
+
+def max_resume_bytes() -> int:
+    """Largest resume accepted for extraction (MAX_RESUME_MB, 0 = no limit)"""
+    return int(get_setting("MAX_RESUME_MB", 10.0) * 1024 * 1024)
+
+
+# Bump whenever parsing changes so cached extractions are rebuilt
+EXTRACTOR_VERSION = "7"
+
+# PDF text quality thresholds: above these the fast backend's output is
+# rejected and the layout-aware backend is tried
+PDF_MAX_EMPTY_PAGE_RATIO = 0.5
+PDF_MAX_GARBLED_RATIO = 0.05
+
+# DOCX archives are rejected when they inflate beyond these limits (zip bombs)
+DOCX_MAX_UNCOMPRESSED_BYTES = 50 * 1024 * 1024
+DOCX_MAX_COMPRESSION_RATIO = 100
+
+# Unmapped glyphs ("(cid:12)"), replacement characters and control codes
+_GARBLED_PATTERN = re.compile(r'\(cid:\d+\)|[\ufffd\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Degree keywords (education) and job title keywords (experience)
+_DEGREE_PATTERN = re.compile(
+    r'(?<!\w)(?:bachelor|master|phd|doctorate|b\.s\.|m\.s\.|b\.a\.|m\.a\.|b\.tech|m\.tech|mba|associate)',
+    re.IGNORECASE
+)
+_JOB_TITLE_PATTERN = re.compile(
+    r'engineer|developer|manager|analyst|designer|consultant',
+    re.IGNORECASE
+)
+
 
 class ResumeExtractor:
     """
     Resume Text and Data Extractor
     
-    TODO: Implement extraction from multiple formats
+    Extracts candidate JSON from PDF, DOCX and TXT resumes, given as file
+    paths or in-memory bytes. Batches run in parallel (extract_many), and
+    results are reused by content hash when a cache is given.
     """
     
-    def __init__(self):
-        """Initialize Resume Extractor"""
+    def __init__(
+        self,
+        taxonomy: Optional[SkillTaxonomy] = None,
+        cache: Optional[ExtractionCache] = None,
+        max_bytes: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ):
+        """
+        Initialize Resume Extractor
+        
+        Args:
+            taxonomy: Skill taxonomy (default: shared process-wide taxonomy)
+            cache: Content-hash extraction cache (default: no caching)
+            max_bytes: Largest resume accepted (default: MAX_RESUME_MB, 0 = no limit)
+            max_chars: Character budget per resume (default: EXTRACTION_MAX_CHARS, 0 = no limit)
+            time_budget: Seconds spent reading one PDF (default:
+                EXTRACTION_TIME_BUDGET_SECONDS, 0 = no limit)
+        """
         self.supported_formats = ['.pdf', '.docx', '.txt']
+        self.taxonomy = taxonomy or get_taxonomy()
+        self.cache = cache
+        self.max_bytes = max_resume_bytes() if max_bytes is None else max_bytes
+        self.max_chars = get_setting("EXTRACTION_MAX_CHARS", 100_000) if max_chars is None else max_chars
+        self.time_budget = (get_setting("EXTRACTION_TIME_BUDGET_SECONDS", 30.0)
+                            if time_budget is None else time_budget)
+    
+    
+    @property
+    def cache_version(self) -> str:
+        """Cache key version: parser version plus the skill taxonomy's content hash"""
+        return f"{EXTRACTOR_VERSION}-{self.taxonomy.version}"
+    
+    
+    def iter_pdf_pages(
+        self,
+        file_path: ResumeSource,
+        max_pages: Optional[int] = None,
+        backend: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Yield the text of a PDF one page at a time
+        
+        Only the current page is held in memory; stopping iteration early
+        skips parsing of the remaining pages.
+        
+        Args:
+            file_path: Path to PDF file, PDF bytes or binary stream
+            max_pages: Stop after this many pages (None = all pages)
+            backend: PDF backend name (default: best installed one)
+            
+        Yields:
+            Text of each page (empty string for pages without a text layer)
+        """
+        resolved = resolve_backend((backend,) if backend else PDF_BACKENDS)
+        if resolved is None:
+            logger.error("Neither pdfplumber nor PyPDF2 installed")
+            return
+        name, module = resolved
+        
+        if name == 'pdfplumber':
+            with module.open(_as_stream(file_path)) as pdf:
+                for page in pdf.pages[:max_pages]:
+                    yield page.extract_text() or ""
+                    # Release the parsed layout objects of this page
+                    page.flush_cache()
+            return
+        
+        pdf_reader = module.PdfReader(_as_stream(file_path))
+        for index, page in enumerate(pdf_reader.pages):
+            if max_pages is not None and index >= max_pages:
+                break
+            yield page.extract_text() or ""
     
     
-    def extract_text_from_pdf(self, file_path: str) -> str:
+    def extract_text_from_pdf(
+        self,
+        file_path: ResumeSource,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        backend: Optional[str] = None
+    ) -> str:
         """
         Extract raw text from PDF file
         
+        Stops early once the page, character or time budget is spent, so a
+        huge portfolio PDF costs no more than a normal resume.
+        
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, PDF bytes or binary stream
+            max_pages: Page budget (default: PDF_MAX_PAGES)
+            max_chars: Character budget (default: EXTRACTION_MAX_CHARS)
+            backend: PDF backend name (default: best installed one)
             
         Returns:
             Extracted raw text
         """
-        logger.info(f"Extracting text from PDF: {file_path}")
+        logger.info(f"Extracting text from PDF: {_describe(file_path)}")
         
         try:
-            # Try with pdfplumber first (better for structured PDFs)
-            try:
-                import pdfplumber
-                text = ""
-                with pdfplumber.open(file_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                logger.info(f"Extracted {len(text)} characters using pdfplumber")
-                return text
-            except ImportError:
-                logger.warning("pdfplumber not installed, falling back to PyPDF2")
-            
-            # Fallback to PyPDF2
-            try:
-                import PyPDF2
-                text = ""
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-                logger.info(f"Extracted {len(text)} characters using PyPDF2")
-                return text
-            except ImportError:
-                logger.error("Neither pdfplumber nor PyPDF2 installed")
-                return ""
-                
+            pages = self._read_pdf_pages(file_path, max_pages, max_chars, backend)
         except Exception as e:
             logger.error(f"Error extracting PDF text: {e}")
             return ""
+        
+        return self._join_pages(pages, max_chars)
+    
+    
+    def extract_pdf_adaptive(
+        self,
+        file_path: ResumeSource,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Extract PDF text with the fastest backend that gives usable text
+        
+        Tries PyPDF2 first and escalates to pdfplumber's layout-aware
+        extraction only when the parse fails or the text looks bad (mostly
+        empty pages, too many garbled characters).
+        
+        Args:
+            file_path: Path to PDF file, PDF bytes or binary stream
+            max_pages: Page budget (default: PDF_MAX_PAGES)
+            max_chars: Character budget (default: EXTRACTION_MAX_CHARS)
+            
+        Returns:
+            (text, backend name that produced it or None if all failed)
+        """
+        logger.info(f"Extracting text from PDF: {_describe(file_path)}")
+        
+        best: Tuple[List[str], Optional[str]] = ([], None)
+        for backend in PDF_FAST_FIRST:
+            if load_backend(backend) is None:
+                continue
+            try:
+                pages = self._read_pdf_pages(file_path, max_pages, max_chars, backend)
+            except Exception as e:
+                logger.warning(f"PDF backend {backend} failed, escalating: {e}")
+                continue
+            
+            if pdf_text_quality_ok(pages):
+                best = (pages, backend)
+                break
+            logger.info(f"PDF backend {backend} gave low-quality text, escalating")
+            # Keep a poor result only until something better comes along
+            if best[1] is None or _printable_chars(pages) > _printable_chars(best[0]):
+                best = (pages, backend)
+        
+        pages, backend = best
+        logger.info(f"PDF backend used: {backend}")
+        return self._join_pages(pages, max_chars), backend
+    
+    
+    def _read_pdf_pages(
+        self,
+        file_path: ResumeSource,
+        max_pages: Optional[int],
+        max_chars: Optional[int],
+        backend: Optional[str]
+    ) -> List[str]:
+        """
+        Per-page text within the page, character and time budgets (raises on parse errors)
+        
+        In a process's main thread (pool workers, scripts) the time budget
+        also interrupts a page that is still being parsed, keeping the pages
+        read so far. Elsewhere it is only checked between pages, so one
+        pathological page can run past it there.
+        """
+        if max_pages is None:
+            max_pages = get_setting("PDF_MAX_PAGES", 20)
+        if max_chars is None:
+            max_chars = self.max_chars
+        time_budget = self.time_budget
+        
+        parts = []
+        total_chars = 0
+        started = time.monotonic()
+        pages = self.iter_pdf_pages(file_path, max_pages=max_pages or None, backend=backend)
+        
+        try:
+            with _deadline(time_budget):
+                for page_text in pages:
+                    parts.append(page_text)
+                    total_chars += len(page_text) + 1
+                    
+                    if max_chars and total_chars >= max_chars:
+                        logger.info(f"Character budget reached after {len(parts)} pages")
+                        break
+                    if time_budget and time.monotonic() - started > time_budget:
+                        logger.warning(f"Time budget exceeded after {len(parts)} pages: {_describe(file_path)}")
+                        break
+        except _DeadlineExceeded:
+            logger.warning(f"Time budget exceeded reading page {len(parts) + 1}: {_describe(file_path)}")
+        finally:
+            pages.close()
+        
+        return parts
+    
     
+    def _join_pages(self, parts: List[str], max_chars: Optional[int]) -> str:
+        """Join page texts, truncated to the character budget"""
+        if max_chars is None:
+            max_chars = self.max_chars
+        
+        text = "".join(page_text + "\n" for page_text in parts if page_text)
+        if max_chars:
+            text = text[:max_chars]
+        
+        logger.info(f"Extracted {len(text)} characters from {len(parts)} pages")
+        return text
     
-    def extract_text_from_docx(self, file_path: str) -> str:
+    
+    def extract_text_from_docx(self, file_path: ResumeSource) -> str:
         """
         Extract raw text from DOCX file
         
+        Streams word/document.xml (plus headers and footers) so text in
+        tables and page headers is kept; python-docx is only used as a
+        fallback when the streaming reader cannot parse the file.
+        
         Args:
-            file_path: Path to DOCX file
+            file_path: Path to DOCX file, DOCX bytes or binary stream
             
         Returns:
-            Extracted raw text
+            Extracted raw text (truncated to EXTRACTION_MAX_CHARS)
+            
+        Raises:
+            ResumeTooLargeError: If the archive would inflate past the DOCX limits
         """
-        logger.info(f"Extracting text from DOCX: {file_path}")
+        logger.info(f"Extracting text from DOCX: {_describe(file_path)}")
+        
+        check_docx_archive(file_path)
+        max_chars = self.max_chars
         
         try:
-            import docx
-            doc = docx.Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
+            text = read_docx_text(_as_stream(file_path), max_chars=max_chars or None)
             logger.info(f"Extracted {len(text)} characters from DOCX")
             return text
-        except ImportError:
+        except Exception as e:
+            logger.warning(f"Streaming DOCX reader failed, trying python-docx: {e}")
+        
+        resolved = resolve_backend(DOCX_BACKENDS)
+        if resolved is None:
             logger.error("python-docx not installed")
             return ""
+        
+        try:
+            doc = resolved[1].Document(_as_stream(file_path))
+            
+            # Stop joining paragraphs once the character budget is spent
+            parts = []
+            total_chars = 0
+            for paragraph in doc.paragraphs:
+                parts.append(paragraph.text)
+                total_chars += len(paragraph.text) + 1
+                if max_chars and total_chars >= max_chars:
+                    logger.info(f"Character budget reached after {len(parts)} paragraphs")
+                    break
+            
+            text = "\n".join(parts)
+            if max_chars:
+                text = text[:max_chars]
+            logger.info(f"Extracted {len(text)} characters from DOCX")
+            return text
         except Exception as e:
             logger.error(f"Error extracting DOCX text: {e}")
             return ""
     
     
-    def extract_text_from_txt(self, file_path: str) -> str:
+    def extract_text_from_txt(self, file_path: ResumeSource) -> str:
         """
         Extract text from TXT file
         
         Args:
-            file_path: Path to TXT file
+            file_path: Path to TXT file, raw bytes or binary stream
             
         Returns:
             File content
         """
-        logger.info(f"Reading text file: {file_path}")
+        logger.info(f"Reading text file: {_describe(file_path)}")
+        
+        # Read no more bytes than the character budget can use (UTF-8: up to 4 per char)
+        max_chars = self.max_chars
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            logger.info(f"Read {len(text)} characters from TXT")
-            return text
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                with open(file_path, 'r', encoding='latin-1') as f:
-                    text = f.read()
-                return text
-            except Exception as e:
-                logger.error(f"Error reading TXT file: {e}")
-                return ""
+            data = _read_bytes(file_path, limit=max_chars * 4 if max_chars else None)
         except Exception as e:
             logger.error(f"Error reading TXT file: {e}")
             return ""
+        
+        try:
+            # Not final: a multi-byte character cut off by the limit is dropped
+            text = codecs.getincrementaldecoder('utf-8')().decode(data)
+        except UnicodeDecodeError:
+            # Try with different encoding
+            text = str(data, 'latin-1')
+        
+        if max_chars:
+            text = text[:max_chars]
+        logger.info(f"Read {len(text)} characters from TXT")
+        return text
     
     
     def extract_from_file(self, file_path: str) -> Dict[str, Any]:
@@ -148,18 +405,132 @@ class ResumeExtractor:
         """
         logger.info(f"Processing resume file: {file_path}")
         
-        # Step 1: Extract text
+        self._check_format(file_path)
+        self.check_size(file_path)
+        
+        # With a cache, read the file once: the same buffer is hashed and parsed
+        data = self._read_file(file_path) if self.cache is not None else None
+        digest = content_hash(data) if data is not None else None
+        if digest:
+            # Same bytes were extracted before: skip parsing entirely
+            cached = self.cache.get(digest, self.cache_version)
+            if cached is not None:
+                return cached
+        
+        if data is None:
+            candidate_json = self._extract_file(file_path)
+        else:
+            candidate_json = self._extract_source(data, os.path.splitext(file_path)[1].lower())
+        
+        if digest and candidate_json:
+            self.cache.put(digest, self.cache_version, candidate_json)
+        
+        return candidate_json
+    
+    
+    def extract_from_bytes(
+        self,
+        data: Union[bytes, bytearray, memoryview, BinaryIO],
+        filename: str
+    ) -> Dict[str, Any]:
+        """
+        Extract a resume held in memory (e.g. an upload's bytes), without
+        writing it to a file of our own
+        
+        Args:
+            data: Resume bytes, memoryview or binary file-like object
+            filename: Original file name (its extension selects the parser)
+            
+        Returns:
+            Standardized candidate JSON
+        """
+        logger.info(f"Processing resume upload: {filename}")
+        
+        self._check_format(filename)
+        self.check_size(data, filename)
+        
+        digest = _digest_source(data) if self.cache is not None else None
+        if digest:
+            cached = self.cache.get(digest, self.cache_version)
+            if cached is not None:
+                return cached
+        
+        candidate_json = self._extract_source(data, os.path.splitext(filename)[1].lower())
+        
+        if digest and candidate_json:
+            self.cache.put(digest, self.cache_version, candidate_json)
+        
+        return candidate_json
+    
+    
+    def _check_format(self, file_path: str):
+        """Raise UnsupportedFormatError for file types we cannot parse"""
         file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in self.supported_formats:
+            logger.error(f"Unsupported file format: {file_ext}")
+            raise UnsupportedFormatError(f"Unsupported file format: {file_ext}")
+    
+    
+    def check_size(self, source: ResumeSource, name: Optional[str] = None):
+        """
+        Reject a resume larger than max_bytes before any work is done
         
+        Args:
+            source: Path, bytes or binary stream
+            name: Name for the error message (default: the path)
+            
+        Raises:
+            ResumeTooLargeError: If the resume is over the limit
+        """
+        limit = self.max_bytes
+        if not limit:
+            return
+        
+        try:
+            size = _source_size(source)
+        except OSError:
+            return  # Missing files are reported by the reader
+        
+        if size > limit:
+            name = name or _describe(source)
+            logger.warning(f"Rejecting oversized resume {name}: {size} bytes")
+            raise ResumeTooLargeError(f"Resume too large: {name} is {size} bytes (limit {limit})")
+    
+    
+    def _read_file(self, file_path: str) -> Optional[bytes]:
+        """Bytes of a size-checked file, or None if it cannot be read"""
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except OSError as e:
+            logger.warning(f"Cannot read {file_path}: {e}")
+            return None
+    
+    
+    def _digest_file(self, file_path: str) -> Optional[str]:
+        """Content hash of a size-checked file, or None if it cannot be read"""
+        data = self._read_file(file_path)
+        return content_hash(data) if data is not None else None
+    
+    
+    def _extract_file(self, file_path: str) -> Dict[str, Any]:
+        """Extract a resume file without consulting the cache"""
+        return self._extract_source(file_path, os.path.splitext(file_path)[1].lower())
+    
+    
+    def _extract_source(self, file_path: ResumeSource, file_ext: str) -> Dict[str, Any]:
+        """Extract a size-checked resume from a path, bytes or stream without consulting the cache"""
+        # Step 1: Extract text
+        pdf_backend = None
         if file_ext == '.pdf':
-            text = self.extract_text_from_pdf(file_path)
+            text, pdf_backend = self.extract_pdf_adaptive(file_path)
         elif file_ext == '.docx':
             text = self.extract_text_from_docx(file_path)
         elif file_ext == '.txt':
             text = self.extract_text_from_txt(file_path)
         else:
             logger.error(f"Unsupported file format: {file_ext}")
-            raise ValueError(f"Unsupported file format: {file_ext}")
+            raise UnsupportedFormatError(f"Unsupported file format: {file_ext}")
         
         if not text:
             logger.error("No text extracted from file")
@@ -173,10 +544,143 @@ class ResumeExtractor:
         
         # Step 4: Build standardized JSON
         candidate_json = self.build_candidate_json(cleaned_data)
+        if pdf_backend:
+            candidate_json['metadata']['pdf_backend'] = pdf_backend
         
         return candidate_json
     
     
+    def extract_many(
+        self,
+        file_paths: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Extract many resume files in parallel across a process pool
+        
+        PDF parsing is CPU-bound, so files are fanned out over worker
+        processes in chunks. Cache hits are answered without the pool.
+        Errors are captured per file; one bad file never aborts the batch.
+        
+        Args:
+            file_paths: Paths to resume files
+            workers: Worker processes (default: EXTRACTION_WORKERS, 0 = CPU count)
+            chunksize: Files sent to a worker at a time (default: ~4 chunks per worker)
+            ordered: Yield results in input order (True) or as they complete (False)
+            
+        Yields:
+            {"index", "file_path", "candidate", "error"} per input file
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return
+        
+        # Serve size rejections and cache hits here; only misses are sent to the pool
+        ready: Dict[int, Dict[str, Any]] = {}
+        digests: Dict[int, str] = {}
+        
+        for index, file_path in enumerate(file_paths):
+            try:
+                self.check_size(file_path)
+            except ResumeTooLargeError as e:
+                ready[index] = {"index": index, "file_path": file_path, "candidate": None, "error": str(e)}
+                continue
+            
+            if self.cache is None:
+                continue
+            digest = self._digest_file(file_path)
+            if not digest:
+                continue
+            digests[index] = digest
+            cached = self.cache.get(digest, self.cache_version)
+            if cached is not None:
+                ready[index] = {"index": index, "file_path": file_path, "candidate": cached, "error": None}
+        
+        misses = [index for index in range(len(file_paths)) if index not in ready]
+        next_index = 0
+        
+        if not ordered:
+            yield from ready.values()
+            ready = {}
+        
+        for position, result in self._extract_in_pool(
+            [file_paths[index] for index in misses], workers, chunksize, ordered
+        ):
+            index = misses[position]
+            result = {"index": index, **result}
+            
+            if result['candidate'] and index in digests:
+                self.cache.put(digests[index], self.cache_version, result['candidate'])
+            
+            if not ordered:
+                yield result
+                continue
+            
+            # Release results in input order, interleaving cache hits
+            ready[index] = result
+            while next_index in ready:
+                yield ready.pop(next_index)
+                next_index += 1
+        
+        while next_index in ready:
+            yield ready.pop(next_index)
+            next_index += 1
+    
+    
+    def _extract_in_pool(
+        self,
+        file_paths: List[str],
+        workers: Optional[int],
+        chunksize: Optional[int],
+        ordered: bool
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Extract files across worker processes, yielding (position, result)"""
+        if not file_paths:
+            return
+        
+        if workers is None:
+            workers = get_setting("EXTRACTION_WORKERS", 0)
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        
+        # Not worth paying for process startup
+        if workers <= 1:
+            for position, file_path in enumerate(file_paths):
+                yield position, _extract_one(self, file_path)
+            return
+        
+        if not chunksize:
+            chunksize = max(1, len(file_paths) // (workers * 4))
+        
+        chunks = [
+            (start, file_paths[start:start + chunksize])
+            for start in range(0, len(file_paths), chunksize)
+        ]
+        
+        logger.info(f"Extracting {len(file_paths)} files with {workers} workers ({len(chunks)} chunks)")
+        
+        # Workers rebuild this extractor's configuration, so pooled results
+        # match serial ones and are cached under the right version
+        taxonomy_entries = None if self.taxonomy is get_taxonomy() else self.taxonomy.entries
+        initargs = (taxonomy_entries, self.max_bytes, self.max_chars, self.time_budget)
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+            futures = {pool.submit(_extract_chunk, chunk): (start, chunk) for start, chunk in chunks}
+            
+            for future in (futures if ordered else as_completed(futures)):
+                start, chunk = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # Worker crashed: report every file of the chunk as failed
+                    logger.error(f"Extraction worker failed: {e}")
+                    results = [{"file_path": path, "candidate": None, "error": str(e)} for path in chunk]
+                
+                for offset, result in enumerate(results):
+                    yield start + offset, result
+    
+    
     def extract_email(self, text: str) -> str:
         """
         Extract email address from text
@@ -187,9 +691,7 @@ class ResumeExtractor:
         Returns:
             Email address or empty string
         """
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else ""
+        return find_email(text) or ""
     
     
     def extract_phone(self, text: str) -> str:
@@ -202,33 +704,25 @@ class ResumeExtractor:
         Returns:
             Phone number or empty string
         """
-        # Patterns for various phone formats
-        patterns = [
-            r'\b\d{10}\b',  # 1234567890
-            r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # 123-456-7890
-            r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}',  # (123) 456-7890
-            r'\+\d{1,3}\s*\d{10}',  # +1 1234567890
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return matches[0]
-        
-        return ""
+        # Formats tried in order of precedence (see core.patterns)
+        return find_phone(text) or ""
     
     
-    def extract_name(self, text: str) -> str:
+    def extract_name(self, text: str, sections: Optional[ResumeSections] = None) -> str:
         """
         Extract candidate name (usually first line or after "Name:")
         
         Args:
             text: Resume text
+            sections: Pre-segmented resume (segmented here if not given)
             
         Returns:
             Candidate name
         """
-        lines = text.split('\n')
+        sections = sections or segment_resume(text)
+        
+        # The name lives in the header block above the first section heading
+        lines = sections.header or sections.lines
         
         # Try to find name after "Name:" label
         for line in lines[:10]:  # Check first 10 lines
@@ -256,116 +750,80 @@ class ResumeExtractor:
         Returns:
             List of identified skills
         """
-        # Common technical skills to look for
-        skill_keywords = [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust',
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring',
-            'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'redis',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins',
-            'git', 'agile', 'scrum', 'jira', 'ci/cd',
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
-            'data analysis', 'pandas', 'numpy', 'matplotlib',
-            'html', 'css', 'sass', 'bootstrap', 'tailwind',
-            'rest api', 'graphql', 'microservices', 'websockets',
-            'linux', 'bash', 'shell scripting'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in skill_keywords:
-            if skill in text_lower:
-                found_skills.append(skill.title())
-        
-        # Deduplicate
-        found_skills = list(set(found_skills))
+        # Single pass over the text with the taxonomy's precompiled matcher;
+        # aliases resolve to canonical display names ("AWS", "Node.js")
+        found_skills = self.taxonomy.find_skills(text)
         
         logger.info(f"Extracted {len(found_skills)} skills")
         return found_skills
     
     
-    def extract_education(self, text: str) -> List[Dict[str, str]]:
+    def extract_education(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, str]]:
         """
         Extract education information
         
         Args:
             text: Resume text
+            sections: Pre-segmented resume (segmented here if not given)
             
         Returns:
             List of education entries
         """
+        sections = sections or segment_resume(text)
         education = []
         
-        # Look for degree keywords
-        degrees = ['bachelor', 'master', 'phd', 'doctorate', 'b.s.', 'm.s.', 'b.a.', 'm.a.', 
-                   'b.tech', 'm.tech', 'mba', 'associate']
+        # Scope to the Education section when the resume has one
+        lines = sections.get('education') or sections.lines
         
-        lines = text.split('\n')
         for i, line in enumerate(lines):
-            line_lower = line.lower()
-            for degree in degrees:
-                if degree in line_lower:
-                    # Try to get institution (usually next line)
-                    institution = lines[i + 1].strip() if i + 1 < len(lines) else ""
-                    
-                    education.append({
-                        "degree": line.strip(),
-                        "institution": institution,
-                        "year": self._extract_year(line + " " + institution)
-                    })
+            if _DEGREE_PATTERN.search(line):
+                # Try to get institution (usually next line)
+                institution = lines[i + 1].strip() if i + 1 < len(lines) else ""
+                
+                education.append({
+                    "degree": line.strip(),
+                    "institution": institution,
+                    "year": self._extract_year(line + " " + institution)
+                })
+                
+                if len(education) == 3:  # Return max 3 education entries
                     break
         
-        return education[:3]  # Return max 3 education entries
+        return education
     
     
     def _extract_year(self, text: str) -> str:
         """Extract year from text (e.g., 2020, 2018-2022)"""
-        year_pattern = r'\b(19|20)\d{2}\b'
-        matches = re.findall(year_pattern, text)
-        return matches[0] if matches else ""
+        return find_year(text) or ""
     
     
-    def extract_experience(self, text: str) -> List[Dict[str, str]]:
+    def extract_experience(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, str]]:
         """
         Extract work experience
         
         Args:
             text: Resume text
+            sections: Pre-segmented resume (segmented here if not given)
             
         Returns:
             List of experience entries
         """
+        sections = sections or segment_resume(text)
         experience = []
         
-        # Find "Experience" section
-        exp_section = ""
-        lines = text.split('\n')
-        in_exp_section = False
-        
-        for line in lines:
-            if 'experience' in line.lower() and len(line) < 30:
-                in_exp_section = True
-                continue
-            
-            if in_exp_section:
-                # Stop at next section (Education, Skills, etc.)
-                if any(keyword in line.lower() for keyword in ['education', 'skills', 'projects', 'certifications']):
-                    break
-                exp_section += line + "\n"
-        
         # Simple extraction: look for job titles and companies
-        job_titles = ['engineer', 'developer', 'manager', 'analyst', 'designer', 'consultant']
-        
-        for i, line in enumerate(exp_section.split('\n')):
-            line_lower = line.lower()
-            if any(title in line_lower for title in job_titles):
+        for line in sections.get('experience'):
+            if _JOB_TITLE_PATTERN.search(line):
                 experience.append({
                     "title": line.strip(),
                     "company": "",  # TODO: Extract company name
                     "duration": self._extract_year(line)
                 })
+                
+                if len(experience) == 5:  # Return max 5 experiences
+                    break
         
-        return experience[:5]  # Return max 5 experiences
+        return experience
     
     
     def extract_fields(self, text: str) -> Dict[str, Any]:
@@ -380,13 +838,16 @@ class ResumeExtractor:
         """
         logger.info("Parsing resume fields...")
         
+        # Split into sections once; section-based extractors share it
+        sections = segment_resume(text)
+        
         fields = {
-            "name": self.extract_name(text),
+            "name": self.extract_name(text, sections),
             "email": self.extract_email(text),
             "phone": self.extract_phone(text),
             "skills": self.extract_skills(text),
-            "education": self.extract_education(text),
-            "experience": self.extract_experience(text),
+            "education": self.extract_education(text, sections),
+            "experience": self.extract_experience(text, sections),
             "raw_text": text
         }
         
@@ -419,11 +880,11 @@ class ResumeExtractor:
         # Clean phone
         if cleaned.get('phone'):
             # Remove formatting, keep digits only
-            cleaned['phone'] = re.sub(r'[^\d+]', '', cleaned['phone'])
+            cleaned['phone'] = PHONE_FORMATTING.sub('', cleaned['phone'])
         
-        # Deduplicate skills
+        # Canonicalize and deduplicate skills
         if cleaned.get('skills'):
-            cleaned['skills'] = list(set(cleaned['skills']))
+            cleaned['skills'] = self.taxonomy.normalize_skills(cleaned['skills'])
         
         return cleaned
     
@@ -477,3 +938,219 @@ class ResumeExtractor:
         
         logger.info(f"Built candidate JSON for: {candidate_json['name']}")
         return candidate_json
+
+
+class _DeadlineExceeded(Exception):
+    """Raised inside a PDF page parse that ran past the time budget"""
+
+
+@contextmanager
+def _deadline(seconds: Optional[float]):
+    """
+    Raise _DeadlineExceeded in the running code once seconds have passed
+    
+    Uses SIGALRM, so it only arms in the main thread on platforms with
+    setitimer; elsewhere it does nothing.
+    """
+    if (not seconds or not hasattr(signal, 'setitimer')
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+    
+    def expire(signum, frame):
+        raise _DeadlineExceeded()
+    
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def pdf_text_quality_ok(pages: List[str]) -> bool:
+    """
+    Cheap check that per-page PDF text is usable
+    
+    Args:
+        pages: Text of each page read so far
+        
+    Returns:
+        False if most pages are empty or too much of the text is garbled
+    """
+    if not pages:
+        return False
+    
+    empty = sum(1 for page in pages if not page.strip())
+    if empty / len(pages) > PDF_MAX_EMPTY_PAGE_RATIO:
+        return False
+    
+    text = "".join(pages)
+    garbled = sum(len(match) for match in _GARBLED_PATTERN.findall(text))
+    return garbled / max(len(text), 1) <= PDF_MAX_GARBLED_RATIO
+
+
+def _printable_chars(pages: List[str]) -> int:
+    """Amount of non-whitespace text across pages"""
+    return sum(len("".join(page.split())) for page in pages)
+
+
+def _as_stream(source: ResumeSource) -> Union[str, BinaryIO]:
+    """Path or binary stream for parsers that accept either (pdfplumber, python-docx)"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if not isinstance(source, (str, os.PathLike)):
+        source.seek(0)
+    return source
+
+
+def _read_bytes(source: ResumeSource, limit: Optional[int] = None) -> Union[bytes, bytearray, memoryview]:
+    """Content of a path, bytes or stream (at most limit bytes)"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return memoryview(source)[:limit] if limit else source
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return f.read(limit or -1)
+    source.seek(0)
+    return source.read(limit or -1)
+
+
+def _source_size(source: ResumeSource) -> int:
+    """Size in bytes of a path, bytes or stream without reading it"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return memoryview(source).nbytes
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    position = source.tell()
+    size = source.seek(0, os.SEEK_END)
+    source.seek(position)
+    return size
+
+
+def check_docx_archive(source: ResumeSource):
+    """
+    Reject DOCX archives that would inflate to an unreasonable size
+    
+    Only the zip central directory is read, so a decompression bomb is
+    caught before anything is decompressed.
+    
+    Args:
+        source: Path, bytes or binary stream of a DOCX file
+        
+    Raises:
+        ResumeTooLargeError: If the total or per-member inflated size is suspicious
+    """
+    try:
+        with zipfile.ZipFile(_as_stream(source)) as archive:
+            members = archive.infolist()
+    except zipfile.BadZipFile:
+        return  # Not a zip; the DOCX parser reports it
+    
+    total = sum(member.file_size for member in members)
+    if total > DOCX_MAX_UNCOMPRESSED_BYTES:
+        raise ResumeTooLargeError(f"DOCX inflates to {total} bytes (limit {DOCX_MAX_UNCOMPRESSED_BYTES})")
+    
+    for member in members:
+        if member.file_size > 1024 * 1024 and member.file_size > member.compress_size * DOCX_MAX_COMPRESSION_RATIO:
+            raise ResumeTooLargeError(
+                f"DOCX member {member.filename} has a suspicious compression ratio "
+                f"({member.file_size} / {member.compress_size} bytes)"
+            )
+
+
+def _digest_source(source: Union[bytes, bytearray, memoryview, BinaryIO]) -> str:
+    """content_hash() of in-memory bytes or a stream, hashed in 1 MB chunks"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return content_hash(source)
+    digest = hashlib.sha256()
+    source.seek(0)
+    for chunk in iter(lambda: source.read(1024 * 1024), b''):
+        digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def _describe(source: ResumeSource) -> str:
+    """Log-friendly name of a resume source"""
+    if isinstance(source, (str, os.PathLike)):
+        return str(source)
+    return f"<{type(source).__name__}>"
+
+
+# ============================================================================
+# Process pool workers (module level so they can be pickled)
+# ============================================================================
+
+_worker_extractor: Optional[ResumeExtractor] = None
+_cached_worker_extractors: Dict[Optional[str], ResumeExtractor] = {}
+
+
+def _extract_one(extractor: ResumeExtractor, file_path: str) -> Dict[str, Any]:
+    """Extract a single file (cache already checked by the caller), capturing any error"""
+    try:
+        return {"file_path": file_path, "candidate": extractor._extract_file(file_path), "error": None}
+    except Exception as e:
+        logger.error(f"Error extracting {file_path}: {e}")
+        return {"file_path": file_path, "candidate": None, "error": str(e)}
+
+
+def _init_worker(
+    taxonomy_entries: Optional[Dict[str, Dict[str, Any]]],
+    max_bytes: int,
+    max_chars: int,
+    time_budget: float
+):
+    """Pool initializer: build this process's extractor with the parent's taxonomy and limits"""
+    global _worker_extractor
+    taxonomy = SkillTaxonomy(taxonomy_entries) if taxonomy_entries is not None else None
+    _worker_extractor = ResumeExtractor(taxonomy=taxonomy, max_bytes=max_bytes, max_chars=max_chars,
+                                        time_budget=time_budget)
+
+
+def _extract_chunk(file_paths: List[str]) -> List[Dict[str, Any]]:
+    """Extract a chunk of files inside a pool worker (one extractor per process)"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = ResumeExtractor()
+    return [_extract_one(_worker_extractor, file_path) for file_path in file_paths]
+
+
+def _get_cached_worker_extractor(cache_path: Optional[str] = None) -> ResumeExtractor:
+    """Per-process extractor backed by the extraction cache at cache_path (default: the shared one)"""
+    extractor = _cached_worker_extractors.get(cache_path)
+    if extractor is None:
+        cache = ExtractionCache(cache_path) if cache_path else get_extraction_cache()
+        extractor = _cached_worker_extractors[cache_path] = ResumeExtractor(cache=cache)
+    return extractor
+
+
+def extract_resume_file(file_path: str, cache_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extract a single file inside a pool worker, using the extraction cache
+
+    Entry point for async endpoints that offload extraction to a process pool.
+
+    Args:
+        file_path: Path to resume file
+        cache_path: Extraction cache database to use (default: the shared
+            EXTRACTION_CACHE_PATH one)
+
+    Returns:
+        Candidate JSON
+    """
+    return _get_cached_worker_extractor(cache_path).extract_from_file(file_path)
+
+
+def extract_resume_bytes(data: bytes, filename: str) -> Dict[str, Any]:
+    """
+    Extract an in-memory resume inside a pool worker, using the extraction cache
+
+    Args:
+        data: Resume bytes
+        filename: Original file name (selects the parser)
+
+    Returns:
+        Candidate JSON
+    """
+    return _get_cached_worker_extractor().extract_from_bytes(data, filename)
@@ -10,6 +10,8 @@ from typing import Dict, Any, List
 import logging
 from datetime import datetime
 
+from .taxonomy import get_taxonomy
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,7 +101,7 @@ class ResumeFormatter:
         all_skills = []
         all_skills.extend(candidate_json.get('skills', []))
         all_skills.extend(candidate_json.get('enriched_skills', []))
-        all_skills = list(set(all_skills))  # Deduplicate
+        all_skills = get_taxonomy().normalize_skills(all_skills)  # Deduplicate
         
         if all_skills:
             parts.append(f"Skills: {', '.join(all_skills)}")
@@ -8,15 +8,15 @@ This module:
 1. Polls Gmail inbox for resume-related emails (or responds to webhooks)
 2. Downloads resume attachments
 3. Runs extractor → enricher → formatter pipeline
-4. Saves candidate JSON to /data/candidates/
+4. Saves candidate JSON to the candidate repository
 5. Calls Person 5's pipeline endpoint to trigger scoring
 """
 
 from typing import Dict, Any, List, Optional
 import os
-import json
 import logging
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -32,33 +32,71 @@ class GmailMonitor:
     - Person 5's pipeline endpoint
     """
     
-    def __init__(self, data_dir: str = "./data"):
+    def __init__(
+        self,
+        data_dir: str = "./data",
+        gmail=None,
+        user_id: str = "default",
+        repository=None,
+        cache=None,
+        ledger=None,
+        queue=None
+    ):
         """
         Initialize Gmail Monitor
         
         Args:
             data_dir: Directory to save candidate data
+            gmail: GmailIntegration to poll with (default: one created on
+                first use, sharing the process-wide Composio client)
+            user_id: Owner of candidates saved outside a mail sync (mail
+                syncs save under the user_id they are called with)
+            repository: CandidateRepository (default: the DATABASE_URL one)
+            cache: ExtractionCache (default: the process-wide one, if enabled)
+            ledger: GmailSyncLedger (default: the process-wide one)
+            queue: IngestionJobQueue (default: the process-wide one)
         """
         self.data_dir = Path(data_dir)
         self.resumes_dir = self.data_dir / "resumes"
-        self.candidates_dir = self.data_dir / "candidates"
         
         # Create directories
         self.resumes_dir.mkdir(parents=True, exist_ok=True)
-        self.candidates_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize Person 2 pipeline components
-        from .extractor import ResumeExtractor
+        from .cache import get_extraction_cache
+        from .extractor import ResumeExtractor, extract_resume_file
         from .enricher import ResumeEnricher
         from .formatter import ResumeFormatter
         
-        self.extractor = ResumeExtractor()
+        self.extractor = ResumeExtractor(cache=cache or get_extraction_cache())
+        # Extraction runs in pool workers, which open an injected cache by path
+        self._extract = partial(extract_resume_file, cache_path=str(cache.db_path)) if cache else extract_resume_file
         self.enricher = ResumeEnricher()
         self.formatter = ResumeFormatter()
         
+        # Candidates are read from the repository (older JSON files are
+        # imported at startup, see CandidateRepository.backfill_data_dir)
+        from .candidate_store import get_candidate_repository
+        
+        self.user_id = user_id
+        self.repository = repository or get_candidate_repository()
+        
+        self._gmail = gmail
+        self._ledger = ledger
+        self._queue = queue
+        
         logger.info("GmailMonitor initialized")
     
     
+    @property
+    def gmail(self):
+        """Gmail integration, reused across polls"""
+        if self._gmail is None:
+            from modules.integrations.gmail import GmailIntegration
+            self._gmail = GmailIntegration()
+        return self._gmail
+    
+    
     def start_monitoring(self, user_id: str, check_interval: int = 300):
         """
         Start monitoring Gmail for new resumes
@@ -72,9 +110,9 @@ class GmailMonitor:
         logger.info(f"Starting Gmail monitor for user: {user_id}")
         logger.info(f"Check interval: {check_interval} seconds")
         
-        # NOTE: In production, this would be triggered by:
-        # - APScheduler cron job (already configured in tasks/scheduler.py)
-        # - Gmail webhook (push notifications)
+        # NOTE: In production, this is triggered by:
+        # - APScheduler job (tasks/scheduler.py; a safety net when push is on)
+        # - Gmail push notifications (modules/resume/gmail_push.py)
         # - Manual API call from frontend
         
         # For now, this is called by the check_new_resume_emails task
@@ -85,6 +123,15 @@ class GmailMonitor:
         """
         Check Gmail for new resume emails and process them
         
+        Every resume attachment of every email is processed. Real Gmail
+        polls are incremental: only messages newer than the user's sync
+        cursor are fetched, and messages already in the sync ledger are
+        skipped. Their attachments go into the durable ingestion queue
+        (see modules.resume.job_queue), which is then drained for this
+        user, including jobs left over from an earlier crash or retry.
+        Mock data (only when use_mock is set) runs through the in-memory
+        pipeline instead. A failed poll processes nothing.
+        
         Args:
             user_id: Composio user ID
             use_mock: Use mock data for testing
@@ -94,60 +141,197 @@ class GmailMonitor:
         """
         logger.info(f"Checking for new resume emails (mock={use_mock})...")
         
-        # Import Gmail integration (Person 4's work)
-        from modules.integrations.gmail import GmailIntegration
+        # Gmail integration (Person 4's work)
+        from modules.integrations.gmail_sync import get_gmail_sync_ledger
+        from .ingest import QueueIngestionPipeline, shared_extraction_pool
+        from .job_queue import attachment_job_key, get_ingestion_queue
         
-        gmail = GmailIntegration()
+        gmail = self.gmail
         
-        # Get new resume emails
-        emails = gmail.check_for_new_resumes(user_id, use_mock=use_mock)
+        if use_mock:
+            return self._process_in_memory(user_id, gmail.check_for_new_resumes(user_id, use_mock=True))
         
-        processed_candidates = []
+        # List new resume emails; attachments are downloaded by the pipeline
+        ledger = self._ledger or get_gmail_sync_ledger()
+        emails = gmail.list_resume_messages(
+            user_id, since=ledger.get_cursor(user_id), resume=ledger.get_next_page(user_id)
+        )
         
+        if emails is None:
+            # Nothing recorded, so the next poll lists the same messages again
+            logger.warning(f"Gmail poll failed for {user_id}; sync not recorded")
+            return []
+        
+        seen = ledger.processed_ids(user_id, (email['message_id'] for email in emails))
+        emails = [email for email in emails if email['message_id'] not in seen]
+        logger.info(f"Skipping {len(seen)} already processed messages")
+        
+        # Once queued, the queue owns retries, so every listed message counts as handled
+        queue = self._queue or get_ingestion_queue()
+        queued = 0
         for email in emails:
-            try:
-                # Process each email
-                candidate = self.handle_resume_email(email)
-                if candidate:
-                    processed_candidates.append(candidate)
-            except Exception as e:
-                logger.error(f"Error processing email {email.get('id')}: {e}")
+            email_info = {key: value for key, value in email.items() if key != 'attachments'}
+            for attachment in email.get('attachments', []):
+                key = attachment_job_key(user_id, email['message_id'], attachment['attachment_id'])
+                queued += queue.enqueue(key, user_id, {'email': email_info, 'attachment': attachment})
+        self._record_sync(ledger, user_id, emails, set(), gmail.last_fetch_complete, gmail.last_next_page)
+        logger.info(f"Queued {queued} resume attachments from {len(emails)} emails")
+        
+        def download(payload):
+            return gmail.download_attachment(user_id, payload['email']['message_id'], payload['attachment'])
+        
+        def finish(payload, extracted):
+            attachment = dict(payload['attachment'], file_path=payload['file_path'])
+            return self.handle_resume_attachment(payload['email'], attachment, extracted=extracted, user_id=user_id)
+        
+        processed_candidates = []
+        pipeline = QueueIngestionPipeline(download=download, extract=self._extract, finish=finish,
+                                          extract_pool=shared_extraction_pool())
+        for outcome in pipeline.drain(queue, user_id):
+            if outcome.error:
+                logger.error(f"Gave up on {outcome.job['attachment'].get('filename')} "
+                             f"from email {outcome.job['email'].get('id')}: {outcome.error}")
+            else:
+                processed_candidates.append(outcome.result)
         
         logger.info(f"Processed {len(processed_candidates)} new candidates")
         return processed_candidates
     
     
-    def handle_resume_email(self, email: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _process_in_memory(self, user_id: str, emails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Process a single resume email
+        Run already downloaded emails through the in-memory pipeline
         
-        Pipeline:
-        1. Download attachment
-        2. Extract data
-        3. Enrich data
-        4. Format data
-        5. Save candidate JSON
-        6. Notify Person 5's pipeline
+        Used for mock data, which is neither synced nor queued.
+        """
+        from .ingest import IngestionPipeline, shared_extraction_pool
+        
+        def download(job):
+            email, attachment = job
+            return attachment.get('file_path')
+        
+        def finish(job, extracted):
+            email, attachment = job
+            return self.handle_resume_attachment(email, attachment, extracted=extracted, user_id=user_id)
+        
+        jobs = [(email, attachment) for email in emails for attachment in email.get('attachments', [])]
+        logger.info(f"Processing {len(jobs)} resume attachments from {len(emails)} emails")
+        
+        processed_candidates = []
+        pipeline = IngestionPipeline(download=download, extract=self._extract, finish=finish,
+                                     extract_pool=shared_extraction_pool())
+        for outcome in pipeline.run(jobs):
+            email, attachment = outcome.job
+            if outcome.error:
+                logger.error(f"Error processing {attachment.get('filename')} "
+                             f"from email {email.get('id')}: {outcome.error}")
+            else:
+                processed_candidates.append(outcome.result)
+        
+        logger.info(f"Processed {len(processed_candidates)} new candidates")
+        return processed_candidates
+    
+    
+    def _record_sync(
+        self,
+        ledger,
+        user_id: str,
+        emails: List[Dict[str, Any]],
+        retry: set,
+        complete: bool,
+        next_page: Optional[Dict[str, str]] = None
+    ):
+        """
+        Mark handled messages in the sync ledger and advance the user's cursor
+        
+        The cursor never passes a message that still needs a retry, and only
+        moves when every result page was read, so nothing is skipped. An
+        unfinished listing is continued from next_page by the next poll; the
+        cursor then moves when that poll reaches the last page (to the newest
+        message it saw, so earlier pages are re-listed once and deduplicated
+        by the ledger rather than skipped).
+        """
+        done = [email for email in emails if email['message_id'] not in retry]
+        ledger.mark_processed(user_id, [email['message_id'] for email in done])
+        ledger.set_next_page(user_id, None if complete else next_page)
+        
+        if not complete:
+            return
+        
+        retry_times = [email['timestamp'] for email in emails
+                       if email['message_id'] in retry and email.get('timestamp')]
+        done_times = [email['timestamp'] for email in done if email.get('timestamp')]
+        if retry_times:
+            done_times = [t for t in done_times if t < min(retry_times)]
+        if done_times:
+            ledger.advance_cursor(user_id, max(done_times))
+    
+    
+    def handle_resume_email(
+        self,
+        email: Dict[str, Any],
+        extracted: Optional[Dict[str, Dict[str, Any]]] = None,
+        user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process every resume attachment of a single email, one after another
         
         Args:
-            email: Email data from Gmail integration
+            email: Email data from Gmail integration (attachments already downloaded)
+            extracted: Candidate JSON keyed by file path, for attachments
+                already extracted (e.g. by extract_many)
+            user_id: Owner of the candidates (default: the monitor's user)
             
         Returns:
-            Processed candidate JSON or None if failed
+            Processed candidate JSONs (failed attachments are skipped)
         """
         logger.info(f"Processing resume email: {email.get('subject')}")
         
-        # Get attachment info
         attachments = email.get('attachments', [])
         
         if not attachments:
             logger.warning("No attachments found in email")
-            return None
+            return []
         
-        # Process first resume attachment
-        # TODO: Handle multiple attachments
-        attachment = attachments[0]
+        candidates = []
+        for attachment in attachments:
+            candidate = self.handle_resume_attachment(
+                email,
+                attachment,
+                extracted=(extracted or {}).get(attachment.get('file_path')),
+                user_id=user_id
+            )
+            if candidate:
+                candidates.append(candidate)
+        return candidates
+    
+    
+    def handle_resume_attachment(
+        self,
+        email: Dict[str, Any],
+        attachment: Dict[str, Any],
+        extracted: Optional[Dict[str, Any]] = None,
+        user_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Process a single resume attachment
+        
+        Pipeline:
+        1. Extract data (skipped when extracted is given)
+        2. Enrich data
+        3. Format data
+        4. Save candidate JSON
+        5. Notify Person 5's pipeline
         
+        Args:
+            email: Email the attachment came from
+            attachment: Attachment info with a downloaded file_path
+            extracted: Already extracted candidate JSON
+            user_id: Owner of the candidate (default: the monitor's user)
+            
+        Returns:
+            Processed candidate JSON or None if failed
+        """
         # Download attachment (already done by Gmail integration)
         file_path = attachment.get('file_path')
         
@@ -155,17 +339,20 @@ class GmailMonitor:
             logger.error(f"Attachment file not found: {file_path}")
             return None
         
+        from .extractor import ResumeTooLargeError
+        
         try:
             # Run Person 2 pipeline
-            candidate_json = self.process_resume_file(file_path)
+            candidate_json = self.process_resume_file(file_path, extracted=extracted)
             
             # Add email metadata
             candidate_json['metadata']['source_email'] = email.get('id')
+            candidate_json['metadata']['source_attachment'] = attachment.get('filename')
             candidate_json['metadata']['received_at'] = email.get('date')
             candidate_json['metadata']['sender'] = email.get('from')
             
             # Save candidate JSON
-            candidate_id = self.save_candidate(candidate_json)
+            candidate_id = self.save_candidate(candidate_json, user_id=user_id)
             candidate_json['id'] = candidate_id
             
             # Notify Person 5's pipeline
@@ -174,12 +361,20 @@ class GmailMonitor:
             logger.info(f"Successfully processed candidate: {candidate_json['name']} (ID: {candidate_id})")
             return candidate_json
             
+        except ResumeTooLargeError as e:
+            # Rejected by the extractor's size check before any parsing
+            logger.warning(f"Skipping attachment: {e}")
+            return None
         except Exception as e:
             logger.error(f"Error processing resume file: {e}")
             return None
     
     
-    def process_resume_file(self, file_path: str) -> Dict[str, Any]:
+    def process_resume_file(
+        self,
+        file_path: str,
+        extracted: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Run the complete Person 2 pipeline on a resume file
         
@@ -190,6 +385,7 @@ class GmailMonitor:
         
         Args:
             file_path: Path to resume file
+            extracted: Already extracted candidate JSON (skips step 1)
             
         Returns:
             Finalized candidate JSON
@@ -197,8 +393,9 @@ class GmailMonitor:
         logger.info(f"Running Person 2 pipeline on: {file_path}")
         
         # Step 1: Extract
-        logger.info("Step 1: Extraction...")
-        extracted = self.extractor.extract_from_file(file_path)
+        if extracted is None:
+            logger.info("Step 1: Extraction...")
+            extracted = self.extractor.extract_from_file(file_path)
         
         # Step 2: Enrich
         logger.info("Step 2: Enrichment...")
@@ -212,12 +409,13 @@ class GmailMonitor:
         return finalized
     
     
-    def save_candidate(self, candidate_json: Dict[str, Any]) -> str:
+    def save_candidate(self, candidate_json: Dict[str, Any], user_id: Optional[str] = None) -> str:
         """
-        Save candidate JSON to file
+        Save candidate JSON to the candidate repository
         
         Args:
             candidate_json: Candidate data
+            user_id: Owner of the candidate (default: the monitor's user)
             
         Returns:
             Candidate ID
@@ -231,13 +429,10 @@ class GmailMonitor:
             # Use timestamp
             candidate_id = f"candidate_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
         
-        # Save to file
-        file_path = self.candidates_dir / f"{candidate_id}.json"
+        user_id = user_id or self.user_id
+        self.repository.upsert(user_id, candidate_id, candidate_json)
         
-        with open(file_path, 'w') as f:
-            json.dump(candidate_json, f, indent=2)
-        
-        logger.info(f"Saved candidate to: {file_path}")
+        logger.info(f"Saved candidate {candidate_id} for {user_id}")
         return candidate_id
     
     
@@ -245,40 +440,32 @@ class GmailMonitor:
         """
         Notify Person 5's pipeline that a new candidate is ready for scoring
         
-        This would make a POST request to /api/pipeline/new_candidate
+        Returns immediately: the candidate goes on the scoring channel,
+        which sends candidates to the scoring service in micro-batches
+        (see modules.resume.scoring_channel)
         
         Args:
             candidate_json: Finalized candidate data
         """
-        logger.info("Notifying Person 5's pipeline...")
-        
-        # In production, make HTTP request to pipeline endpoint
-        # For now, just log
-        
-        # Example (when API is running):
-        # import requests
-        # response = requests.post(
-        #     "http://localhost:8000/api/pipeline/new_candidate",
-        #     json=candidate_json
-        # )
+        from .scoring_channel import get_scoring_channel
         
-        logger.info(f"Candidate ready for scoring: {candidate_json['name']}")
-        logger.info("NOTE: In production, POST to /api/pipeline/new_candidate")
+        if get_scoring_channel().put(candidate_json):
+            logger.info(f"Candidate queued for scoring: {candidate_json['name']}")
     
     
     def get_processed_candidates(self) -> List[Dict[str, Any]]:
         """
-        Get all processed candidates from storage
+        Get all of this monitor's candidates from the candidate repository
         
         Returns:
-            List of candidate JSONs
+            List of candidate JSONs, newest first
         """
-        candidates = []
-        
-        for file_path in self.candidates_dir.glob("*.json"):
-            with open(file_path, 'r') as f:
-                candidate = json.load(f)
-                candidates.append(candidate)
+        candidates, cursor = [], None
+        while True:
+            page, cursor = self.repository.list(user_id=self.user_id, limit=500, cursor=cursor)
+            candidates.extend(page)
+            if cursor is None:
+                break
         
         logger.info(f"Found {len(candidates)} processed candidates")
         return candidates
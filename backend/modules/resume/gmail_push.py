@@ -0,0 +1,306 @@
+"""
+Gmail Push Ingestion Module
+
+Person 2: Gmail Monitoring - event-driven mode
+Gmail push notifications (Cloud Pub/Sub push subscriptions, or a Composio
+trigger webhook) hit POST /api/v1/integrations/gmail/push/{user_id}. The
+endpoint only decodes the notification and enqueues a delta sync for that
+one user, so a resume is ingested seconds after it arrives instead of at
+the next polling tick. Polling stays on as a low-frequency safety net
+
+Notifications for a user whose sync is already running are coalesced into
+one follow-up sync, so a burst of pushes never runs overlapping syncs
+
+The polling job fans out through the same dispatcher (sync_users): every
+mailbox syncs concurrently in a dedicated thread pool, capped by
+GMAIL_SYNC_MAX_CONCURRENCY, and a per-user lock keeps a poll and a push
+sync of the same mailbox from overlapping
+
+LocalPushNotifier builds real Pub/Sub envelopes and delivers them to the
+dispatcher (or POSTs them to a running server), standing in for Google
+during development and tests
+"""
+
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import asyncio
+import base64
+import json
+import logging
+import urllib.parse
+import urllib.request
+
+from core.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+def decode_push_notification(envelope: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decode a Pub/Sub push envelope carrying a Gmail notification
+
+    Envelope format:
+        {"message": {"data": base64(json {"emailAddress", "historyId"}),
+                     "messageId": "..."},
+         "subscription": "..."}
+
+    Args:
+        envelope: Parsed request body
+
+    Returns:
+        {"email_address", "history_id", "message_id"}
+
+    Raises:
+        ValueError: If the envelope is malformed
+    """
+    message = envelope.get('message') if isinstance(envelope, dict) else None
+    if not isinstance(message, dict) or not message.get('data'):
+        raise ValueError("Push envelope has no message data")
+
+    try:
+        data = json.loads(base64.b64decode(message['data']).decode('utf-8'))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Push message data is not base64 JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("Push message data is not a JSON object")
+
+    return {
+        'email_address': data.get('emailAddress'),
+        'history_id': data.get('historyId'),
+        'message_id': message.get('messageId') or message.get('message_id')
+    }
+
+
+@lru_cache(maxsize=None)
+def _user_monitor(user_id: str):
+    """GmailMonitor reused across a user's syncs"""
+    from .gmail_monitor import GmailMonitor
+    return GmailMonitor(data_dir=f"./data/users/{user_id}", user_id=user_id)
+
+
+def sync_user_mailbox(user_id: str, use_mock: bool = False) -> list:
+    """
+    Run one incremental Gmail sync for a user (blocking)
+
+    Args:
+        user_id: Composio user ID
+        use_mock: Process mock emails instead of the real mailbox
+
+    Returns:
+        Processed candidates
+    """
+    return _user_monitor(user_id).process_new_emails(user_id=user_id, use_mock=use_mock)
+
+
+class GmailSyncDispatcher:
+    """
+    Runs per-user Gmail syncs off the event loop
+
+    At most max_concurrency syncs run at once, and never two for the same
+    user. Push notifications for a user are coalesced.
+
+    Usage (from async code):
+        gmail_sync_dispatcher.enqueue(user_id)             # push
+        results = await gmail_sync_dispatcher.sync_users(user_ids)  # poll
+    """
+
+    def __init__(self, sync: Callable[[str], Any] = sync_user_mailbox, max_concurrency: Optional[int] = None):
+        """
+        Initialize dispatcher (the thread pool is created on first use)
+
+        Args:
+            sync: Blocking user_id -> result function, run in a worker thread
+            max_concurrency: Syncs running at once (default: GMAIL_SYNC_MAX_CONCURRENCY)
+        """
+        self.sync = sync
+        self.max_concurrency = max_concurrency or get_setting("GMAIL_SYNC_MAX_CONCURRENCY", 16)
+
+        # Only touched from the event loop thread, so no locking needed
+        self._queued: Set[str] = set()
+        self._running: Set[str] = set()
+        self._dirty: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._user_locks: Dict[str, asyncio.Lock] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+
+    def _user_lock(self, user_id: str) -> asyncio.Lock:
+        """Lock held while a user's mailbox syncs"""
+        lock = self._user_locks.get(user_id)
+        if lock is None:
+            lock = self._user_locks[user_id] = asyncio.Lock()
+        return lock
+
+
+    async def _call(self, user_id: str, sync: Optional[Callable[[str], Any]] = None) -> Any:
+        """Run sync(user_id) in the thread pool under the global cap"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="gmail-sync")
+
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, sync or self.sync, user_id)
+
+
+    def enqueue(self, user_id: str) -> bool:
+        """
+        Schedule a sync for a user (call from the event loop)
+
+        Args:
+            user_id: Composio user ID
+
+        Returns:
+            True if a new sync was scheduled, False if the request was
+            coalesced into a queued or running one
+        """
+        if user_id in self._running:
+            # The running sync may have listed messages before this one
+            # arrived; run once more when it finishes
+            self._dirty.add(user_id)
+            return False
+        if user_id in self._queued:
+            return False
+
+        self._queued.add(user_id)
+        task = asyncio.get_running_loop().create_task(self._run(user_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+
+    async def _run(self, user_id: str):
+        """Sync a user until no notification arrived during the last run"""
+        while True:
+            async with self._user_lock(user_id):
+                # Still "queued" while a polling sync holds the lock: that
+                # sync may have listed the inbox before the notification
+                self._queued.discard(user_id)
+                self._running.add(user_id)
+                try:
+                    result = await self._call(user_id)
+                    logger.info(f"Push sync for {user_id} done: {len(result or [])} new candidate(s)")
+                except Exception as e:
+                    logger.error(f"Push sync failed for {user_id}: {e}")
+                finally:
+                    self._running.discard(user_id)
+
+            if user_id not in self._dirty:
+                return
+            self._dirty.discard(user_id)
+
+
+    async def sync_users(self, user_ids: Iterable[str], sync: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+        """
+        Sync many mailboxes concurrently (one polling tick, or a manual check)
+
+        A user whose sync is already running is synced again once it ends.
+
+        Args:
+            user_ids: Composio user IDs
+            sync: Sync function for these calls instead of the dispatcher's
+                (e.g. partial(sync_user_mailbox, use_mock=True))
+
+        Returns:
+            user_id -> sync result, or the exception that sync raised
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+
+        async def sync_one(user_id: str) -> Any:
+            async with self._user_lock(user_id):
+                return await self._call(user_id, sync)
+
+        results = await asyncio.gather(*(sync_one(user_id) for user_id in user_ids), return_exceptions=True)
+        return dict(zip(user_ids, results))
+
+
+    async def wait_idle(self):
+        """Wait until every scheduled sync has finished"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+    def shutdown(self):
+        """Shut down the sync thread pool (call on app shutdown)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Global dispatcher used by the push webhook and the polling job
+gmail_sync_dispatcher = GmailSyncDispatcher()
+
+
+class LocalPushNotifier:
+    """
+    Local stand-in for Gmail's Pub/Sub push
+
+    Usage:
+        notifier = LocalPushNotifier(dispatcher)
+        notifier.notify("user_123", "hr@example.com")  # inside the event loop
+
+        LocalPushNotifier(url="http://localhost:8000/api/v1/integrations/gmail/push")
+            .post("user_123", "hr@example.com")
+    """
+
+    def __init__(self, dispatcher: Optional[GmailSyncDispatcher] = None, url: Optional[str] = None):
+        """
+        Initialize notifier
+
+        Args:
+            dispatcher: Dispatcher to deliver to in-process
+            url: Push endpoint base URL for post() (user ID is appended)
+        """
+        self.dispatcher = dispatcher
+        self.url = url
+        self._history_id = 0
+        self._message_id = 0
+
+
+    def envelope(self, email_address: str, history_id: Optional[int] = None) -> Dict[str, Any]:
+        """Build a Pub/Sub push envelope like Google sends"""
+        self._message_id += 1
+        if history_id is None:
+            self._history_id += 1
+            history_id = self._history_id
+
+        data = json.dumps({'emailAddress': email_address, 'historyId': history_id})
+        return {
+            'message': {
+                'data': base64.b64encode(data.encode('utf-8')).decode('ascii'),
+                'messageId': f"local-{self._message_id}"
+            },
+            'subscription': 'projects/local/subscriptions/gmail-push'
+        }
+
+
+    def notify(self, user_id: str, email_address: str, history_id: Optional[int] = None) -> bool:
+        """
+        Deliver a notification in-process (call from the event loop)
+
+        Returns:
+            Whether a new sync was scheduled (see GmailSyncDispatcher.enqueue)
+        """
+        decode_push_notification(self.envelope(email_address, history_id))
+        return self.dispatcher.enqueue(user_id)
+
+
+    def post(self, user_id: str, email_address: str, history_id: Optional[int] = None,
+             token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        POST a notification to a running server's push endpoint
+
+        Returns:
+            Endpoint's JSON response
+        """
+        url = f"{self.url.rstrip('/')}/{user_id}" + (f"?token={urllib.parse.quote(token)}" if token else "")
+        request = urllib.request.Request(
+            url,
+            data=json.dumps(self.envelope(email_address, history_id)).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            method='POST'
+        )
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read().decode('utf-8'))
@@ -0,0 +1,277 @@
+"""
+Resume Ingestion Pipeline Module
+
+Person 2: Resume Processing - bounded pipeline
+Overlaps the three ingestion stages across attachments:
+
+    download (threads) -> extract (processes) -> finish (threads)
+
+so one email's enrichment runs while the next attachment downloads and a
+third is parsed. At most max_in_flight attachments are between stages at
+any time, which bounds memory no matter how many CVs an inbox holds.
+
+Pipelines running side by side (one per mailbox during a polling tick)
+share one extraction process pool, so CPU use stays bounded too.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+from contextlib import nullcontext
+import os
+import threading
+import logging
+
+from core.utils import get_setting
+from .extractor import ResumeTooLargeError, UnsupportedFormatError, extract_resume_file
+
+logger = logging.getLogger(__name__)
+
+
+DOWNLOAD, EXTRACT, FINISH = 'download', 'extract', 'finish'
+
+_shared_pool: Optional[ProcessPoolExecutor] = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_extraction_pool() -> ProcessPoolExecutor:
+    """
+    Process-wide extraction pool (EXTRACTION_WORKERS, 0 = CPU count)
+
+    Recreated if a crashed worker left it broken.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None or getattr(_shared_pool, '_broken', False):
+            _shared_pool = ProcessPoolExecutor(get_setting("EXTRACTION_WORKERS", 0) or os.cpu_count() or 1)
+        return _shared_pool
+
+
+def shutdown_extraction_pool():
+    """Shut down the shared extraction pool (call on app shutdown)"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.shutdown(wait=False, cancel_futures=True)
+            _shared_pool = None
+
+
+class IngestionResult(NamedTuple):
+    """Outcome of one job; on failure, stage names the stage that failed"""
+    job: Any
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    stage: Optional[str] = None
+
+
+class IngestionPipeline:
+    """
+    Bounded download -> extract -> finish pipeline
+
+    Usage:
+        pipeline = IngestionPipeline(download=fetch_file, finish=save_candidate)
+        for outcome in pipeline.run(jobs):
+            ...
+    """
+
+    def __init__(
+        self,
+        download: Callable[[Any], Optional[str]],
+        finish: Callable[[Any, Dict[str, Any]], Optional[Dict[str, Any]]],
+        extract: Callable[[str], Dict[str, Any]] = extract_resume_file,
+        download_workers: Optional[int] = None,
+        extract_workers: Optional[int] = None,
+        finish_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        extract_pool: Optional[Executor] = None
+    ):
+        """
+        Initialize pipeline
+
+        Args:
+            download: job -> local file path (None = download failed)
+            finish: (job, extracted candidate) -> final result (None = failed)
+            extract: file path -> candidate JSON; runs in a worker process,
+                so it must be a picklable module-level function
+            download_workers: Download threads (default: GMAIL_DOWNLOAD_WORKERS)
+            extract_workers: Extraction processes (default: EXTRACTION_WORKERS, 0 = CPU count)
+            finish_workers: Enrichment threads (default: ENRICHMENT_WORKERS)
+            max_in_flight: Jobs admitted at once (default: INGESTION_MAX_IN_FLIGHT)
+            extract_pool: Process pool to extract in, left running after run()
+                (default: a pool of extract_workers owned by each run)
+        """
+        self.download = download
+        self.extract = extract
+        self.finish = finish
+
+        self.download_workers = download_workers or get_setting("GMAIL_DOWNLOAD_WORKERS", 4)
+        self.extract_workers = extract_workers or get_setting("EXTRACTION_WORKERS", 0) or os.cpu_count() or 1
+        self.finish_workers = finish_workers or get_setting("ENRICHMENT_WORKERS", 4)
+        self.max_in_flight = max_in_flight or get_setting("INGESTION_MAX_IN_FLIGHT", 16)
+        self.extract_pool = extract_pool
+
+
+    def run(self, jobs: Iterable[Any]) -> Iterator[IngestionResult]:
+        """
+        Push jobs through all stages, yielding each as soon as it is done
+
+        A failing stage ends that job only; the rest keep flowing.
+
+        Args:
+            jobs: Opaque job objects passed to download() and finish()
+
+        Yields:
+            IngestionResult per job, in completion order
+        """
+        jobs = iter(jobs)
+        pending: Dict[Future, tuple] = {}
+        # A shared pool outlives this run; an own pool is shut down with it
+        extract_context = (nullcontext(self.extract_pool) if self.extract_pool
+                           else ProcessPoolExecutor(self.extract_workers))
+
+        with ThreadPoolExecutor(self.download_workers, thread_name_prefix="ingest-download") as download_pool, \
+                extract_context as extract_pool, \
+                ThreadPoolExecutor(self.finish_workers, thread_name_prefix="ingest-finish") as finish_pool:
+
+            def submit(pool: Executor, stage: str, job: Any, fn: Callable, *args: Any):
+                pending[pool.submit(fn, *args)] = (stage, job)
+
+            def admit():
+                # Only pull new jobs while the pipeline has room
+                while len(pending) < self.max_in_flight:
+                    job = next(jobs, None)
+                    if job is None:
+                        return
+                    submit(download_pool, DOWNLOAD, job, self.download, job)
+
+            admit()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, job = pending.pop(future)
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        logger.error(f"Ingestion {stage} failed: {e}")
+                        yield IngestionResult(job, None, f"{stage}: {e}", stage)
+                        continue
+
+                    if not value:
+                        yield IngestionResult(job, None, f"{stage}: no result", stage)
+                    elif stage == DOWNLOAD:
+                        submit(extract_pool, EXTRACT, job, self.extract, value)
+                    elif stage == EXTRACT:
+                        submit(finish_pool, FINISH, job, self.finish, job, value)
+                    else:
+                        yield IngestionResult(job, value, None)
+
+                admit()
+
+
+def is_permanent_failure(stage: str, error: Optional[BaseException]) -> bool:
+    """
+    Whether a failed stage would fail the same way on retry
+
+    Extraction of a file that is too large (including DOCX zip bombs), in
+    an unsupported format or yields nothing is deterministic. Anything
+    else (network, rate limits, a crashed worker, a bad cache row) is
+    worth retrying.
+
+    Args:
+        stage: Stage that failed
+        error: Exception raised, or None if the stage returned no result
+    """
+    return stage == EXTRACT and (error is None or isinstance(error, (ResumeTooLargeError, UnsupportedFormatError)))
+
+
+class QueueIngestionPipeline(IngestionPipeline):
+    """
+    Pipeline that drains a durable IngestionJobQueue
+
+    Same stage functions and worker pools as IngestionPipeline, but every
+    stage transition is persisted, so a restart resumes each job at the
+    stage it reached. Jobs are the queue's payload dicts.
+
+    Usage:
+        pipeline = QueueIngestionPipeline(download=fetch_file, finish=save_candidate)
+        for outcome in pipeline.drain(get_ingestion_queue(), user_id):
+            ...
+    """
+
+    def drain(self, queue, user_id: Optional[str] = None) -> Iterator[IngestionResult]:
+        """
+        Run queued jobs until none is runnable
+
+        A failed stage is retried by the queue after a backoff (later drains
+        pick it up), unless the failure is permanent (see
+        is_permanent_failure), which dead-letters it at once. Outcomes are
+        yielded for finished and dead-lettered jobs only.
+
+        Args:
+            queue: IngestionJobQueue
+            user_id: Only this user's jobs (None = every user)
+
+        Yields:
+            IngestionResult per job that finished or was dead-lettered
+        """
+        pending: Dict[Future, tuple] = {}
+        capacity = {
+            DOWNLOAD: self.download_workers,
+            EXTRACT: self.extract_workers,
+            FINISH: self.finish_workers
+        }
+        in_stage = {stage: 0 for stage in capacity}
+        extract_context = (nullcontext(self.extract_pool) if self.extract_pool
+                           else ProcessPoolExecutor(self.extract_workers))
+
+        with ThreadPoolExecutor(self.download_workers, thread_name_prefix="ingest-download") as download_pool, \
+                extract_context as extract_pool, \
+                ThreadPoolExecutor(self.finish_workers, thread_name_prefix="ingest-finish") as finish_pool:
+
+            def submit_stage(stage: str, pool: Executor, fn: Callable, args: Callable[[Dict], tuple]):
+                room = min(capacity[stage] - in_stage[stage], self.max_in_flight - len(pending))
+                for job in queue.claim(stage, user_id=user_id, limit=room):
+                    pending[pool.submit(fn, *args(job['payload']))] = (stage, job)
+                    in_stage[stage] += 1
+
+            def fill():
+                # Later stages first, so work in progress drains before new work starts
+                submit_stage(FINISH, finish_pool, self.finish, lambda p: (p, p['extracted']))
+                submit_stage(EXTRACT, extract_pool, self.extract, lambda p: (p['file_path'],))
+                submit_stage(DOWNLOAD, download_pool, self.download, lambda p: (p,))
+
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, job = pending.pop(future)
+                    in_stage[stage] -= 1
+                    payload = job['payload']
+                    exception = None
+                    try:
+                        value = future.result()
+                        error = None if value else f"{stage}: no result"
+                    except Exception as e:
+                        value, error, exception = None, f"{stage}: {e}", e
+
+                    if error:
+                        if queue.fail(job, error, permanent=is_permanent_failure(stage, exception)):
+                            yield IngestionResult(payload, None, error, stage)
+                        continue
+
+                    if stage == DOWNLOAD:
+                        payload['file_path'] = value
+                    elif stage == EXTRACT:
+                        payload['extracted'] = value
+                    else:
+                        payload.pop('extracted', None)  # Kept in the candidate JSON already
+                    if queue.advance(job, payload) is None:
+                        continue  # Reclaimed after the lease ran out; the new owner reports it
+
+                    if stage == FINISH:
+                        yield IngestionResult(payload, value, None)
+
+                fill()
@@ -0,0 +1,429 @@
+"""
+Ingestion Job Queue Module
+
+Person 2: Resume Processing - durable work queue
+Every resume attachment found in Gmail becomes one job that moves through
+the ingestion stages:
+
+    download -> extract -> finish -> done
+
+Jobs live in SQLite, so a crash or restart mid-batch loses nothing: a job
+is claimed with a lease, and a job whose lease runs out (its worker died)
+is claimed again. Each claim gets a fresh lease token, and results are
+only recorded for the current lease, so a worker that outlived its lease
+cannot overwrite the job's newer state. Failed stages are retried with
+backoff, and after INGESTION_MAX_ATTEMPTS the job is copied to a
+dead-letter table for inspection. Idempotency keys (user, message and
+attachment ids) make enqueueing the same attachment twice a no-op;
+completed jobs are pruned after INGESTION_COMPLETED_RETENTION_DAYS
+
+QueueIngestionPipeline (modules.resume.ingest) drains the queue with one
+worker pool per stage
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+import logging
+
+from core.utils import get_setting
+from .ingest import DOWNLOAD, EXTRACT, FINISH
+
+logger = logging.getLogger(__name__)
+
+
+DONE = 'done'
+NEXT_STAGE = {DOWNLOAD: EXTRACT, EXTRACT: FINISH, FINISH: DONE}
+
+READY, LEASED, COMPLETED, DEAD = 'ready', 'leased', 'completed', 'dead'
+
+
+def attachment_job_key(user_id: str, message_id: str, attachment_id: str) -> str:
+    """Idempotency key of one Gmail attachment"""
+    return f"{user_id}:{message_id}:{attachment_id}"
+
+
+class IngestionJobQueue:
+    """
+    SQLite-backed ingestion job queue
+
+    Safe to share between threads; reopens its connection in forked
+    worker processes.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_attempts: Optional[int] = None,
+        retry_base_delay: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Open (or create) the queue database
+
+        Args:
+            db_path: SQLite database file
+            max_attempts: Attempts per stage before dead-lettering (default: INGESTION_MAX_ATTEMPTS)
+            retry_base_delay: Backoff bound after the first failure, doubled
+                per attempt (default: INGESTION_RETRY_BASE_DELAY)
+            lease_seconds: How long a claimed job stays invisible to other
+                workers (default: INGESTION_LEASE_SECONDS)
+            clock: Wall-clock source for leases, backoff and pruning (seconds)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.max_attempts = max_attempts or get_setting("INGESTION_MAX_ATTEMPTS", 3)
+        self.retry_base_delay = (retry_base_delay if retry_base_delay is not None
+                                 else get_setting("INGESTION_RETRY_BASE_DELAY", 30.0))
+        self.lease_seconds = lease_seconds or get_setting("INGESTION_LEASE_SECONDS", 300.0)
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._open()
+
+        logger.info(f"IngestionJobQueue opened at {self.db_path}")
+
+
+    def _open(self):
+        """Open the SQLite connection for the current process"""
+        self._pid = os.getpid()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ingestion_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                user_id TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL,
+                lease_until REAL,
+                lease_token TEXT,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        columns = {row['name'] for row in self._conn.execute("PRAGMA table_info(ingestion_jobs)")}
+        if 'lease_token' not in columns:
+            # Queues created before leases were fenced
+            self._conn.execute("ALTER TABLE ingestion_jobs ADD COLUMN lease_token TEXT")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_claim "
+            "ON ingestion_jobs (user_id, stage, status, available_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_status "
+            "ON ingestion_jobs (status, updated_at)"
+        )
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ingestion_dead_letters (
+                job_id INTEGER PRIMARY KEY,
+                idempotency_key TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                error TEXT,
+                failed_at REAL NOT NULL
+            )
+        """)
+
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection for this process (SQLite handles must not cross a fork)"""
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._open()
+        return self._conn
+
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> Dict[str, Any]:
+        """Row -> job dict with the payload decoded"""
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        return job
+
+
+    def enqueue(self, key: str, user_id: str, payload: Dict[str, Any], stage: str = DOWNLOAD) -> bool:
+        """
+        Add a job unless one with the same idempotency key exists
+
+        Args:
+            key: Idempotency key (see attachment_job_key)
+            user_id: Owner of the job
+            payload: JSON-serializable job data
+            stage: First stage to run
+
+        Returns:
+            True if the job was added, False if the key was already known
+        """
+        now = self.clock()
+        conn = self._connection()
+        with self._lock:
+            cursor = conn.execute(
+                """
+                INSERT OR IGNORE INTO ingestion_jobs
+                    (idempotency_key, user_id, stage, status, payload, available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, user_id, stage, READY, json.dumps(payload), now, now, now)
+            )
+        return cursor.rowcount > 0
+
+
+    def claim(self, stage: str, user_id: Optional[str] = None, limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        Lease up to limit runnable jobs of a stage
+
+        Runnable: ready and due, or leased by a worker whose lease ran out.
+
+        Args:
+            stage: Stage to claim
+            user_id: Only this user's jobs (None = any user)
+            limit: Maximum jobs to claim
+
+        Returns:
+            Claimed jobs (id, idempotency_key, user_id, stage, payload,
+            attempts, lease_token, ...); pass them back to advance/fail
+        """
+        if limit <= 0:
+            return []
+
+        now = self.clock()
+        user_filter = "AND user_id = ?" if user_id is not None else ""
+        params = [stage, READY, now, LEASED, now] + ([user_id] if user_id is not None else []) + [limit]
+
+        conn = self._connection()
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    f"""
+                    SELECT * FROM ingestion_jobs
+                    WHERE stage = ?
+                      AND ((status = ? AND available_at <= ?) OR (status = ? AND lease_until < ?))
+                      {user_filter}
+                    ORDER BY available_at, id
+                    LIMIT ?
+                    """,
+                    params
+                ).fetchall()
+                jobs = [dict(self._job(row), lease_token=uuid.uuid4().hex) for row in rows]
+                conn.executemany(
+                    "UPDATE ingestion_jobs SET status = ?, lease_until = ?, lease_token = ?, updated_at = ? "
+                    "WHERE id = ?",
+                    [(LEASED, now + self.lease_seconds, job['lease_token'], now, job['id']) for job in jobs]
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return jobs
+
+
+    def _leased(self, conn: sqlite3.Connection, job: Dict[str, Any]) -> Optional[sqlite3.Row]:
+        """The job's row if this claim still holds its lease, else None"""
+        return conn.execute(
+            "SELECT * FROM ingestion_jobs WHERE id = ? AND stage = ? AND status = ? AND lease_token = ?",
+            (job['id'], job['stage'], LEASED, job['lease_token'])
+        ).fetchone()
+
+
+    def advance(self, job: Dict[str, Any], payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Move a claimed job to its next stage (or mark it done)
+
+        Args:
+            job: Job as returned by claim
+            payload: Updated payload carrying the finished stage's output
+
+        Returns:
+            The new stage, or None if the lease was lost (the job was
+            reclaimed by another worker) and nothing was recorded
+        """
+        now = self.clock()
+        next_stage = NEXT_STAGE[job['stage']]
+        conn = self._connection()
+        with self._lock:
+            cursor = conn.execute(
+                """
+                UPDATE ingestion_jobs
+                SET stage = ?, status = ?, payload = ?, attempts = 0, available_at = ?,
+                    lease_until = NULL, lease_token = NULL, last_error = NULL, updated_at = ?
+                WHERE id = ? AND stage = ? AND status = ? AND lease_token = ?
+                """,
+                (next_stage, COMPLETED if next_stage == DONE else READY, json.dumps(payload), now, now,
+                 job['id'], job['stage'], LEASED, job['lease_token'])
+            )
+        if not cursor.rowcount:
+            logger.warning(f"Job {job['idempotency_key']} lost its lease at {job['stage']}; result ignored")
+            return None
+        return next_stage
+
+
+    def fail(self, job: Dict[str, Any], error: str, permanent: bool = False) -> bool:
+        """
+        Record a failed attempt of a claimed job; retry later or dead-letter it
+
+        Args:
+            job: Job as returned by claim
+            error: Failure description
+            permanent: The failure would repeat on retry (bad input);
+                dead-letter now instead of after max_attempts
+
+        Returns:
+            True if the job was dead-lettered, False if it will be retried
+            (or the lease was lost and nothing was recorded)
+        """
+        now = self.clock()
+        conn = self._connection()
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._leased(conn, job)
+                if row is None:
+                    conn.execute("ROLLBACK")
+                    logger.warning(f"Job {job['idempotency_key']} lost its lease at {job['stage']}; "
+                                   f"failure ignored: {error}")
+                    return False
+                attempts = row['attempts'] + 1
+                dead = permanent or attempts >= self.max_attempts
+
+                if dead:
+                    conn.execute(
+                        "UPDATE ingestion_jobs SET status = ?, attempts = ?, lease_until = NULL, "
+                        "lease_token = NULL, last_error = ?, updated_at = ? WHERE id = ?",
+                        (DEAD, attempts, error, now, row['id'])
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO ingestion_dead_letters VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (row['id'], row['idempotency_key'], row['user_id'], row['stage'],
+                         row['payload'], attempts, error, now)
+                    )
+                else:
+                    # Exponential backoff with full jitter
+                    delay = random.uniform(0, self.retry_base_delay * 2 ** (attempts - 1))
+                    conn.execute(
+                        "UPDATE ingestion_jobs SET status = ?, attempts = ?, available_at = ?, "
+                        "lease_until = NULL, lease_token = NULL, last_error = ?, updated_at = ? WHERE id = ?",
+                        (READY, attempts, now + delay, error, now, row['id'])
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        if dead:
+            logger.error(f"Job {row['idempotency_key']} dead-lettered at {row['stage']}: {error}")
+        else:
+            logger.warning(f"Job {row['idempotency_key']} failed at {row['stage']} "
+                           f"(attempt {attempts}/{self.max_attempts}): {error}")
+        return dead
+
+
+    def dead_letters(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Jobs that ran out of attempts or failed permanently
+
+        Args:
+            user_id: Only this user's jobs (None = all)
+
+        Returns:
+            Dead letters, newest first
+        """
+        conn = self._connection()
+        with self._lock:
+            if user_id is None:
+                rows = conn.execute("SELECT * FROM ingestion_dead_letters ORDER BY failed_at DESC").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM ingestion_dead_letters WHERE user_id = ? ORDER BY failed_at DESC", (user_id,)
+                ).fetchall()
+        return [self._job(row) for row in rows]
+
+
+    def retry_dead_letter(self, job_id: int) -> bool:
+        """
+        Put a dead-lettered job back on the queue at the stage it failed
+
+        Returns:
+            True if the job was requeued
+        """
+        now = self.clock()
+        conn = self._connection()
+        with self._lock:
+            cursor = conn.execute(
+                "UPDATE ingestion_jobs SET status = ?, attempts = 0, available_at = ?, updated_at = ? "
+                "WHERE id = ? AND status = ?",
+                (READY, now, now, job_id, DEAD)
+            )
+            if cursor.rowcount:
+                conn.execute("DELETE FROM ingestion_dead_letters WHERE job_id = ?", (job_id,))
+        return cursor.rowcount > 0
+
+
+    def prune(self, older_than: Optional[float] = None) -> int:
+        """
+        Delete completed jobs finished more than older_than seconds ago
+
+        A completed job is kept for a while so its idempotency key still
+        turns a re-listed attachment into a no-op; dead jobs are kept.
+
+        Args:
+            older_than: Retention in seconds (default: INGESTION_COMPLETED_RETENTION_DAYS)
+
+        Returns:
+            Number of jobs deleted
+        """
+        if older_than is None:
+            older_than = get_setting("INGESTION_COMPLETED_RETENTION_DAYS", 7.0) * 86400
+        conn = self._connection()
+        with self._lock:
+            cursor = conn.execute(
+                "DELETE FROM ingestion_jobs WHERE status = ? AND updated_at < ?",
+                (COMPLETED, self.clock() - older_than)
+            )
+        if cursor.rowcount:
+            logger.info(f"Pruned {cursor.rowcount} completed ingestion job(s)")
+        return cursor.rowcount
+
+
+    def stats(self, user_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Job counts by "stage/status" (e.g. "extract/ready")
+
+        Args:
+            user_id: Only this user's jobs (None = all)
+        """
+        conn = self._connection()
+        with self._lock:
+            rows = conn.execute(
+                "SELECT stage, status, COUNT(*) AS n FROM ingestion_jobs "
+                + ("WHERE user_id = ? " if user_id is not None else "")
+                + "GROUP BY stage, status",
+                (user_id,) if user_id is not None else ()
+            ).fetchall()
+        return {f"{row['stage']}/{row['status']}": row['n'] for row in rows}
+
+
+@lru_cache(maxsize=None)
+def get_ingestion_queue() -> IngestionJobQueue:
+    """Return the process-wide ingestion queue (INGESTION_QUEUE_DB_PATH)"""
+    return IngestionJobQueue(get_setting("INGESTION_QUEUE_DB_PATH", "data/cache/ingestion_queue.db"))
@@ -0,0 +1,223 @@
+"""
+Scoring Hand-off Module
+
+Person 2 -> Person 5: finalized candidates to scoring
+GmailMonitor.notify_pipeline puts each finalized candidate on an
+in-process channel and returns immediately. A background thread gathers
+candidates into micro-batches, flushed when SCORING_BATCH_SIZE candidates
+are waiting or SCORING_BATCH_WINDOW_SECONDS after the first one arrived,
+and hands each batch to the scoring consumer in one call
+
+The default consumer POSTs the batch to the scoring service
+(modules/scoring/scoring_server.py, POST /score takes a list of resumes)
+over one pooled HTTP session. Without SCORING_SERVICE_URL batches are
+only logged
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+import queue
+import threading
+import time
+import logging
+
+from core.concurrency import retry_with_backoff
+from core.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+_STOP = object()
+_POLL_SECONDS = 0.05
+
+
+class ScoringServiceConsumer:
+    """Sends candidate batches to the scoring service over a pooled session"""
+
+    def __init__(self, url: str, job_description: str = "", timeout: float = 30.0):
+        """
+        Initialize consumer (the HTTP session is created on first batch)
+
+        Args:
+            url: Scoring endpoint (e.g. http://localhost:8001/score)
+            job_description: Job description the batch is scored against
+            timeout: Request timeout in seconds
+        """
+        self.url = url
+        self.job_description = job_description
+        self.timeout = timeout
+        self._session = None
+
+
+    def __call__(self, batch: List[Dict[str, Any]]):
+        """POST one batch; raises on HTTP errors so the channel can retry"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+
+        response = self._session.post(
+            self.url,
+            json={"resumes": batch, "job_description": self.job_description},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        result = response.json()
+        if isinstance(result, dict) and result.get('error'):
+            raise RuntimeError(result['error'])
+        return result
+
+
+def log_batch(batch: List[Dict[str, Any]]):
+    """Fallback consumer when no scoring service is configured"""
+    names = ', '.join(str(candidate.get('name')) for candidate in batch)
+    logger.info(f"Candidates ready for scoring ({len(batch)}): {names}")
+    logger.info("NOTE: Set SCORING_SERVICE_URL to send batches to the scoring service")
+
+
+class ScoringChannel:
+    """
+    Thread-safe micro-batching channel to the scoring stage
+
+    Usage:
+        channel = ScoringChannel(consumer=send_batch)
+        channel.put(candidate_json)  # never blocks
+        ...
+        channel.close()  # flushes what is left
+    """
+
+    def __init__(
+        self,
+        consumer: Callable[[List[Dict[str, Any]]], Any],
+        max_batch: int = 32,
+        max_wait: float = 2.0,
+        max_pending: int = 10000,
+        attempts: int = 3,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize channel (the flusher thread starts on first put)
+
+        Args:
+            consumer: Called with each batch (list of candidate JSONs)
+            max_batch: Flush once this many candidates are waiting
+            max_wait: Flush at most this many seconds after a batch's first candidate
+            max_pending: Candidates buffered before new ones are dropped
+            attempts: Consumer calls per batch before the batch is dropped
+            clock: Clock the batch window is measured on (seconds)
+        """
+        self.consumer = consumer
+        self.max_batch = max(max_batch, 1)
+        self.max_wait = max_wait
+        self.attempts = attempts
+        self.clock = clock
+
+        self.sent = 0
+        self.dropped = 0
+        self.batches = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+
+    def put(self, candidate: Dict[str, Any]) -> bool:
+        """
+        Queue a candidate for scoring without blocking
+
+        Args:
+            candidate: Finalized candidate JSON
+
+        Returns:
+            False if the channel is full or closed and the candidate was dropped
+            (it is still saved on disk and can be rescored later)
+        """
+        with self._lock:
+            if self._closed:
+                self.dropped += 1
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="scoring-channel", daemon=True)
+                self._thread.start()
+
+        try:
+            self._queue.put_nowait(candidate)
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.warning(f"Scoring channel full, dropped {candidate.get('name')}")
+            return False
+
+
+    def _run(self):
+        """Flusher thread: collect batches by size or time window and deliver them"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            deadline = self.clock() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    break
+                try:
+                    # Wake up now and then to re-read the clock
+                    item = self._queue.get(timeout=min(remaining, _POLL_SECONDS))
+                except queue.Empty:
+                    continue
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._deliver(batch)
+
+
+    def _deliver(self, batch: List[Dict[str, Any]]):
+        """Hand one batch to the consumer, retrying with backoff"""
+        try:
+            retry_with_backoff(lambda: self.consumer(batch), attempts=self.attempts)
+        except Exception as e:
+            with self._lock:
+                self.dropped += len(batch)
+            logger.error(f"Scoring hand-off failed, dropped batch of {len(batch)}: {e}")
+            return
+
+        with self._lock:
+            self.sent += len(batch)
+            self.batches += 1
+        logger.info(f"Handed {len(batch)} candidate(s) to scoring")
+
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """
+        Flush queued candidates and stop the flusher thread
+
+        Args:
+            timeout: Seconds to wait for the final flush
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+
+@lru_cache(maxsize=None)
+def get_scoring_channel() -> ScoringChannel:
+    """Return the process-wide scoring channel"""
+    url = get_setting("SCORING_SERVICE_URL", "")
+    consumer = ScoringServiceConsumer(url, get_setting("SCORING_JOB_DESCRIPTION", "")) if url else log_batch
+    return ScoringChannel(
+        consumer=consumer,
+        max_batch=get_setting("SCORING_BATCH_SIZE", 32),
+        max_wait=get_setting("SCORING_BATCH_WINDOW_SECONDS", 2.0)
+    )
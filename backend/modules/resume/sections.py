@@ -0,0 +1,135 @@
+"""
+Resume Section Segmenter Module
+
+Person 2: Resume Extraction - single-pass segmentation
+Splits resume text into typed sections (header, summary, skills,
+experience, education, projects, certifications) in one pass over the
+lines, so field extractors work on their own section instead of each
+rescanning the whole document
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Heading aliases per section type (matched at the start of a short line)
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'about me'],
+    'skills': ['skills', 'technical skills', 'core skills', 'key skills', 'technologies', 'tech stack'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'internships'],
+    'education': ['education', 'academic background', 'academics', 'qualifications'],
+    'projects': ['projects', 'personal projects', 'academic projects'],
+    'certifications': ['certifications', 'certificates', 'licenses'],
+}
+
+HEADER = 'header'
+
+# Headings are short; longer lines mentioning "experience" are content
+MAX_HEADING_LENGTH = 40
+
+_ALIAS_TO_SECTION = {
+    alias: section
+    for section, aliases in SECTION_HEADINGS.items()
+    for alias in aliases
+}
+
+# One precompiled regex recognizes every heading alias; longest aliases first
+# so "work experience" wins over a shorter prefix
+_HEADING_PATTERN = re.compile(
+    r'^[\s#*\-•]*(' +
+    '|'.join(re.escape(a).replace(r'\ ', r'\s+') for a in sorted(_ALIAS_TO_SECTION, key=len, reverse=True)) +
+    r')\b(?:\s*(?:&|and|/)\s*[a-z][a-z\s]*?)?\s*(?:[:\-–|]\s*(?P<inline>.*))?$',
+    re.IGNORECASE
+)
+
+
+class Section(NamedTuple):
+    """A run of resume lines under one heading"""
+    name: str
+    start: int  # Line offset of the first content line
+    lines: List[str]
+
+
+class ResumeSections:
+    """
+    Segmented resume
+
+    Attributes:
+        lines: Every line of the resume
+        sections: Section name -> Section (repeated headings are merged)
+    """
+
+    def __init__(self, lines: List[str], sections: Dict[str, Section]):
+        self.lines = lines
+        self.sections = sections
+
+    def get(self, name: str) -> List[str]:
+        """Lines of a section, or an empty list if the resume has none"""
+        section = self.sections.get(name)
+        return section.lines if section else []
+
+    @property
+    def header(self) -> List[str]:
+        """Lines before the first recognized heading (name, contact info)"""
+        return self.get(HEADER)
+
+
+def match_heading(line: str) -> Optional[tuple]:
+    """
+    Recognize a section heading line
+
+    Args:
+        line: One resume line
+
+    Returns:
+        (section_name, inline_content) or None if the line is not a heading
+    """
+    # "Skills: Python, Docker, ..." is a heading with inline content, but a
+    # long line without a colon is a sentence that starts with a keyword
+    if len(line) > MAX_HEADING_LENGTH and ':' not in line:
+        return None
+
+    match = _HEADING_PATTERN.match(line)
+    if not match:
+        return None
+
+    inline = (match.group('inline') or '').strip()
+    alias = ' '.join(match.group(1).lower().split())
+    return _ALIAS_TO_SECTION[alias], inline
+
+
+def segment_resume(text: str) -> ResumeSections:
+    """
+    Split resume text into sections in a single pass
+
+    Args:
+        text: Raw resume text
+
+    Returns:
+        ResumeSections with line offsets per section
+    """
+    lines = text.split('\n')
+    sections: Dict[str, Section] = {}
+    current = Section(HEADER, 0, [])
+    sections[HEADER] = current
+
+    for offset, line in enumerate(lines):
+        heading = match_heading(line.strip())
+
+        if heading is None:
+            current.lines.append(line)
+            continue
+
+        name, inline = heading
+        # A repeated heading continues the earlier section of the same type
+        current = sections.get(name) or Section(name, offset + 1, [])
+        sections[name] = current
+        if inline:
+            current.lines.append(inline)
+
+    logger.debug(f"Segmented resume into sections: {list(sections)}")
+    return ResumeSections(lines, sections)
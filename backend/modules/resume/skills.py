@@ -0,0 +1,129 @@
+"""
+Skill Matcher Module
+
+Person 2: Resume Extraction - skill dictionary matching
+Compiles a skill dictionary once into a single trie-shaped regex so that
+matching a resume is one pass over the text regardless of dictionary size
+The dictionary itself lives in taxonomy.py
+"""
+
+from typing import Any, Dict, Iterable, List
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# A skill must not be glued to surrounding word characters, so 'go' does not
+# match inside 'google' and 'java' does not match inside 'javascript'.
+# Symbols that are part of skill names (c++, c#, node.js) count as glue too.
+_LEFT_BOUNDARY = r'(?<![\w+#])(?<!\w\.)'
+_RIGHT_BOUNDARY = r'(?![\w+#])(?!\.\w)'
+
+
+def normalize_skill(text: str) -> str:
+    """Lowercase and collapse whitespace so dictionary keys compare equal"""
+    return ' '.join(text.lower().split())
+
+
+def _build_trie(terms: Iterable[str]) -> Dict[str, Any]:
+    """Build a character trie; the '' key marks the end of a term"""
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+
+def _escape(char: str) -> str:
+    """Escape one trie edge; spaces match any run of whitespace"""
+    return r'\s+' if char == ' ' else re.escape(char)
+
+
+def _trie_to_pattern(node: Dict[str, Any]) -> str:
+    """
+    Convert a trie node into a regex that never backtracks across siblings
+
+    Every alternation branches on a distinct character, so the regex engine
+    decides which branch to take by looking at a single character.
+    """
+    is_terminal = '' in node
+    branches = []
+    single_chars = []
+
+    for char in sorted(k for k in node if k):
+        child = node[char]
+        if list(child) == ['']:
+            # Leaf edge: collapse siblings into one character class
+            if char == ' ':
+                branches.append(_escape(char))
+            else:
+                single_chars.append(re.escape(char))
+        else:
+            branches.append(_escape(char) + _trie_to_pattern(child))
+
+    if single_chars:
+        if len(single_chars) == 1:
+            branches.append(single_chars[0])
+        else:
+            branches.append('[' + ''.join(single_chars) + ']')
+
+    if not branches:
+        return ''
+
+    if len(branches) == 1 and not is_terminal:
+        return branches[0]
+
+    pattern = '(?:' + '|'.join(branches) + ')'
+    if is_terminal:
+        # Greedy: prefer the longest skill, fall back to the shorter prefix
+        pattern += '?'
+    return pattern
+
+
+class SkillMatcher:
+    """
+    Multi-pattern skill matcher
+
+    Compiles all skill terms into one case-insensitive regex with skill-aware
+    word boundaries. Build it once and share it; matching cost does not grow
+    with the number of skills in the dictionary.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        """
+        Compile the skill dictionary
+
+        Args:
+            skills: Skill terms to match (matched case-insensitively)
+        """
+        self.skills = sorted({normalize_skill(s) for s in skills if s and s.strip()})
+
+        if self.skills:
+            body = _trie_to_pattern(_build_trie(self.skills))
+            self.pattern = re.compile(_LEFT_BOUNDARY + '(' + body + ')' + _RIGHT_BOUNDARY, re.IGNORECASE)
+        else:
+            self.pattern = None
+
+        logger.info(f"SkillMatcher compiled {len(self.skills)} skills")
+
+    def find_all(self, text: str) -> List[str]:
+        """
+        Find every dictionary skill mentioned in text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Normalized skill terms, deduplicated, in order of first appearance
+        """
+        if not text or self.pattern is None:
+            return []
+
+        found = {}
+        for match in self.pattern.finditer(text):
+            found.setdefault(normalize_skill(match.group(1)), None)
+        return list(found)
+
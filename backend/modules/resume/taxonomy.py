@@ -0,0 +1,188 @@
+"""
+Skill Taxonomy Module
+
+Person 2: Resume Extraction - shared skill dictionary
+Single source of truth for skill names, aliases and related skills.
+Used by the extractor (matching), the enricher (related skills) and the
+scoring fallback (keyword hits)
+
+On-disk format (JSON, or a pickle of the same dict for large taxonomies):
+{
+  "nodejs": {"name": "Node.js", "aliases": ["nodejs"], "related": ["Express"]},
+  ...
+}
+"""
+
+from typing import Dict, Any, List, Optional, Iterable
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import json
+import pickle
+import logging
+
+from core.utils import get_setting
+from .skills import SkillMatcher, normalize_skill
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).parent / "data" / "skill_taxonomy.json"
+
+
+class SkillTaxonomy:
+    """
+    Skill Taxonomy
+
+    Maps every alias to a canonical skill ID (one dict lookup per token) and
+    every ID to a single display name, so the same skill is always spelled
+    the same way ("AWS", "Node.js") everywhere downstream.
+    """
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]]):
+        """
+        Initialize taxonomy from entries
+
+        Args:
+            entries: Mapping of skill ID to {"name", "aliases", "related"}
+        """
+        self.entries = entries
+        self.alias_to_id: Dict[str, str] = {}
+
+        for skill_id, entry in entries.items():
+            for alias in [entry['name'], *entry.get('aliases', [])]:
+                key = normalize_skill(alias)
+                if key in self.alias_to_id and self.alias_to_id[key] != skill_id:
+                    logger.warning(f"Alias '{alias}' maps to both {self.alias_to_id[key]} and {skill_id}")
+                    continue
+                self.alias_to_id[key] = skill_id
+
+        self._matcher: Optional[SkillMatcher] = None
+        self._version: Optional[str] = None
+        logger.info(f"SkillTaxonomy loaded {len(entries)} skills, {len(self.alias_to_id)} aliases")
+
+
+    @classmethod
+    def load(cls, path: Path) -> "SkillTaxonomy":
+        """
+        Load taxonomy from a .json or .pkl file
+
+        Args:
+            path: Taxonomy file path
+
+        Returns:
+            SkillTaxonomy instance
+        """
+        path = Path(path)
+        if path.suffix in ('.pkl', '.pickle'):
+            with open(path, 'rb') as f:
+                entries = pickle.load(f)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        return cls(entries)
+
+
+    def save(self, path: Path):
+        """
+        Save taxonomy entries (.pkl for fastest load, anything else as JSON)
+
+        Args:
+            path: Destination file path
+        """
+        path = Path(path)
+        if path.suffix in ('.pkl', '.pickle'):
+            with open(path, 'wb') as f:
+                pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+
+
+    @property
+    def version(self) -> str:
+        """Short content hash of the entries; changes whenever the taxonomy does"""
+        if self._version is None:
+            data = json.dumps(self.entries, sort_keys=True).encode('utf-8')
+            self._version = hashlib.sha256(data).hexdigest()[:16]
+        return self._version
+
+
+    @property
+    def matcher(self) -> SkillMatcher:
+        """Compiled matcher over every alias (built on first use)"""
+        if self._matcher is None:
+            self._matcher = SkillMatcher(self.alias_to_id.keys())
+        return self._matcher
+
+
+    def canonical_id(self, skill: str) -> Optional[str]:
+        """Return the canonical skill ID for a name or alias, or None if unknown"""
+        return self.alias_to_id.get(normalize_skill(skill))
+
+
+    def canonical_name(self, skill: str) -> str:
+        """Return the display name for a name or alias (unknown skills are kept as given)"""
+        skill_id = self.canonical_id(skill)
+        return self.entries[skill_id]['name'] if skill_id else skill.strip()
+
+
+    def related(self, skill: str) -> List[str]:
+        """Return display names of skills commonly used together with skill"""
+        skill_id = self.canonical_id(skill)
+        if not skill_id:
+            return []
+        return [self.canonical_name(s) for s in self.entries[skill_id].get('related', [])]
+
+
+    def find_skill_ids(self, text: str) -> List[str]:
+        """
+        Find skills mentioned in free text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Canonical skill IDs in order of first appearance
+        """
+        found = {}
+        for alias in self.matcher.find_all(text):
+            found.setdefault(self.alias_to_id[alias], None)
+        return list(found)
+
+
+    def find_skills(self, text: str) -> List[str]:
+        """Find skills mentioned in free text, as display names"""
+        return [self.entries[skill_id]['name'] for skill_id in self.find_skill_ids(text)]
+
+
+    def normalize_skills(self, skills: Iterable[str]) -> List[str]:
+        """
+        Canonicalize and deduplicate a list of skill names
+
+        Args:
+            skills: Skill names in any casing or alias form
+
+        Returns:
+            Display names, first occurrence wins
+        """
+        seen = set()
+        normalized = []
+        for skill in skills:
+            if not skill or not skill.strip():
+                continue
+            key = self.canonical_id(skill) or normalize_skill(skill)
+            if key not in seen:
+                seen.add(key)
+                normalized.append(self.canonical_name(skill))
+        return normalized
+
+
+@lru_cache(maxsize=None)
+def get_taxonomy() -> SkillTaxonomy:
+    """
+    Return the process-wide skill taxonomy (loaded on first use)
+
+    Set SKILL_TAXONOMY_PATH to load a custom taxonomy file.
+    """
+    path = get_setting("SKILL_TAXONOMY_PATH", "") or DEFAULT_TAXONOMY_PATH
+    return SkillTaxonomy.load(path)
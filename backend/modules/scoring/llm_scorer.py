@@ -2,6 +2,11 @@
 import random
 import google.generativeai as genai
 
+from modules.resume.taxonomy import get_taxonomy
+
+# Canonical skill IDs counted by the keyword fallback
+FALLBACK_SKILL_IDS = ["python", "django", "rest_api", "artificial_intelligence", "machine_learning", "docker"]
+
 class LLMScorer:
     def __init__(self, api_key=None):
         self.api_key = api_key
@@ -30,10 +35,9 @@ class LLMScorer:
             return None
 
     def fallback_score(self, resume, job_description):
-        resume_text = str(resume).lower()
-        keywords = ["python", "django", "api", "ai", "ml", "docker"]
+        found = set(get_taxonomy().find_skill_ids(str(resume)))
 
-        hits = sum(1 for k in keywords if k in resume_text)
+        hits = sum(1 for k in FALLBACK_SKILL_IDS if k in found)
 
         return {
             "jd_match": min(100, 50 + hits * 5),
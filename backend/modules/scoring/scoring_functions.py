@@ -1,5 +1,13 @@
 # scoring_server.py
+import sys
+from pathlib import Path
+
 from fastapi import FastAPI
+
+# Standalone app (uvicorn scoring_functions:app from this folder): siblings
+# import flat, shared backend modules need the backend root on the path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
 from final_scorer import score_candidates
 
 app = FastAPI()
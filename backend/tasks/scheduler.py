@@ -12,7 +12,10 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
+import asyncio
+import time
 from core.logger import get_logger
+from core.utils import get_setting
 
 logger = get_logger(__name__)
 
@@ -62,14 +65,27 @@ class TaskScheduler:
         TODO: Add your cron jobs
         """
         
-        # Gmail: Check for new resume emails every 15 minutes
+        # Gmail: Check for new resume emails every 15 minutes; with push
+        # notifications on, polling is only a low-frequency safety net
+        if get_setting("GMAIL_PUSH_ENABLED", False):
+            poll_minutes = get_setting("GMAIL_PUSH_FALLBACK_POLL_MINUTES", 60)
+        else:
+            poll_minutes = get_setting("GMAIL_POLL_INTERVAL_MINUTES", 15)
         self.scheduler.add_job(
             self.check_new_resume_emails,
-            IntervalTrigger(minutes=15),
+            IntervalTrigger(minutes=poll_minutes),
             id="check_new_resume_emails",
             name="Check Gmail for New Resumes"
         )
         
+        # Delete completed ingestion jobs past their retention
+        self.scheduler.add_job(
+            self.prune_ingestion_queue,
+            CronTrigger(hour=3, minute=0),
+            id="prune_ingestion_queue",
+            name="Prune Completed Ingestion Jobs"
+        )
+        
         # Example: Run every day at 9 AM
         self.scheduler.add_job(
             self.daily_resume_enrichment,
@@ -111,20 +127,23 @@ class TaskScheduler:
         """
         Periodic job: Check Gmail for new resume emails
         
-        This runs automatically every 15 minutes to:
-        - Check all connected users' Gmail inboxes
+        This runs automatically every 15 minutes (hourly as a fallback when
+        Gmail push notifications are enabled) to:
+        - Check all connected users' Gmail inboxes (concurrently, off the
+          event loop, at most GMAIL_SYNC_MAX_CONCURRENCY at once and never
+          two syncs of one mailbox)
         - Download new resume attachments
         - Process through extraction & enrichment pipeline
         - Save candidates ready for scoring
         
-        Schedule: Every 15 minutes
+        Schedule: GMAIL_POLL_INTERVAL_MINUTES / GMAIL_PUSH_FALLBACK_POLL_MINUTES
         
         Note: In production, you'd fetch all users with gmail_connected=True
         from the database and process each one.
         """
         logger.info("Checking Gmail for new resume emails...")
         try:
-            from modules.resume.gmail_monitor import GmailMonitor
+            from modules.resume.gmail_push import gmail_sync_dispatcher
             
             # TODO: In production, fetch from database:
             # users = db.query(User).filter(User.gmail_connected == True).all()
@@ -136,35 +155,50 @@ class TaskScheduler:
             ]
             
             total_candidates = 0
+            started = time.perf_counter()
             
-            for user in connected_users:
-                try:
-                    user_id = user["user_id"]
-                    logger.info(f"Checking Gmail for user: {user_id}")
-                    
-                    monitor = GmailMonitor(data_dir=f"./data/users/{user_id}")
-                    candidates = monitor.process_new_emails(
-                        user_id=user_id,
-                        use_mock=False
-                    )
-                    
-                    if candidates:
-                        logger.info(f"Found {len(candidates)} new resume(s) for {user_id}")
-                        total_candidates += len(candidates)
-                        
-                        # TODO: Notify user about new candidates
-                        # await notify_user(user_id, candidates)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing Gmail for {user['user_id']}: {e}")
+            # One failing mailbox never affects the others
+            results = await gmail_sync_dispatcher.sync_users(user["user_id"] for user in connected_users)
+            
+            for user_id, candidates in results.items():
+                if isinstance(candidates, Exception):
+                    logger.error(f"Error processing Gmail for {user_id}: {candidates}")
                     continue
+                
+                if candidates:
+                    logger.info(f"Found {len(candidates)} new resume(s) for {user_id}")
+                    total_candidates += len(candidates)
+                    
+                    # TODO: Notify user about new candidates
+                    # await notify_user(user_id, candidates)
             
-            logger.info(f"Gmail check completed. Total new candidates: {total_candidates}")
+            logger.info(f"Gmail check completed for {len(results)} mailbox(es) in "
+                        f"{time.perf_counter() - started:.1f}s. Total new candidates: {total_candidates}")
             
         except Exception as e:
             logger.error(f"Error in check_new_resume_emails: {e}")
     
     
+    async def prune_ingestion_queue(self):
+        """
+        Daily job: Delete completed ingestion jobs
+        
+        Completed jobs are kept INGESTION_COMPLETED_RETENTION_DAYS so their
+        idempotency keys still dedupe re-listed attachments; after that
+        they only grow the queue database.
+        
+        Schedule: Daily at 3 AM
+        """
+        logger.info("Pruning completed ingestion jobs...")
+        try:
+            from modules.resume.job_queue import get_ingestion_queue
+            
+            pruned = await asyncio.to_thread(get_ingestion_queue().prune)
+            logger.info(f"Ingestion queue pruned: {pruned} completed job(s) deleted")
+        except Exception as e:
+            logger.error(f"Error in prune_ingestion_queue: {e}")
+    
+    
     async def daily_resume_enrichment(self):
         """
         Daily job: Enrich pending resumes
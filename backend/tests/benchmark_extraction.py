@@ -0,0 +1,355 @@
+"""
+Benchmark Resume Extraction
+Generates a synthetic resume corpus (TXT, DOCX, PDF) and measures throughput
+and p50/p95/p99 latency of each Person 2 stage: extract, enrich, format
+
+Gemini is disabled so enrichment measures the local rule-based path only.
+Results are written as JSON; pass --baseline to fail on p95 regressions.
+
+Usage:
+    python tests/benchmark_extraction.py --count 3000 --output benchmark.json
+    python tests/benchmark_extraction.py --baseline benchmark.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from xml.sax.saxutils import escape
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.resume.backends import BACKEND_MODULES, load_backend
+from modules.resume.enricher import ResumeEnricher
+from modules.resume.extractor import ResumeExtractor
+from modules.resume.formatter import ResumeFormatter
+from modules.resume.taxonomy import get_taxonomy
+
+
+FORMATS = ['txt', 'docx', 'pdf']
+STAGES = ['extract', 'enrich', 'format']
+
+FIRST_NAMES = ['Dana', 'Arjun', 'Maria', 'Wei', 'Fatima', 'Lucas', 'Priya', 'Omar', 'Sofia', 'Kenji']
+LAST_NAMES = ['Lee', 'Sharma', 'Garcia', 'Chen', 'Khan', 'Silva', 'Patel', 'Haddad', 'Rossi', 'Tanaka']
+TITLES = ['Software Engineer', 'Backend Developer', 'Data Analyst', 'Product Manager',
+          'Frontend Developer', 'DevOps Engineer', 'ML Engineer', 'UX Designer']
+COMPANIES = ['Google', 'Infosys', 'Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries']
+DEGREES = ['B.Tech Computer Science', 'Bachelor of Science', 'Master of Science', 'MBA', 'Ph.D. Physics']
+SCHOOLS = ['IIT Delhi', 'Stanford University', 'University of Toronto', 'NUS', 'TU Munich']
+FILLER = ('Designed and shipped features used by thousands of customers, improved reliability, '
+          'mentored junior engineers and worked closely with product and design teams.')
+
+
+# ============================================================================
+# Synthetic corpus
+# ============================================================================
+
+def make_resume_text(rng: random.Random, index: int, skill_names: List[str]) -> str:
+    """Build one synthetic resume of random length"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}{index}@example.com",
+        f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        "",
+        "SUMMARY",
+        f"{rng.choice(TITLES)} with {rng.randint(1, 15)} years of experience.",
+        "",
+        "SKILLS",
+        ", ".join(rng.sample(skill_names, rng.randint(4, 15))),
+        "",
+        "EXPERIENCE",
+    ]
+    for _ in range(rng.randint(1, 12)):
+        start = rng.randint(2000, 2022)
+        lines.append(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}")
+        lines.append(f"{start}-{start + rng.randint(1, 4)}")
+        lines.extend([FILLER] * rng.randint(1, 6))
+
+    lines += ["", "EDUCATION"]
+    for _ in range(rng.randint(1, 3)):
+        lines.append(rng.choice(DEGREES))
+        lines.append(f"{rng.choice(SCHOOLS)}, {rng.randint(1995, 2022)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_txt(path: Path, text: str):
+    """Write a plain-text resume"""
+    path.write_text(text, encoding='utf-8')
+
+
+def write_docx(path: Path, text: str):
+    """Write a minimal DOCX (one paragraph per line) without python-docx"""
+    paragraphs = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+        for line in text.split("\n")
+    )
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr('[Content_Types].xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>'
+        ))
+        docx.writestr('_rels/.rels', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="word/document.xml" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+            '</Relationships>'
+        ))
+        docx.writestr('word/document.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{paragraphs}</w:body></w:document>'
+        ))
+
+
+def write_pdf(path: Path, text: str, lines_per_page: int = 50):
+    """Write a minimal text-layer PDF (Helvetica, one line per text row)"""
+    lines = text.split("\n")
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    def pdf_string(line: str) -> str:
+        line = line.encode('latin-1', 'replace').decode('latin-1')
+        return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then (page, content) pairs
+    objects = {}
+    page_ids = []
+    for n, page_lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * n, 5 + 2 * n
+        page_ids.append(page_id)
+        stream = "BT /F1 10 Tf 12 TL 50 790 Td " + " ".join(
+            f"({pdf_string(line)}) '" for line in page_lines
+        ) + " ET"
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        objects[content_id] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+    objects[1] = "<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(page_ids)} >>"
+    objects[3] = "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += f"{obj_id} 0 obj\n{objects[obj_id]}\nendobj\n".encode('latin-1')
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for obj_id in sorted(objects):
+        out += f"{offsets[obj_id]:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+
+
+WRITERS = {'txt': write_txt, 'docx': write_docx, 'pdf': write_pdf}
+
+
+def generate_corpus(corpus_dir: Path, count: int, formats: List[str], seed: int = 42) -> List[Path]:
+    """
+    Generate synthetic resumes, cycling through the requested formats
+
+    Args:
+        corpus_dir: Output directory
+        count: Number of resumes
+        formats: Subset of FORMATS
+        seed: Random seed (same seed, same corpus)
+
+    Returns:
+        Paths of generated files
+    """
+    rng = random.Random(seed)
+    skill_names = [entry['name'] for entry in get_taxonomy().entries.values()]
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        fmt = formats[i % len(formats)]
+        path = corpus_dir / f"resume_{i:05d}.{fmt}"
+        WRITERS[fmt](path, make_resume_text(rng, i, skill_names))
+        paths.append(path)
+    return paths
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(timings: List[float], errors: int) -> Dict[str, Any]:
+    """Throughput and latency percentiles (milliseconds) for one stage"""
+    ordered = sorted(timings)
+    total = sum(ordered)
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "total_seconds": round(total, 4),
+        "throughput_per_second": round(len(ordered) / total, 2) if total else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+    }
+
+
+def run_benchmark(count: int = 3000, formats: Optional[List[str]] = None,
+                  seed: int = 42, corpus_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Generate a corpus and time every stage on every document
+
+    Args:
+        count: Number of resumes
+        formats: Formats to generate (default: all)
+        seed: Corpus random seed
+        corpus_dir: Keep the corpus here (default: temporary, deleted)
+
+    Returns:
+        Machine-readable results
+    """
+    formats = formats or FORMATS
+    directory = Path(corpus_dir) if corpus_dir else Path(tempfile.mkdtemp(prefix="resume_bench_"))
+
+    extractor = ResumeExtractor()
+    enricher = ResumeEnricher()
+    enricher.use_gemini = False  # Never call the network from a benchmark
+    formatter = ResumeFormatter()
+
+    timings = {fmt: {stage: [] for stage in STAGES} for fmt in formats}
+    errors = {fmt: {stage: 0 for stage in STAGES} for fmt in formats}
+
+    try:
+        started = time.perf_counter()
+        paths = generate_corpus(directory, count, formats, seed)
+        generate_seconds = time.perf_counter() - started
+
+        for path in paths:
+            fmt = path.suffix[1:]
+            stage_input = str(path)
+            for stage, run in (('extract', extractor.extract_from_file),
+                               ('enrich', enricher.enrich_candidate),
+                               ('format', formatter.finalize_candidate)):
+                t0 = time.perf_counter()
+                try:
+                    stage_input = run(stage_input)
+                except Exception:
+                    stage_input = None
+                elapsed = time.perf_counter() - t0
+                if not stage_input:
+                    # Later stages need this stage's output
+                    errors[fmt][stage] += 1
+                    break
+                timings[fmt][stage].append(elapsed)
+    finally:
+        if not corpus_dir:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    return {
+        "config": {"count": count, "formats": formats, "seed": seed},
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backends": {name: load_backend(name) is not None for name in BACKEND_MODULES},
+        },
+        "generate_seconds": round(generate_seconds, 4),
+        "stages": {
+            stage: summarize(
+                [t for fmt in formats for t in timings[fmt][stage]],
+                sum(errors[fmt][stage] for fmt in formats)
+            )
+            for stage in STAGES
+        },
+        "by_format": {
+            fmt: {stage: summarize(timings[fmt][stage], errors[fmt][stage]) for stage in STAGES}
+            for fmt in formats
+        },
+    }
+
+
+def find_regressions(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare p95 latency per stage and format against a baseline run
+
+    Args:
+        results: run_benchmark() output
+        baseline: Earlier run_benchmark() output
+        tolerance: Allowed slowdown (0.25 = 25% slower)
+
+    Returns:
+        Human-readable regressions (empty if none)
+    """
+    regressions = []
+    for fmt, stages in results["by_format"].items():
+        for stage, summary in stages.items():
+            before = baseline.get("by_format", {}).get(fmt, {}).get(stage, {}).get("p95_ms")
+            if before and summary["count"] and summary["p95_ms"] > before * (1 + tolerance):
+                regressions.append(f"{fmt}/{stage}: p95 {before}ms -> {summary['p95_ms']}ms")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark resume extraction stages")
+    parser.add_argument("--count", type=int, default=3000, help="Number of synthetic resumes")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="Comma-separated: txt,docx,pdf")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--corpus-dir", help="Keep the generated corpus in this directory")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--baseline", help="Earlier JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95 slowdown")
+    args = parser.parse_args()
+
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"Unknown formats: {', '.join(sorted(unknown))}")
+
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: {args.count} resumes ({', '.join(formats)})")
+    print(f"{'='*60}")
+
+    results = run_benchmark(args.count, formats, args.seed, args.corpus_dir)
+
+    for fmt, stages in results["by_format"].items():
+        for stage, s in stages.items():
+            print(f"   {fmt:5s} {stage:8s} n={s['count']:<6d} err={s['errors']:<5d} "
+                  f"{s['throughput_per_second']:>9.1f}/s  p50={s['p50_ms']:.2f}ms  "
+                  f"p95={s['p95_ms']:.2f}ms  p99={s['p99_ms']:.2f}ms")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\n   Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ Regressions beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Shared Test Fixtures
+Monitor stores in pytest's per-test temp directory, so tests never write
+databases or candidates into the tree, and a manual clock for code that
+waits on time
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.integrations.gmail_sync import GmailSyncLedger
+from modules.resume.cache import ExtractionCache
+from modules.resume.candidate_store import CandidateRepository
+from modules.resume.job_queue import IngestionJobQueue
+
+
+class ManualClock:
+    """Clock that only moves when a test advances it"""
+
+    def __init__(self, start: float = 1000.0):
+        self._now = start
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        with self._lock:
+            return self._now
+
+    def advance(self, seconds: float):
+        with self._lock:
+            self._now += seconds
+
+
+def make_monitor_stores(directory: Path) -> dict:
+    """GmailMonitor stores (cache, ledger, queue, repository) in directory"""
+    directory = Path(directory)
+    return {
+        'cache': ExtractionCache(str(directory / "extraction_cache.db")),
+        'ledger': GmailSyncLedger(str(directory / "gmail_sync.db")),
+        'queue': IngestionJobQueue(str(directory / "ingestion_queue.db")),
+        'repository': CandidateRepository(str(directory / "recruitment.db")),
+    }
+
+
+@pytest.fixture
+def monitor_stores(tmp_path):
+    """Fresh GmailMonitor stores for one test"""
+    return make_monitor_stores(tmp_path / "stores")
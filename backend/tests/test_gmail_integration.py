@@ -3,7 +3,11 @@ Test Gmail Integration
 Tests the complete Gmail resume processing flow
 """
 
+import asyncio
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 
 # Add parent directory to path
@@ -11,6 +15,71 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from modules.resume.gmail_monitor import GmailMonitor
 from modules.integrations.gmail import GmailIntegration
+from modules.integrations.gmail_sync import GmailSyncLedger
+from modules.integrations.attachment_store import AttachmentStore
+from modules.integrations.composio_client import ComposioRegistry, ComposioUnavailableError
+from modules.integrations.connection_status import ConnectionStatusCache
+from modules.resume.gmail_push import GmailSyncDispatcher, LocalPushNotifier, decode_push_notification
+from conftest import make_monitor_stores
+
+
+class FakeComposio:
+    """Stand-in Composio client serving canned Gmail tool results"""
+
+    def __init__(self, pages=None, download_delay=0.0, failures=None, bodies=None,
+                 failure_error="429 rate limit exceeded"):
+        self.pages = pages or []  # GMAIL_FETCH_EMAILS result pages, in order
+        self.bodies = bodies or {}  # attachment_id -> file content
+        self.download_delay = download_delay
+        self.failures = dict(failures or {})  # attachment_id -> failures left
+        self.failure_error = failure_error
+        self.calls = []
+        self.tools = self
+        self.active = 0
+        self.max_active = 0  # Most calls running at the same time
+        self._lock = threading.Lock()
+
+    def execute(self, slug, arguments, user_id, **kwargs):
+        with self._lock:
+            self.calls.append((slug, dict(arguments)))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            return self._result(slug, arguments)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _result(self, slug, arguments):
+        if slug == "GMAIL_FETCH_EMAILS":
+            # Each page's nextPageToken names the page after it
+            tokens = {p.get("nextPageToken"): i + 1 for i, p in enumerate(self.pages)}
+            page = tokens[arguments["page_token"]] if arguments.get("page_token") else 0
+            return {"successful": True, "data": self.pages[page]}
+        if slug == "GMAIL_GET_ATTACHMENT":
+            time.sleep(self.download_delay)
+            attachment_id = arguments["attachment_id"]
+            if self.failures.get(attachment_id):
+                self.failures[attachment_id] -= 1
+                return {"successful": False, "error": self.failure_error}
+            path = Path(tempfile.mkdtemp()) / arguments["file_name"]
+            path.write_text(self.bodies.get(attachment_id, f"Resume {attachment_id}"))
+            return {"successful": True, "data": {"file": str(path)}}
+        return {"successful": False, "error": f"unexpected tool {slug}"}
+
+
+def fake_message(message_id: str, timestamp: str, *filenames: str):
+    """GMAIL_FETCH_EMAILS message with resume attachments"""
+    return {
+        "messageId": message_id,
+        "sender": f"{message_id}@example.com",
+        "subject": "Application",
+        "messageTimestamp": timestamp,
+        "attachmentList": [
+            {"filename": name, "attachmentId": f"{message_id}-{i}", "mimeType": "application/pdf"}
+            for i, name in enumerate(filenames)
+        ],
+    }
 
 
 def test_gmail_connection(user_id: str = "test_user_001"):
@@ -19,7 +88,7 @@ def test_gmail_connection(user_id: str = "test_user_001"):
     print(f"TESTING GMAIL CONNECTION FOR: {user_id}")
     print(f"{'='*60}\n")
     
-    gmail = GmailIntegration()
+    gmail = GmailIntegration(store=AttachmentStore(tempfile.mkdtemp()))
     
     try:
         # Try to fetch emails (will fail if not connected)
@@ -49,19 +118,19 @@ def test_gmail_connection(user_id: str = "test_user_001"):
             raise
 
 
-def test_process_resumes(user_id: str = "test_user_001", use_mock: bool = False):
+def test_process_resumes(tmp_path, monitor_stores, user_id: str = "test_user_001", use_mock: bool = False):
     """Test processing resumes from Gmail"""
     print(f"\n{'='*60}")
     print(f"TESTING RESUME PROCESSING FOR: {user_id}")
     print(f"Mode: {'MOCK DATA' if use_mock else 'REAL GMAIL'}")
     print(f"{'='*60}\n")
     
-    # Create user-specific data directory
-    data_dir = f"./data/users/{user_id}"
-    Path(data_dir).mkdir(parents=True, exist_ok=True)
+    # User-specific data directory (outside the tree)
+    data_dir = tmp_path / "data" / "users" / user_id
     
     # Initialize monitor
-    monitor = GmailMonitor(data_dir=data_dir)
+    gmail = GmailIntegration(store=AttachmentStore(str(tmp_path / "attachments")))
+    monitor = GmailMonitor(data_dir=str(data_dir), gmail=gmail, user_id=user_id, **monitor_stores)
     
     # Process emails
     print("📧 Processing Gmail resumes...")
@@ -99,7 +168,396 @@ def test_process_resumes(user_id: str = "test_user_001", use_mock: bool = False)
     return candidates
 
 
-def test_complete_flow(user_id: str = "test_user_001"):
+def test_incremental_sync(monitor_stores):
+    """Test Gmail polls only fetch deltas, follow every page and skip seen messages"""
+    print(f"\n{'='*60}")
+    print(f"TESTING INCREMENTAL GMAIL SYNC")
+    print(f"{'='*60}\n")
+
+    composio = FakeComposio(pages=[
+        {"messages": [fake_message("m3", "2026-01-03T00:00:00Z", "a.pdf", "b.docx", "notes.png")],
+         "nextPageToken": "page-2"},
+        {"messages": [fake_message("m2", "2026-01-02T00:00:00Z", "c.txt"),
+                      fake_message("m1", "2026-01-01T00:00:00Z", "d.pdf")]},
+    ])
+    gmail = GmailIntegration(composio_client=composio, store=AttachmentStore(tempfile.mkdtemp()))
+
+    emails = gmail.list_resume_messages("sync_user", since=1767139200)
+    queries = [args for slug, args in composio.calls]
+    print(f"   Queries: {queries}")
+
+    assert [e['message_id'] for e in emails] == ['m3', 'm2', 'm1']
+    assert [a['filename'] for a in emails[0]['attachments']] == ['a.pdf', 'b.docx']
+    assert queries[0]['query'] == "has:attachment after:1767139140"
+    assert queries[1]['page_token'] == "page-2"
+    assert gmail.last_fetch_complete
+
+    # Ledger: m1 already processed, m2 failed to download and must be retried
+    ledger = GmailSyncLedger(str(Path(tempfile.mkdtemp()) / "sync.db"))
+    ledger.mark_processed("sync_user", ["m1"])
+    assert ledger.processed_ids("sync_user", ['m3', 'm2', 'm1']) == {'m1'}
+
+    monitor = GmailMonitor(data_dir=tempfile.mkdtemp(), **monitor_stores)
+    monitor._record_sync(ledger, "sync_user", emails[:2], retry={'m2'}, complete=True)
+
+    assert ledger.processed_ids("sync_user", ['m3', 'm2']) == {'m3'}
+    # Cursor stays below the message that still needs a retry
+    assert ledger.get_cursor("sync_user") is None
+
+    monitor._record_sync(ledger, "sync_user", emails[1:2], retry=set(), complete=True)
+    assert ledger.get_cursor("sync_user") == emails[1]['timestamp']
+    ledger.advance_cursor("sync_user", 0)  # Never moves backwards
+    assert ledger.get_cursor("sync_user") == emails[1]['timestamp']
+    print(f"\n✅ Incremental sync OK")
+
+
+def test_candidates_saved_per_user(monitor_stores):
+    """Test a shared monitor files each user's candidates under the user it synced"""
+    print(f"\n{'='*60}")
+    print(f"TESTING CANDIDATES PER USER")
+    print(f"{'='*60}\n")
+
+    composio = FakeComposio(
+        pages=[{"messages": [fake_message("m1", "2026-01-01T00:00:00Z", "cv.txt")]}],
+        bodies={"m1-0": "Erin Park\nerin.park@example.com\nSKILLS\nPython\n"}
+    )
+    gmail = GmailIntegration(composio_client=composio, store=AttachmentStore(tempfile.mkdtemp()), rate_limit=0)
+    stores = monitor_stores
+    repository = stores['repository']
+    monitor = GmailMonitor(data_dir=tempfile.mkdtemp(), gmail=gmail, **stores)  # user_id left at "default"
+
+    for user_id in ("hr_a", "hr_b"):
+        candidates = monitor.process_new_emails(user_id)
+        assert [c['name'] for c in candidates] == ["Erin Park"]
+
+    print(f"   Counts: hr_a={repository.count('hr_a')}, hr_b={repository.count('hr_b')}")
+    assert repository.count("hr_a") == 1 and repository.count("hr_b") == 1
+    assert repository.count("default") == 0
+    print(f"\n✅ Candidates per user OK")
+
+
+def test_failed_poll_processes_nothing(monitor_stores):
+    """Test a failed real poll neither falls back to mock data nor records the sync"""
+    print(f"\n{'='*60}")
+    print(f"TESTING FAILED GMAIL POLL")
+    print(f"{'='*60}\n")
+
+    class FailingComposio(FakeComposio):
+        def _result(self, slug, arguments):
+            return {"successful": False, "error": "Invalid credentials"}
+
+    gmail = GmailIntegration(composio_client=FailingComposio(), store=AttachmentStore(tempfile.mkdtemp()),
+                             retry_base_delay=0.01, rate_limit=0)
+    stores = monitor_stores
+    monitor = GmailMonitor(data_dir=tempfile.mkdtemp(), gmail=gmail, **stores)
+
+    assert monitor.process_new_emails("broken_user") == []
+    assert stores['repository'].count("broken_user") == 0
+    assert stores['ledger'].get_cursor("broken_user") is None
+    print(f"\n✅ Failed poll OK")
+
+
+def test_sync_resumes_after_page_limit(monitor_stores):
+    """Test a poll stopped at max_pages is continued by the next poll instead of re-reading page 1"""
+    print(f"\n{'='*60}")
+    print(f"TESTING SYNC PAST THE PAGE LIMIT")
+    print(f"{'='*60}\n")
+
+    composio = FakeComposio(pages=[
+        {"messages": [fake_message("m5", "2026-01-05T00:00:00Z", "a.txt")], "nextPageToken": "page-2"},
+        {"messages": [fake_message("m4", "2026-01-04T00:00:00Z", "b.txt")], "nextPageToken": "page-3"},
+        {"messages": [fake_message("m3", "2026-01-03T00:00:00Z", "c.txt")], "nextPageToken": "page-4"},
+        {"messages": [fake_message("m2", "2026-01-02T00:00:00Z", "d.txt")]},
+    ])
+    gmail = GmailIntegration(composio_client=composio, store=AttachmentStore(tempfile.mkdtemp()), max_pages=2)
+    stores = monitor_stores
+    ledger = stores['ledger']
+    monitor = GmailMonitor(data_dir=tempfile.mkdtemp(), gmail=gmail, user_id="backlog_user", **stores)
+
+    def listed():
+        return [a["page_token"] if "page_token" in a else "first" for slug, a in composio.calls
+                if slug == "GMAIL_FETCH_EMAILS"]
+
+    monitor.process_new_emails("backlog_user")
+    print(f"   Poll 1 pages: {listed()}")
+    assert listed() == ["first", "page-2"]
+    assert ledger.get_next_page("backlog_user")['page_token'] == "page-3"
+    assert ledger.get_cursor("backlog_user") is None
+
+    composio.calls.clear()
+    monitor.process_new_emails("backlog_user")
+    print(f"   Poll 2 pages: {listed()}")
+    # Older messages are reached, with the same query the first poll used
+    assert listed() == ["page-3", "page-4"]
+    assert ledger.processed_ids("backlog_user", ["m5", "m4", "m3", "m2"]) == {"m5", "m4", "m3", "m2"}
+    assert ledger.get_next_page("backlog_user") is None
+    assert ledger.get_cursor("backlog_user") is not None
+    print(f"\n✅ Sync past the page limit OK")
+
+
+def test_concurrent_downloads():
+    """Test attachments download in parallel and transient failures are retried"""
+    print(f"\n{'='*60}")
+    print(f"TESTING CONCURRENT ATTACHMENT DOWNLOADS")
+    print(f"{'='*60}\n")
+
+    messages = [fake_message(f"dl{i}", "2026-01-01T00:00:00Z", f"dl{i}_a.pdf", f"dl{i}_b.txt")
+                for i in range(4)]
+    composio = FakeComposio(pages=[{"messages": messages}], download_delay=0.2,
+                            failures={"dl0-0": 1})
+    gmail = GmailIntegration(composio_client=composio, store=AttachmentStore(tempfile.mkdtemp()),
+                             retry_base_delay=0.01, rate_limit=0)
+
+    emails = gmail.list_resume_messages("download_user")
+    downloaded = gmail.download_attachments("download_user", emails)
+    print(f"   Downloaded {downloaded} attachments, at most {composio.max_active} at once")
+
+    assert downloaded == 8
+    assert all(Path(a['file_path']).exists() for e in emails for a in e['attachments'])
+    # 8 downloads plus one retry, overlapping on the download workers
+    downloads = [args for slug, args in composio.calls if slug == "GMAIL_GET_ATTACHMENT"]
+    assert len(downloads) == 9
+    assert composio.max_active > 1
+    retried = [args for args in downloads if args["attachment_id"] == "dl0-0"]
+    assert len(retried) == 2
+
+    # Digits in the error text (ids, sizes) do not make an error transient
+    composio = FakeComposio(pages=[{"messages": messages[:1]}], failures={"dl0-0": 1},
+                            failure_error="Attachment 500 of 5029 bytes not found")
+    gmail = GmailIntegration(composio_client=composio, store=AttachmentStore(tempfile.mkdtemp()),
+                             retry_base_delay=0.01, rate_limit=0)
+    emails = gmail.list_resume_messages("download_user")
+    assert gmail.download_attachments("download_user", emails) == 1
+    downloads = [args for slug, args in composio.calls if slug == "GMAIL_GET_ATTACHMENT"]
+    assert len(downloads) == 2  # No retry
+    print(f"\n✅ Concurrent downloads OK")
+
+
+def test_attachment_store():
+    """Test attachments are stored by content, not by filename"""
+    print(f"\n{'='*60}")
+    print(f"TESTING CONTENT-ADDRESSED ATTACHMENT STORE")
+    print(f"{'='*60}\n")
+
+    messages = [
+        fake_message("alice", "2026-01-01T00:00:00Z", "Resume.pdf"),
+        fake_message("bob", "2026-01-01T00:00:00Z", "Resume.pdf"),
+        fake_message("carol", "2026-01-01T00:00:00Z", "carol_cv.pdf", "cv_copy.pdf"),
+    ]
+    composio = FakeComposio(pages=[{"messages": messages}], bodies={
+        "alice-0": "Alice Johnson resume",
+        "bob-0": "Bob Williams resume",
+        "carol-0": "Carol Davis resume",
+        "carol-1": "Carol Davis resume",
+    })
+    store = AttachmentStore(tempfile.mkdtemp())
+    gmail = GmailIntegration(composio_client=composio, store=store)
+
+    emails = gmail.list_resume_messages("store_user")
+    gmail.download_attachments("store_user", emails)
+    paths = {a['attachment_id']: a['file_path'] for e in emails for a in e['attachments']}
+    for attachment_id, path in paths.items():
+        print(f"   {attachment_id}: {Path(path).relative_to(store.root)}")
+
+    # Same filename, different bytes: two blobs
+    assert paths['alice-0'] != paths['bob-0']
+    assert Path(paths['alice-0']).read_text() == "Alice Johnson resume"
+    assert Path(paths['bob-0']).read_text() == "Bob Williams resume"
+    # Same bytes, different filenames: one blob
+    assert paths['carol-0'] == paths['carol-1']
+    assert len(list(store.blobs_dir.rglob("*.pdf"))) == 3
+
+    # Known attachments are not downloaded again
+    downloads = len([c for c in composio.calls if c[0] == "GMAIL_GET_ATTACHMENT"])
+    assert gmail.download_attachment("store_user", "bob", emails[1]['attachments'][0]) == paths['bob-0']
+    assert len([c for c in composio.calls if c[0] == "GMAIL_GET_ATTACHMENT"]) == downloads
+    print(f"\n✅ Attachment store OK")
+
+
+def test_composio_registry():
+    """Test one shared Composio client per key, with health tracking"""
+    print(f"\n{'='*60}")
+    print(f"TESTING COMPOSIO CLIENT REGISTRY")
+    print(f"{'='*60}\n")
+
+    created = []
+
+    def factory(api_key):
+        created.append(api_key)
+        if api_key == "bad-key":
+            raise RuntimeError("invalid API key")
+        return FakeComposio()
+
+    registry = ComposioRegistry(factory=factory, retry_after=60, unhealthy_after=2)
+    assert registry.health("key")['status'] == 'not_initialized'
+
+    client = registry.get("key")
+    assert registry.get("key") is client
+    assert created == ["key"]
+    assert registry.health("key")['status'] == 'healthy'
+
+    registry.record_failure("503 Service Unavailable", "key")
+    registry.record_failure("timeout", "key")
+    health = registry.health("key")
+    print(f"   After two failures: {health}")
+    assert health['status'] == 'degraded' and health['consecutive_failures'] == 2
+    registry.record_success("key")
+    assert registry.health("key")['status'] == 'healthy'
+
+    # A failed initialization is not retried until the cool-down passes
+    for _ in range(3):
+        try:
+            registry.get("bad-key")
+            assert False, "expected ComposioUnavailableError"
+        except ComposioUnavailableError as e:
+            assert "invalid API key" in str(e)
+    assert created.count("bad-key") == 1
+    assert registry.health("bad-key")['status'] == 'unavailable'
+    print(f"\n✅ Composio registry OK")
+
+
+def test_connection_status_cache():
+    """Test connection status is served from cache until it expires or is invalidated"""
+    print(f"\n{'='*60}")
+    print(f"TESTING CONNECTION STATUS CACHE")
+    print(f"{'='*60}\n")
+
+    cache = ConnectionStatusCache(ttl=60, negative_ttl=0.05)
+    cache.set("user_a", "gmail", {"connected": True, "service": "gmail"})
+    cache.set("user_a", "sheets", {"connected": False, "service": "sheets"})
+    cache.set("user_a", "calendar", {"connected": False, "error": "Composio timeout"})
+
+    start = time.perf_counter()
+    status = cache.get("user_a", "GMAIL")
+    print(f"   Cached lookup took {(time.perf_counter() - start) * 1e6:.1f}µs")
+    assert status == {"connected": True, "service": "gmail"}
+    status['connected'] = False  # Callers get a copy
+    assert cache.get("user_a", "gmail")['connected']
+
+    # Errors are never cached; "not connected" expires sooner
+    assert cache.get("user_a", "calendar") is None
+    assert cache.get("user_a", "sheets") is not None
+    time.sleep(0.1)
+    assert cache.get("user_a", "sheets") is None
+    assert cache.get("user_a", "gmail") is not None
+
+    # A live probe of the same service is a separate entry
+    assert cache.get("user_a", "gmail", kind="probe") is None
+    cache.set("user_a", "gmail", {"connected": True, "message": "probed"}, kind="probe")
+    assert cache.get("user_a", "gmail", kind="probe")['message'] == "probed"
+    assert "message" not in cache.get("user_a", "gmail")
+
+    cache.invalidate("user_a", "gmail")  # Every kind
+    assert cache.get("user_a", "gmail") is None and cache.get("user_a", "gmail", kind="probe") is None
+    cache.set("user_b", "gmail", {"connected": True})
+    cache.set("user_b", "sheets", {"connected": True})
+    cache.invalidate("user_b")
+    assert cache.get("user_b", "gmail") is None and cache.get("user_b", "sheets") is None
+    print(f"\n✅ Connection status cache OK")
+
+
+def test_push_notifications():
+    """Test push notifications enqueue one coalesced delta sync per user"""
+    print(f"\n{'='*60}")
+    print(f"TESTING GMAIL PUSH NOTIFICATIONS")
+    print(f"{'='*60}\n")
+
+    syncs = []
+
+    def sync(user_id):
+        syncs.append(user_id)
+        time.sleep(0.1)
+        return []
+
+    dispatcher = GmailSyncDispatcher(sync=sync)
+    notifier = LocalPushNotifier(dispatcher)
+
+    envelope = notifier.envelope("hr@example.com", history_id=42)
+    assert decode_push_notification(envelope)['email_address'] == "hr@example.com"
+    assert decode_push_notification(envelope)['history_id'] == 42
+    try:
+        decode_push_notification({"message": {"data": "not base64 json"}})
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    async def burst():
+        assert notifier.notify("user_a", "a@example.com")
+        assert not notifier.notify("user_a", "a@example.com")  # Already queued
+        assert notifier.notify("user_b", "b@example.com")
+        await asyncio.sleep(0.05)
+        # Arrive while user_a's sync runs: one follow-up sync, not three
+        for _ in range(3):
+            assert not notifier.notify("user_a", "a@example.com")
+        await dispatcher.wait_idle()
+
+    asyncio.run(burst())
+    print(f"   Syncs run: {syncs}")
+
+    assert syncs.count("user_a") == 2
+    assert syncs.count("user_b") == 1
+    print(f"\n✅ Push notifications OK")
+
+
+def test_fan_out_polling():
+    """Test a polling tick syncs many mailboxes concurrently, capped, one sync per user"""
+    print(f"\n{'='*60}")
+    print(f"TESTING FAN-OUT GMAIL POLLING")
+    print(f"{'='*60}\n")
+
+    lock = threading.Lock()
+    running = {"total": 0, "peak": 0, "calls": 0}
+    per_user = {}
+    # The first 8 syncs only return once all 8 are running at the same time
+    first_wave = threading.Barrier(8, timeout=10)
+
+    def sync(user_id):
+        with lock:
+            running["total"] += 1
+            running["calls"] += 1
+            running["peak"] = max(running["peak"], running["total"])
+            per_user[user_id] = per_user.get(user_id, 0) + 1
+            assert per_user[user_id] == 1, f"overlapping syncs for {user_id}"
+            in_first_wave = running["calls"] <= 8
+        if in_first_wave:
+            first_wave.wait()
+        else:
+            time.sleep(0.01)
+        with lock:
+            running["total"] -= 1
+            per_user[user_id] -= 1
+        if user_id == "user_7":
+            raise RuntimeError("mailbox unavailable")
+        return [f"candidate-of-{user_id}"]
+
+    dispatcher = GmailSyncDispatcher(sync=sync, max_concurrency=8)
+    users = [f"user_{i}" for i in range(40)]
+
+    async def tick():
+        # A push for user_0 during the tick waits for the poll's sync of user_0
+        poll = asyncio.ensure_future(dispatcher.sync_users(users))
+        await asyncio.sleep(0.01)
+        dispatcher.enqueue("user_0")
+        # A manual check (own sync function) of user_1 also waits its turn
+        manual = await dispatcher.sync_users(["user_1"], sync=lambda user_id: sync(user_id) + ["manual"])
+        assert manual["user_1"] == ["candidate-of-user_1", "manual"]
+        results = await poll
+        await dispatcher.wait_idle()
+        return results
+
+    results = asyncio.run(tick())
+    dispatcher.shutdown()
+    print(f"   Synced {len(results)} mailboxes (peak concurrency {running['peak']})")
+
+    assert len(results) == 40
+    assert isinstance(results["user_7"], RuntimeError)
+    assert results["user_3"] == ["candidate-of-user_3"]
+    assert running["peak"] == 8
+    assert running["calls"] == 42  # 40 polled, the push and the manual check
+    print(f"\n✅ Fan-out polling OK")
+
+
+def test_complete_flow(tmp_path, user_id: str = "test_user_001"):
     """Test the complete Gmail integration flow"""
     print(f"\n{'#'*60}")
     print(f"# COMPLETE GMAIL INTEGRATION TEST")
@@ -116,7 +574,7 @@ def test_complete_flow(user_id: str = "test_user_001"):
     
     # Step 2: Process resumes
     print(f"\n[STEP 2] Processing Resumes...")
-    candidates = test_process_resumes(user_id, use_mock=False)
+    candidates = test_process_resumes(tmp_path, make_monitor_stores(tmp_path / "stores"), user_id, use_mock=False)
     
     # Summary
     print(f"\n{'='*60}")
@@ -137,4 +595,4 @@ if __name__ == "__main__":
         user_id = sys.argv[1]
     
     # Run complete flow
-    test_complete_flow(user_id)
+    test_complete_flow(Path(tempfile.mkdtemp()), user_id)
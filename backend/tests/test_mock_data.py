@@ -3,27 +3,42 @@ Test Mock Data
 Tests the system with mock data (no Gmail connection required)
 """
 
+import json
+import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from functools import partial
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from modules.integrations.attachment_store import AttachmentStore
+from modules.integrations.gmail import GmailIntegration
+from modules.resume.candidate_store import CandidateRepository
+from modules.resume.extractor import ResumeTooLargeError, extract_resume_file
 from modules.resume.gmail_monitor import GmailMonitor
+from modules.resume.ingest import DOWNLOAD, EXTRACT, IngestionPipeline, QueueIngestionPipeline, is_permanent_failure
+from modules.resume.job_queue import DONE, IngestionJobQueue
+from modules.resume.scoring_channel import ScoringChannel
+from conftest import ManualClock, make_monitor_stores
 
 
-def test_with_mock_data():
+def test_with_mock_data(tmp_path, monitor_stores):
     """Test the complete flow with mock data"""
     print(f"\n{'='*60}")
     print(f"TESTING WITH MOCK DATA (No Gmail Required)")
     print(f"{'='*60}\n")
     
-    # Create test data directory
-    data_dir = "./data/users/mock_test_user"
-    Path(data_dir).mkdir(parents=True, exist_ok=True)
+    # Test data directory (outside the tree)
+    data_dir = tmp_path / "data" / "users" / "mock_test_user"
     
     # Initialize monitor
-    monitor = GmailMonitor(data_dir=data_dir)
+    gmail = GmailIntegration(store=AttachmentStore(str(tmp_path / "attachments")))
+    monitor = GmailMonitor(data_dir=str(data_dir), gmail=gmail, user_id="mock_test_user", **monitor_stores)
     
     # Process with mock data
     print("📧 Processing mock resume emails...")
@@ -60,5 +75,281 @@ def test_with_mock_data():
     return candidates
 
 
+def test_multi_attachment_email(monitor_stores):
+    """Test every resume attached to one email becomes a candidate"""
+    print(f"\n{'='*60}")
+    print(f"TESTING MULTI-ATTACHMENT EMAIL")
+    print(f"{'='*60}\n")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    attachments = []
+    for i in range(3):
+        path = temp_dir / f"cv_{i}.txt"
+        path.write_text(f"Agency Candidate {i}\nagency.cv{i}@example.com\nSKILLS\nPython\n")
+        attachments.append({"filename": path.name, "file_path": str(path)})
+
+    email = {"id": "agency_email", "from": "jobs@agency.example", "attachments": attachments}
+    monitor = GmailMonitor(data_dir=str(temp_dir / "data"), **monitor_stores)
+    try:
+        candidates = monitor.handle_resume_email(email)
+        print(f"   Candidates: {[c['name'] for c in candidates]}")
+
+        assert [c['name'] for c in candidates] == [f"Agency Candidate {i}" for i in range(3)]
+        assert candidates[2]['metadata']['source_attachment'] == "cv_2.txt"
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print(f"\n✅ Multi-attachment email OK")
+
+
+def test_ingestion_pipeline_bounds():
+    """Test the pipeline keeps going past failures and never exceeds max_in_flight"""
+    print(f"\n{'='*60}")
+    print(f"TESTING INGESTION PIPELINE")
+    print(f"{'='*60}\n")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def download(job):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        if job == 3:
+            with lock:
+                state["in_flight"] -= 1
+            return None  # Download failed
+        path = temp_dir / f"resume_{job}.txt"
+        path.write_text(f"Pipeline Candidate {job}\npipeline{job}@example.com\n")
+        return str(path)
+
+    def finish(job, extracted):
+        with lock:
+            state["in_flight"] -= 1
+        return extracted
+
+    extract = partial(extract_resume_file, cache_path=str(temp_dir / "cache.db"))
+    pipeline = IngestionPipeline(download=download, extract=extract, finish=finish,
+                                 download_workers=4, extract_workers=2, finish_workers=2, max_in_flight=3)
+    try:
+        outcomes = {outcome.job: outcome for outcome in pipeline.run(range(8))}
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print(f"   Peak in flight: {state['peak']}")
+    assert sorted(outcomes) == list(range(8))
+    assert outcomes[3].error == "download: no result"
+    assert outcomes[5].result['name'] == "Pipeline Candidate 5"
+    assert state["peak"] <= 3
+    print(f"\n✅ Ingestion pipeline OK")
+
+
+def test_durable_job_queue():
+    """Test queued jobs survive a crash, resume at their stage and dead-letter after retries"""
+    print(f"\n{'='*60}")
+    print(f"TESTING DURABLE INGESTION QUEUE")
+    print(f"{'='*60}\n")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    clock = ManualClock()
+    queue = IngestionJobQueue(str(temp_dir / "queue.db"), max_attempts=2,
+                              retry_base_delay=0, lease_seconds=60, clock=clock)
+    downloads = []
+
+    def download(payload):
+        downloads.append(payload['name'])
+        if payload['name'] == "broken":
+            return None  # Download keeps failing
+        if payload['name'] == "notes":
+            path = temp_dir / "notes.xyz"  # Unsupported format: fails the same way every time
+            path.write_text("not a resume")
+            return str(path)
+        path = temp_dir / f"{payload['name']}.txt"
+        path.write_text(f"{payload['name'].title()} Queue\n{payload['name']}@example.com\n")
+        return str(path)
+
+    def finish(payload, extracted):
+        return extracted
+
+    for name in ("alice", "bob", "carol", "broken", "notes"):
+        assert queue.enqueue(f"user:{name}:0", "user", {'name': name})
+    assert not queue.enqueue("user:alice:0", "user", {'name': "alice"})  # Idempotent
+    assert queue.enqueue("other:dave:0", "other_user", {'name': "dave"})
+
+    # A worker crashed after claiming alice: her lease expires, then she is reclaimed
+    stale_alice = queue.claim("download", "user", limit=1)[0]
+    assert stale_alice['payload']['name'] == "alice"
+    # bob was downloaded before a crash: he resumes at extraction
+    bob = queue.claim("download", "user", limit=1)[0]
+    bob['payload']['file_path'] = download(bob['payload'])
+    assert queue.advance(bob, bob['payload']) == EXTRACT
+    # A result of a claim that was already recorded is a no-op
+    assert queue.advance(bob, bob['payload']) is None
+    assert not queue.fail(bob, "late failure")
+    downloads.clear()
+    # alice stays leased (unclaimable) until her lease runs out
+    assert queue.stats("user")["download/leased"] == 1
+    clock.advance(61)
+
+    extract = partial(extract_resume_file, cache_path=str(temp_dir / "cache.db"))
+    pipeline = QueueIngestionPipeline(download=download, extract=extract, finish=finish,
+                                      download_workers=2, extract_workers=2, finish_workers=2)
+    outcomes = {outcome.job['name']: outcome for outcome in pipeline.drain(queue, "user")}
+
+    print(f"   Outcomes: { {name: o.error or o.result['name'] for name, o in outcomes.items()} }")
+    print(f"   Queue: {queue.stats()}")
+
+    assert outcomes["alice"].result['name'] == "Alice Queue"
+    assert outcomes["bob"].result['name'] == "Bob Queue"
+    assert outcomes["broken"].error == "download: no result"
+    assert outcomes["notes"].error.startswith("extract: Unsupported file format")
+    assert "dave" not in outcomes  # Other users' jobs are left alone
+    assert "bob" not in downloads and downloads.count("broken") == 2
+    assert queue.stats("user") == {f"{DONE}/completed": 3, "download/dead": 1, "extract/dead": 1}
+    # Transient failures are retried, permanent ones dead-lettered on the first attempt
+    attempts = {job['payload']['name']: job['attempts'] for job in queue.dead_letters("user")}
+    assert attempts == {"broken": 2, "notes": 1}
+    # Only the known bad-input errors are permanent
+    assert is_permanent_failure(EXTRACT, ResumeTooLargeError("DOCX inflates to 2 GB"))
+    assert not is_permanent_failure(EXTRACT, ValueError("Expecting value: line 1 column 1"))
+    assert not is_permanent_failure(DOWNLOAD, None)
+    # The crashed worker that first claimed alice finishes late: her completed job is untouched
+    assert queue.fail(stale_alice, "download: timed out") is False
+    assert queue.advance(stale_alice, {'name': "alice", 'file_path': "stale"}) is None
+    assert queue.stats("user") == {f"{DONE}/completed": 3, "download/dead": 1, "extract/dead": 1}
+
+    dead = {job['payload']['name']: job for job in queue.dead_letters("user")}
+    assert queue.retry_dead_letter(dead["broken"]['job_id'])
+    assert [job['payload']['name'] for job in queue.dead_letters("user")] == ["notes"]
+
+    # Completed jobs are pruned after the retention, the rest stays
+    assert queue.prune(older_than=3600) == 0
+    clock.advance(3601)
+    assert queue.prune(older_than=3600) == 3
+    assert queue.stats("user") == {"download/ready": 1, "extract/dead": 1}
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    print(f"\n✅ Durable ingestion queue OK")
+
+
+def test_scoring_micro_batches():
+    """Test candidates reach scoring in batches flushed by size or time window"""
+    print(f"\n{'='*60}")
+    print(f"TESTING SCORING MICRO-BATCHES")
+    print(f"{'='*60}\n")
+
+    batches = []
+    calls = []
+
+    def consumer(batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise ConnectionError("scoring service restarting")  # Retried
+        batches.append([candidate['name'] for candidate in batch])
+
+    clock = ManualClock()
+    channel = ScoringChannel(consumer, max_batch=3, max_wait=2.0, clock=clock)
+    for i in range(7):
+        assert channel.put({'name': f"candidate_{i}"})
+
+    def wait_for_batches(count):
+        for _ in range(500):
+            if channel.batches >= count:
+                return
+            time.sleep(0.01)
+
+    # Two full batches go out without waiting for the window
+    wait_for_batches(2)
+    print(f"   Batches after size flushes: {batches}")
+    assert batches == [[f"candidate_{i}" for i in range(3)], [f"candidate_{i}" for i in range(3, 6)]]
+
+    # The straggler waits while the window is open and is sent once it closes
+    clock.advance(1.0)
+    assert channel.batches == 2
+    clock.advance(1.0)
+    wait_for_batches(3)
+    assert batches[2] == ["candidate_6"]
+
+    # close() flushes what is still waiting
+    channel.put({'name': "late"})
+    channel.close()
+    print(f"   Batches: {batches}")
+    assert batches[3] == ["late"]
+    assert channel.sent == 8 and channel.dropped == 0 and calls[0] == 3
+    assert not channel.put({'name': "after_close"}) and channel.dropped == 1
+    print(f"\n✅ Scoring micro-batches OK")
+
+
+def test_candidate_repository(monitor_stores):
+    """Test keyset pagination, projection, filters and backfill of the candidate repository"""
+    print(f"\n{'='*60}")
+    print(f"TESTING CANDIDATE REPOSITORY")
+    print(f"{'='*60}\n")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        # Candidates saved as JSON files before the repository existed
+        legacy_dir = temp_dir / "data" / "users" / "hr_1" / "candidates"
+        legacy_dir.mkdir(parents=True)
+        for i in range(3):
+            path = legacy_dir / f"legacy_{i}.json"
+            path.write_text(json.dumps({'name': f"Legacy {i}", 'email': f"legacy{i}@example.com",
+                                        'skills': ["Python"]}))
+            os.utime(path, (1000 + i, 1000 + i))
+        (temp_dir / "data" / "candidates").mkdir()
+        (temp_dir / "data" / "candidates" / "shared.json").write_text(json.dumps({'name': "Shared"}))
+
+        # Startup imports every user's directory, before any monitor exists
+        repository = CandidateRepository(str(temp_dir / "recruitment.db"))
+        assert repository.backfill_data_dir(temp_dir / "data") == 4
+        assert repository.count("hr_1") == 3 and repository.count("default") == 1
+        assert repository.backfill_data_dir(temp_dir / "data") == 0  # Imported once
+
+        stores = dict(monitor_stores, repository=repository)
+        monitor = GmailMonitor(data_dir=str(temp_dir / "data" / "users" / "hr_1"), user_id="hr_1", **stores)
+
+        for i in range(7):
+            monitor.save_candidate({'name': f"New {i}", 'email': f"New{i}@Example.com",
+                                    'skills': ["Go", "SQL"], 'summary': "x" * 1000})
+        repository.upsert("hr_2", "other", {'name': "Other User", 'email': "new0@example.com"})
+        repository.set_status("hr_1", "legacy_0", "shortlisted")
+
+        # Pages never repeat or skip a candidate, newest first
+        pages, cursor = [], None
+        while True:
+            page, cursor = repository.list(user_id="hr_1", limit=4, cursor=cursor, fields=["name", "skills"])
+            pages.append([c['id'] for c in page])
+            if cursor is None:
+                break
+        names = [candidate_id for page in pages for candidate_id in page]
+        print(f"   Pages: {pages}")
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert names[-3:] == ["legacy_2", "legacy_1", "legacy_0"] and len(set(names)) == 10
+
+        # Projection returns only the requested fields, arrays intact
+        first, _ = repository.list(user_id="hr_1", limit=1, fields=["name", "skills"])
+        assert first == [{'id': "New6_at_Example_com", 'name': "New 6", 'skills': ["Go", "SQL"]}]
+
+        assert [c['name'] for c in repository.list(email="NEW0@example.com")[0]] == ["Other User", "New 0"]
+        assert [c['id'] for c in repository.list(status="shortlisted")[0]] == ["legacy_0"]
+        assert len(monitor.get_processed_candidates()) == 10
+        try:
+            repository.list(fields=["name') --"])
+            assert False, "invalid field accepted"
+        except ValueError:
+            pass
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print(f"\n✅ Candidate repository OK")
+
+
 if __name__ == "__main__":
-    test_with_mock_data()
+
+    def temp_dir():
+        return Path(tempfile.mkdtemp())
+
+    test_with_mock_data(temp_dir(), make_monitor_stores(temp_dir()))
+    test_multi_attachment_email(make_monitor_stores(temp_dir()))
+    test_ingestion_pipeline_bounds()
+    test_durable_job_queue()
+    test_scoring_micro_batches()
+    test_candidate_repository(make_monitor_stores(temp_dir()))
@@ -0,0 +1,496 @@
+"""
+Test Resume Extractor
+Tests field extraction on in-memory resume text (no files or Gmail needed)
+"""
+
+import asyncio
+import builtins
+import io
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.concurrency import BoundedExecutor, OverloadedError
+from modules.resume.backends import BACKEND_MODULES, PDF_BACKENDS, load_backend, resolve_backend, warm_up
+from modules.resume.cache import ExtractionCache
+from modules.resume import extractor as extractor_module
+from modules.resume.extractor import (
+    ResumeExtractor, ResumeTooLargeError, extract_resume_file, pdf_text_quality_ok
+)
+from modules.resume.sections import segment_resume
+from modules.resume.skills import SkillMatcher
+from modules.resume.taxonomy import SkillTaxonomy, get_taxonomy
+
+
+SAMPLE_RESUME = """Dana Lee
+dana.lee@example.com
+(555) 777-8888
+
+SKILLS
+JavaScript, Node.js, C++, Machine
+Learning, Docker
+
+EXPERIENCE
+Backend Developer at Google
+2019-Present
+"""
+
+
+def test_skill_matching():
+    """Test skill matching respects word boundaries"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Skill Matching")
+    print(f"{'='*60}")
+
+    extractor = ResumeExtractor()
+    skills = extractor.extract_skills(SAMPLE_RESUME)
+    print(f"   Skills: {', '.join(skills)}")
+
+    skills_lower = [s.lower() for s in skills]
+    assert 'javascript' in skills_lower
+    assert 'node.js' in skills_lower
+    assert 'c++' in skills_lower
+    assert 'machine learning' in skills_lower
+
+    # Substrings of other words must not match
+    assert 'java' not in skills_lower      # inside "JavaScript"
+    assert 'go' not in skills_lower        # inside "Google"
+
+    print(f"\n✅ Skill matching OK")
+
+
+def test_large_dictionary():
+    """Test matcher compiles and matches a large dictionary"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Large Skill Dictionary")
+    print(f"{'='*60}")
+
+    skills = [f"skill{i}" for i in range(10000)] + ['go', 'golang']
+    matcher = SkillMatcher(skills)
+
+    found = matcher.find_all("Used skill42, skill9999 and Golang; not skill100000.")
+    print(f"   Found: {found}")
+
+    assert found == ['skill42', 'skill9999', 'golang']
+    print(f"\n✅ Large dictionary OK")
+
+
+def test_taxonomy_normalization():
+    """Test aliases and casing resolve to one canonical skill name"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Taxonomy Normalization")
+    print(f"{'='*60}")
+
+    taxonomy = get_taxonomy()
+    skills = taxonomy.normalize_skills(['Aws', 'AWS', 'Node.Js', 'nodejs', 'k8s', 'Kubernetes', 'Leadership'])
+    print(f"   Normalized: {skills}")
+
+    assert skills == ['AWS', 'Node.js', 'Kubernetes', 'Leadership']
+    assert taxonomy.canonical_id('Golang') == 'go'
+    assert 'EC2' in taxonomy.related('aws')
+    print(f"\n✅ Taxonomy normalization OK")
+
+
+def test_extract_many():
+    """Test batch extraction keeps input order and captures per-file errors"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Batch Extraction")
+    print(f"{'='*60}")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    paths = []
+    for i in range(6):
+        path = temp_dir / f"resume_{i}.txt"
+        path.write_text(f"Candidate {i}\ncandidate{i}@example.com\nPython, Docker\n")
+        paths.append(str(path))
+    paths.insert(3, str(temp_dir / "notes.xyz"))  # Unsupported format
+
+    extractor = ResumeExtractor()
+    results = list(extractor.extract_many(paths, workers=2, chunksize=2))
+
+    assert [r['index'] for r in results] == list(range(len(paths)))
+    assert results[3]['error'] and results[3]['candidate'] is None
+    assert results[4]['candidate']['name'] == "Candidate 3"
+    print(f"   Extracted {sum(1 for r in results if r['candidate'])}/{len(paths)} files")
+
+    # Workers use the parent's taxonomy and limits, not the defaults
+    taxonomy = SkillTaxonomy({"docker": {"name": "Docker", "aliases": []}})
+    txt_paths = [p for p in paths if p.endswith(".txt")]
+    custom = ResumeExtractor(taxonomy=taxonomy, cache=ExtractionCache(str(temp_dir / "cache.db")))
+    pooled = list(custom.extract_many(txt_paths, workers=2, chunksize=2))
+    assert [r['candidate']['skills'] for r in pooled] == [['Docker']] * len(txt_paths)
+
+    limited = ResumeExtractor(max_chars=20)  # Skills line is past the budget
+    pooled = list(limited.extract_many(txt_paths, workers=2, chunksize=2))
+    serial = list(limited.extract_many(txt_paths, workers=1))
+    assert [r['candidate']['skills'] for r in pooled] == [[]] * len(txt_paths)
+    assert [r['candidate']['skills'] for r in serial] == [[]] * len(txt_paths)
+    print(f"\n✅ Batch extraction OK")
+
+
+def test_extraction_cache():
+    """Test identical resume bytes are served from the cache"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Extraction Cache")
+    print(f"{'='*60}")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    cache = ExtractionCache(str(temp_dir / "cache.db"))
+    extractor = ResumeExtractor(cache=cache)
+
+    first = temp_dir / "resume.txt"
+    first.write_text(SAMPLE_RESUME)
+    forwarded = temp_dir / "Fwd_resume.txt"
+    forwarded.write_text(SAMPLE_RESUME)
+
+    original = extractor.extract_from_file(str(first))
+
+    # Same bytes under another name must not be parsed again
+    extractor._extract_source = lambda source, ext: (_ for _ in ()).throw(AssertionError("re-parsed"))
+    cached = extractor.extract_from_file(str(forwarded))
+
+    assert cached == original
+    print(f"   Cache hit for: {cached['name']}")
+
+    # An edited taxonomy changes the key, so stale skills are not served
+    entries = dict(get_taxonomy().entries, dana={"name": "Dana", "aliases": []})
+    retaxonomized = ResumeExtractor(taxonomy=SkillTaxonomy(entries), cache=cache)
+    assert retaxonomized.cache_version != extractor.cache_version
+    # A miss reads the file once: the buffer that was hashed is the one parsed
+    opened = []
+    real_open = builtins.open
+    def counting_open(file, *args, **kwargs):
+        if str(file) == str(forwarded):
+            opened.append(file)
+        return real_open(file, *args, **kwargs)
+    builtins.open = counting_open
+    try:
+        assert "Dana" in retaxonomized.extract_from_file(str(forwarded))['skills']
+    finally:
+        builtins.open = real_open
+    assert len(opened) == 1
+
+    # Over budget: least recently used entries go first
+    small = ExtractionCache(str(temp_dir / "small.db"), max_bytes=150)
+    for key in ("a", "b", "c"):
+        small.put(key, "v", {"text": "x" * 30})
+    small.get("a", "v")
+    small.put("d", "v", {"text": "x" * 30})
+    assert small.get("b", "v") is None and small.get("a", "v") is not None
+    print(f"\n✅ Extraction cache OK")
+
+
+def test_pdf_page_budget():
+    """Test PDF extraction stops reading pages once the budget is spent"""
+    print(f"\n{'='*60}")
+    print(f"TEST: PDF Page Budget")
+    print(f"{'='*60}")
+
+    pages_read = []
+
+    def fake_pages(file_path, max_pages=None, backend=None):
+        # Stand-in for an 80-page portfolio PDF
+        for i in range(80):
+            if max_pages and i >= max_pages:
+                return
+            pages_read.append(i)
+            yield f"Page {i:02d} " + "x" * 991
+
+    extractor = ResumeExtractor()
+    extractor.iter_pdf_pages = fake_pages
+
+    text = extractor.extract_text_from_pdf("portfolio.pdf", max_pages=50, max_chars=5000)
+    print(f"   Pages read: {len(pages_read)}, characters: {len(text)}")
+
+    assert len(pages_read) == 5
+    assert len(text) == 5000
+
+    def slow_pages(file_path, max_pages=None, backend=None):
+        yield "Page 1"
+        time.sleep(30)  # A pathological page
+        yield "Page 2"
+
+    extractor = ResumeExtractor(time_budget=0.2)
+    extractor.iter_pdf_pages = slow_pages
+    text = extractor.extract_text_from_pdf("slow.pdf")
+    assert text == "Page 1\n"  # Interrupted mid-page, earlier pages kept
+    print(f"\n✅ PDF page budget OK")
+
+
+def test_section_segmentation():
+    """Test resume is split into typed sections in one pass"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Section Segmentation")
+    print(f"{'='*60}")
+
+    text = SAMPLE_RESUME + """
+Education & Certifications
+B.Tech Computer Science
+IIT Delhi
+Projects: Resume parser
+"""
+    sections = segment_resume(text)
+    print(f"   Sections: {list(sections.sections)}")
+
+    assert list(sections.sections) == ['header', 'skills', 'experience', 'education', 'projects']
+    assert sections.header[0] == "Dana Lee"
+    assert sections.get('projects')[0] == "Resume parser"
+    assert sections.sections['education'].start == text.split('\n').index("B.Tech Computer Science")
+
+    # Experience stops at the next heading, not at any line mentioning "skills"
+    experience = ResumeExtractor().extract_experience(text, sections)
+    assert [e['title'] for e in experience] == ["Backend Developer at Google"]
+    print(f"\n✅ Section segmentation OK")
+
+
+def test_contact_fields():
+    """Test email, phone and year extraction with the shared patterns"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Contact Fields")
+    print(f"{'='*60}")
+
+    extractor = ResumeExtractor()
+    fields = extractor.extract_fields(SAMPLE_RESUME)
+    print(f"   Email: {fields['email']}, Phone: {fields['phone']}")
+
+    assert fields['email'] == "dana.lee@example.com"
+    assert fields['phone'] == "(555) 777-8888"
+    assert extractor.extract_phone("Mobile: +91 9876543210") == "9876543210"
+    # Two numbers: the format precedence decides, not the position
+    assert extractor.extract_phone("Office: 555-123-4567\nMobile: 5559876543") == "5559876543"
+    assert extractor._extract_year("B.Tech, 2016-2020") == "2016"
+    print(f"\n✅ Contact fields OK")
+
+
+def test_bounded_executor():
+    """Test offloaded extraction and 429-style rejection when the queue is full"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Bounded Executor")
+    print(f"{'='*60}")
+
+    resume = Path(tempfile.mkdtemp()) / "resume.txt"
+    resume.write_text(SAMPLE_RESUME)
+    executor = BoundedExecutor(max_concurrency=1, max_queue=1, process_workers=1, thread_workers=1)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def hold():
+            async with executor.slot():
+                await release.wait()
+
+        running = asyncio.create_task(hold())
+        queued = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        assert executor.pending == 2
+
+        # Running + queued are at capacity: reject instead of waiting
+        try:
+            async with executor.slot():
+                raise AssertionError("admitted past capacity")
+        except OverloadedError as e:
+            print(f"   Rejected: {e}")
+
+        release.set()
+        await asyncio.gather(running, queued)
+
+        async with executor.slot():
+            return await executor.run_in_process(extract_resume_file, str(resume), str(resume.parent / "cache.db"))
+
+    try:
+        candidate = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert candidate['name'] == "Dana Lee"
+    assert executor.pending == 0
+    print(f"\n✅ Bounded executor OK")
+
+
+def test_extract_from_bytes():
+    """Test uploads are extracted from memory and share the cache with files"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Extract From Bytes")
+    print(f"{'='*60}")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    extractor = ResumeExtractor(cache=ExtractionCache(str(temp_dir / "cache.db")))
+    data = SAMPLE_RESUME.encode('utf-8')
+
+    from_bytes = extractor.extract_from_bytes(data, "resume.txt")
+    assert from_bytes['name'] == "Dana Lee"
+
+    # Same content as a memoryview, a stream or a file on disk hits the cache
+    extractor._extract_source = lambda source, ext: (_ for _ in ()).throw(AssertionError("re-parsed"))
+    assert extractor.extract_from_bytes(memoryview(data), "resume.txt") == from_bytes
+    assert extractor.extract_from_bytes(io.BytesIO(data), "resume.txt") == from_bytes
+    (temp_dir / "resume.txt").write_bytes(data)
+    assert extractor.extract_from_file(str(temp_dir / "resume.txt")) == from_bytes
+
+    try:
+        extractor.extract_from_bytes(data, "resume.xyz")
+        raise AssertionError("unsupported format accepted")
+    except ValueError:
+        pass
+
+    print(f"   Extracted from memory: {from_bytes['name']}")
+    print(f"\n✅ Extract from bytes OK")
+
+
+def test_parser_backends():
+    """Test parser backends are resolved once and reused"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Parser Backend Registry")
+    print(f"{'='*60}")
+
+    load_backend.cache_clear()
+    available = warm_up()
+    print(f"   Available: {available}")
+    assert set(available) == set(BACKEND_MODULES)
+
+    # Later lookups (including failed imports) never import again
+    for _ in range(3):
+        resolve_backend(PDF_BACKENDS)
+        ResumeExtractor().extract_text_from_docx(b"not a docx")
+    assert load_backend.cache_info().misses == len(BACKEND_MODULES)
+    print(f"\n✅ Parser backend registry OK")
+
+
+def test_adaptive_pdf_backend():
+    """Test PDF extraction escalates from the fast backend only on bad text"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Adaptive PDF Backend")
+    print(f"{'='*60}")
+
+    assert pdf_text_quality_ok(["Dana Lee", "Skills: Python"])
+    assert not pdf_text_quality_ok(["", "", "Dana Lee"])                 # Mostly empty pages
+    assert not pdf_text_quality_ok(["(cid:3)(cid:4)(cid:5) Dana Lee"])   # Unmapped glyphs
+
+    fast_output = {"text": SAMPLE_RESUME}
+    calls = []
+
+    def fake_pages(file_path, max_pages=None, backend=None):
+        calls.append(backend)
+        yield fast_output["text"] if backend == 'pypdf2' else SAMPLE_RESUME
+
+    extractor = ResumeExtractor()
+    extractor.iter_pdf_pages = fake_pages
+    original_load = extractor_module.load_backend
+    extractor_module.load_backend = lambda name: object()  # Pretend both are installed
+    try:
+        text, backend = extractor.extract_pdf_adaptive(b"%PDF")
+        assert backend == 'pypdf2' and calls == ['pypdf2']
+
+        calls.clear()
+        fast_output["text"] = "(cid:1)(cid:2)(cid:3)\ufffd\ufffd"
+        text, backend = extractor.extract_pdf_adaptive(b"%PDF")
+        assert backend == 'pdfplumber' and calls == ['pypdf2', 'pdfplumber']
+        assert text.startswith("Dana Lee")
+
+        candidate = extractor.extract_from_bytes(b"%PDF", "resume.pdf")
+        assert candidate['metadata']['pdf_backend'] == 'pdfplumber'
+    finally:
+        extractor_module.load_backend = original_load
+
+    print(f"   Backends tried: {calls}")
+    print(f"\n✅ Adaptive PDF backend OK")
+
+
+def test_size_guards():
+    """Test oversized resumes and DOCX zip bombs are rejected cheaply"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Size Guards")
+    print(f"{'='*60}")
+
+    extractor = ResumeExtractor(max_bytes=1024, max_chars=50)
+    try:
+        extractor.extract_from_bytes(b"x" * 2000, "huge.txt")
+        raise AssertionError("oversized resume accepted")
+    except ResumeTooLargeError as e:
+        print(f"   Rejected: {e}")
+
+    # Under the size limit, text is still capped at the character budget
+    assert len(extractor.extract_text_from_txt("é".encode('utf-8') * 500)) == 50
+
+    bomb = io.BytesIO()
+    with zipfile.ZipFile(bomb, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('word/document.xml', b"\0" * (4 * 1024 * 1024))
+    print(f"   Zip bomb: {len(bomb.getvalue())} bytes compressed")
+    try:
+        extractor.extract_from_bytes(bomb.getvalue(), "bomb.docx")
+        raise AssertionError("zip bomb accepted")
+    except ResumeTooLargeError as e:
+        print(f"   Rejected: {e}")
+    print(f"\n✅ Size guards OK")
+
+
+def _docx_part(root: str, body: str) -> str:
+    """WordprocessingML part with one root element"""
+    return (f'<w:{root} xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'{body}</w:{root}>')
+
+
+def _paragraph(text: str) -> str:
+    return f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+
+
+def test_streaming_docx():
+    """Test DOCX text includes headers, tables and text boxes, in document order"""
+    print(f"\n{'='*60}")
+    print(f"TEST: Streaming DOCX Reader")
+    print(f"{'='*60}")
+
+    cell = lambda text: f'<w:tc>{_paragraph(text)}</w:tc>'
+    body = (
+        _paragraph("SKILLS") +
+        f'<w:tbl><w:tr>{cell("Languages")}{cell("Python, Go")}</w:tr>'
+        f'<w:tr>{cell("Tools")}{cell("Docker, Kubernetes")}</w:tr></w:tbl>' +
+        _paragraph("EXPERIENCE") +
+        # Text box in the middle of a paragraph
+        '<w:p><w:r><w:t>Backend Developer</w:t></w:r>'
+        f'<w:r><w:txbxContent>{_paragraph("Remote")}</w:txbxContent></w:r>'
+        '<w:r><w:t xml:space="preserve"> at Google</w:t></w:r></w:p>'
+    )
+    header = _paragraph("Dana Lee") + _paragraph("dana.lee@example.com")
+
+    docx = io.BytesIO()
+    with zipfile.ZipFile(docx, 'w') as archive:
+        archive.writestr('word/document.xml', _docx_part('document', f'<w:body>{body}</w:body>'))
+        archive.writestr('word/header1.xml', _docx_part('hdr', header))
+        archive.writestr('word/header2.xml', _docx_part('hdr', header))  # Same header, other section
+
+    extractor = ResumeExtractor()
+    text = extractor.extract_text_from_docx(docx.getvalue())
+    print(f"   Text: {text!r}")
+    assert text.split('\n') == [
+        "Dana Lee", "dana.lee@example.com", "SKILLS",
+        "Languages | Python, Go", "Tools | Docker, Kubernetes",
+        "EXPERIENCE", "Remote", "Backend Developer at Google",
+    ]
+
+    candidate = extractor.extract_from_bytes(docx.getvalue(), "resume.docx")
+    assert candidate['name'] == "Dana Lee"
+    assert {'Python', 'Go', 'Docker', 'Kubernetes'} <= set(candidate['skills'])
+    print(f"\n✅ Streaming DOCX reader OK")
+
+
+if __name__ == "__main__":
+    test_skill_matching()
+    test_large_dictionary()
+    test_taxonomy_normalization()
+    test_extract_many()
+    test_extraction_cache()
+    test_pdf_page_budget()
+    test_section_segmentation()
+    test_contact_fields()
+    test_bounded_executor()
+    test_extract_from_bytes()
+    test_parser_backends()
+    test_adaptive_pdf_backend()
+    test_size_guards()
+    test_streaming_docx()